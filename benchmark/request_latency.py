@@ -0,0 +1,50 @@
+"""Measures the request latency of the PearyClient transport profiles.
+
+Times sequential keep-alive requests through a PearyClient connected to a
+local MockPearyServer for every transport profile, i.e.
+
+    PYTHONPATH=src python benchmark/request_latency.py --count 2000
+
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import time
+
+from peary.peary_client import PearyClient
+from peary.peary_mock_server import MockPearyServer
+from peary.peary_transport_options import TransportOptions
+
+PROFILES = {
+    "default": TransportOptions(),
+    "low latency": PearyClient.LOW_LATENCY,
+    "bulk throughput": PearyClient.BULK_THROUGHPUT,
+    "long lived": PearyClient.LONG_LIVED,
+}
+
+
+def main() -> None:
+    """Runs the request latency benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=1000, help="requests per run")
+    args = parser.parse_args()
+
+    with MockPearyServer() as server:
+        for name, options in PROFILES.items():
+            with PearyClient(*server.address, transport_options=options) as proxy:
+                latencies = []
+                for _ in range(args.count):
+                    start = time.perf_counter()
+                    proxy.keep_alive()
+                    latencies.append(time.perf_counter() - start)
+            print(  # noqa: T201
+                f"{name:>16}: request median "
+                f"{statistics.median(latencies) * 1e6:8.1f} us, p99 "
+                f"{statistics.quantiles(latencies, n=100)[-1] * 1e6:8.1f} us"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,168 @@
+"""Stresses the protocol under injected network faults.
+
+Every fault profile is run for a fixed duration against a local MockPearyServer
+behind a FaultInjectingProxy, once with sequential requests and once with
+pipelined batches. The throughput, the median latency of a request or batch and
+the failures by type are reported, i.e.
+
+    PYTHONPATH=src python benchmark/stress.py --duration 5 --timeout 1
+
+A session that fails is closed and a new one is connected, as an application
+would reconnect; the failures are counted per request or batch.
+
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import sys
+import time
+from collections import Counter
+from typing import TYPE_CHECKING, NamedTuple
+
+from peary import peary_fault_proxy
+from peary.peary_client import PearyClient
+from peary.peary_fault_proxy import FaultInjectingProxy, FaultProfile
+from peary.peary_mock_server import MockPearyServer
+from peary.peary_protocol import PearyProtocol
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from peary.peary_device import PearyDevice
+
+BATCH = 50  # requests per pipelined batch
+CONFIGURE_EVERY = 100  # requests between reconfigurations of the device
+
+PROFILES: dict[str, FaultProfile] = {
+    "none": FaultProfile(),
+    "lan": peary_fault_proxy.LAN,
+    "wan": peary_fault_proxy.WAN,
+    "jitter": peary_fault_proxy.JITTER,
+    "split_segments": peary_fault_proxy.SPLIT_SEGMENTS,
+    "coalesced_frames": peary_fault_proxy.COALESCED_FRAMES,
+    "dropped_connections": peary_fault_proxy.DROPPED_CONNECTIONS,
+    "slow_configure": peary_fault_proxy.SLOW_CONFIGURE,
+}
+
+FAILURES = (
+    OSError,
+    PearyProtocol.ResponseReceiveError,
+    PearyProtocol.ResponseSequenceError,
+    PearyProtocol.RequestSendError,
+)
+
+
+class Outcome(NamedTuple):
+    """Requests completed under a fault profile and the failures on the way."""
+
+    completed: int
+    latencies: list[float]
+    failures: Counter[str]
+    elapsed: float
+
+
+def sequential(device: PearyDevice, count: int) -> int:
+    """Sends a request and waits for its response, reconfiguring regularly."""
+    if count % CONFIGURE_EVERY == 0:
+        device.configure()
+    device.get_voltage("PWR_OUT_1")
+    return 1
+
+
+def pipelined(device: PearyDevice, count: int) -> int:
+    """Sends a pipelined batch of requests, leading with a reconfiguration regularly."""
+    requests = [("device.get_voltage", str(device.index), "PWR_OUT_1")] * BATCH
+    if count % CONFIGURE_EVERY == 0:
+        requests.insert(0, ("device.configure", str(device.index)))
+    device.protocol.request_many(requests)
+    return BATCH
+
+
+MODES: dict[str, Callable[[PearyDevice, int], int]] = {
+    "sequential": sequential,
+    "pipelined": pipelined,
+}
+
+
+def stress(
+    profile: FaultProfile,
+    mode: Callable[[PearyDevice, int], int],
+    duration: float,
+    timeout: float,
+    seed: int | None,
+) -> Outcome:
+    """Runs a workload under a fault profile.
+
+    Args:
+        profile: The injected faults.
+        mode: Sends a request or batch given the number of completed requests, and
+            returns the number of requests sent.
+        duration: Seconds the workload is run for.
+        timeout: Seconds the client waits for each response.
+        seed: Seed of the injected faults.
+
+    Returns:
+        Outcome: The completed requests, their latencies and the failures.
+
+    """
+    completed, latencies = 0, []
+    failures: Counter[str] = Counter()
+    with (
+        MockPearyServer() as server,
+        FaultInjectingProxy(server.address, profile, seed=seed) as proxy,
+    ):
+        start = time.perf_counter()
+        end = start + duration
+        while time.perf_counter() < end:  # pylint: disable=while-used
+            try:
+                with PearyClient(*proxy.address, timeout=timeout) as client:
+                    device = client.add_device("SpacelyCaribouBasic")
+                    while (sent := time.perf_counter()) < end:
+                        completed += mode(device, completed)
+                        latencies.append(time.perf_counter() - sent)
+            except FAILURES as e:
+                failures[type(e).__name__] += 1
+        elapsed = time.perf_counter() - start
+    return Outcome(completed, latencies, failures, elapsed)
+
+
+def main() -> int:
+    """Runs the stress suite.
+
+    Returns:
+        int: The exit status.
+
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--only", action="append", choices=[*PROFILES], help="run a profile only"
+    )
+    parser.add_argument(
+        "--duration", type=float, default=2, help="seconds per profile and mode"
+    )
+    parser.add_argument(
+        "--timeout", type=float, default=1, help="seconds waited for each response"
+    )
+    parser.add_argument("--seed", type=int, default=0, help="seed of the faults")
+    args = parser.parse_args()
+
+    for name in args.only or PROFILES:
+        for mode, workload in MODES.items():
+            outcome = stress(
+                PROFILES[name], workload, args.duration, args.timeout, args.seed
+            )
+            latency = statistics.median(outcome.latencies or [0]) * 1e3
+            failures = ", ".join(
+                f"{failure} {count}" for failure, count in outcome.failures.items()
+            )
+            print(  # noqa: T201
+                f"{name:>19} {mode:>10}: {outcome.completed / outcome.elapsed:10.1f} "
+                f"req/s, median {latency:8.2f} ms, failures: {failures or 'none'}"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
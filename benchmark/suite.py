@@ -0,0 +1,227 @@
+"""Runs the benchmark suite of the protocol and device hot paths.
+
+Every benchmark is repeated and the median time per operation is reported. The
+results can be saved as a JSON baseline, and later runs compared against it to
+flag benchmarks that slowed down by more than a threshold, i.e.
+
+    PYTHONPATH=src python benchmark/suite.py --save baseline.json
+    PYTHONPATH=src python benchmark/suite.py --compare baseline.json
+
+The network benchmarks run against a local MockPearyServer; the board bring-up
+is measured with latency injected into every response.
+
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import statistics
+import sys
+import time
+from contextlib import ExitStack
+from pathlib import Path
+from typing import TYPE_CHECKING, NamedTuple
+
+from caribou.caribou_board import CaribouBoard
+from peary.peary_client import PearyClient
+from peary.peary_frame import FrameDecoder, FrameEncoder
+from peary.peary_mock import MockPearyModel
+from peary.peary_mock_server import MockPearyServer
+from peary.peary_protocol import PearyProtocol
+from peary.peary_transport import LoopbackTransport
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from peary.peary_proxy import PearyProxy
+
+PAYLOAD = b"device.set_voltage 0 PWR_OUT_1 1.2"
+BRINGUP_LATENCY = 0.0005  # seconds injected into every response of the bring-up
+
+
+class Workload(NamedTuple):
+    """Callable timed by a benchmark and the number of operations per call."""
+
+    run: Callable[[], object]
+    operations: int
+
+
+def _connect(stack: ExitStack, model: MockPearyModel | None = None) -> PearyProxy:
+    """Connects a client to a mock peary server closed with the exit stack."""
+    server = stack.enter_context(MockPearyServer(model))
+    return stack.enter_context(PearyClient(*server.address))
+
+
+def encode(_: ExitStack) -> Workload:
+    """Encodes request frames."""
+    return Workload(
+        lambda: [FrameEncoder.encode(PAYLOAD, tag, 0) for tag in range(1000)], 1000
+    )
+
+
+def decode(_: ExitStack) -> Workload:
+    """Decodes response frames."""
+    frame = FrameEncoder.encode(PAYLOAD, 1, 0)
+    return Workload(lambda: [FrameDecoder.decode(frame) for _ in range(1000)], 1000)
+
+
+def request_latency(stack: ExitStack) -> Workload:
+    """Sends sequential requests, each waiting for its response."""
+    proxy = _connect(stack)
+    return Workload(lambda: [proxy.keep_alive() for _ in range(200)], 200)
+
+
+def pipelined_throughput(stack: ExitStack) -> Workload:
+    """Sends a pipelined batch of device requests."""
+    protocol = _connect(stack).add_device("SpacelyCaribouBasic").protocol
+    batch = [("device.get_voltage", "0", "PWR_OUT_1")] * 1000
+    return Workload(lambda: protocol.request_many(batch), len(batch))
+
+
+def board_construction(stack: ExitStack) -> Workload:
+    """Constructs CaribouBoard devices over the in-memory loopback transport."""
+    proxy = stack.enter_context(
+        PearyClient(transport=LoopbackTransport(MockPearyModel()))
+    )
+    device = proxy.add_device("SpacelyCaribouBasic")
+    return Workload(
+        lambda: [CaribouBoard(device.index, device.protocol) for _ in range(100)], 100
+    )
+
+
+def board_bringup(stack: ExitStack) -> Workload:
+    """Brings up a CaribouBoard against a server with injected latency."""
+    proxy = _connect(stack, MockPearyModel(latency=BRINGUP_LATENCY))
+
+    def _bringup() -> None:
+        proxy.clear_devices()
+        board = proxy.add_device("SpacelyCaribouBasic", CaribouBoard)
+        board.set_logic_level(1.8)
+        for name, voltage in [
+            (CaribouBoard.PWR_OUT_1, 1.2),
+            (CaribouBoard.PWR_OUT_2, 1.0),
+            (CaribouBoard.PWR_OUT_3, 1.8),
+        ]:
+            board.power_supply(name).set_voltage(voltage)
+            board.power_supply(name).switch_on()
+        board.voltage_bias(CaribouBoard.VBIAS_1).set_voltage(0.4)
+        board.voltage_bias(CaribouBoard.VBIAS_1).switch_on()
+        board.current_bias(CaribouBoard.IBIAS_1).set_current(0.001)
+        board.current_bias(CaribouBoard.IBIAS_1).switch_on()
+
+    return Workload(_bringup, 1)
+
+
+BENCHMARKS: dict[str, Callable[[ExitStack], Workload]] = {
+    "encode": encode,
+    "decode": decode,
+    "request_latency": request_latency,
+    "pipelined_throughput": pipelined_throughput,
+    "board_construction": board_construction,
+    "board_bringup": board_bringup,
+}
+
+
+def measure(benchmark: Callable[[ExitStack], Workload], repeat: int) -> dict:
+    """Times a benchmark.
+
+    Args:
+        benchmark: Sets up the workload of the benchmark.
+        repeat: Number of timed runs after a warm-up run.
+
+    Returns:
+        dict: The median and minimum seconds per operation.
+
+    """
+    with ExitStack() as stack:
+        workload = benchmark(stack)
+        workload.run()
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            workload.run()
+            timings.append((time.perf_counter() - start) / workload.operations)
+    return {"median": statistics.median(timings), "min": min(timings)}
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> list[str]:
+    """Prints the change of each benchmark relative to a baseline.
+
+    Args:
+        results: The median and minimum seconds per operation by benchmark.
+        baseline: The results of a previous run.
+        threshold: Relative slowdown of the median flagged as a regression.
+
+    Returns:
+        list: The names of the regressed benchmarks.
+
+    """
+    regressions = []
+    for name, result in results.items():
+        if name not in baseline:
+            print(f"{name:>22}: no baseline")  # noqa: T201
+            continue
+        change = result["median"] / baseline[name]["median"] - 1
+        flag = ""
+        if change > threshold:
+            regressions.append(name)
+            flag = "  REGRESSION"
+        print(  # noqa: T201
+            f"{name:>22}: {baseline[name]['median'] * 1e6:10.2f} us -> "
+            f"{result['median'] * 1e6:10.2f} us {change:+8.1%}{flag}"
+        )
+    return regressions
+
+
+def main() -> int:
+    """Runs the benchmark suite.
+
+    Returns:
+        int: The exit status, non-zero if a benchmark regressed.
+
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--only", action="append", choices=[*BENCHMARKS], help="run a benchmark only"
+    )
+    parser.add_argument("--repeat", type=int, default=7, help="timed runs")
+    parser.add_argument("--save", type=Path, help="write the results as a baseline")
+    parser.add_argument("--compare", type=Path, help="baseline to compare against")
+    parser.add_argument(
+        "--threshold", type=float, default=0.1, help="flagged slowdown, e.g. 0.1"
+    )
+    args = parser.parse_args()
+
+    results = {}
+    for name in args.only or BENCHMARKS:
+        results[name] = measure(BENCHMARKS[name], args.repeat)
+        print(  # noqa: T201
+            f"{name:>22}: median {results[name]['median'] * 1e6:10.2f} us/op, "
+            f"min {results[name]['min'] * 1e6:10.2f} us/op"
+        )
+
+    if args.save:
+        args.save.write_text(
+            json.dumps(
+                {
+                    "python": platform.python_version(),
+                    "platform": platform.platform(),
+                    "version": PearyProtocol.VERSION.decode(),
+                    "results": results,
+                },
+                indent=2,
+            )
+            + "\n"
+        )
+    if args.compare:
+        baseline = json.loads(args.compare.read_text())["results"]
+        if regressions := compare(results, baseline, args.threshold):
+            print(f"Regressed beyond {args.threshold:.0%}: {regressions}")  # noqa: T201
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,105 @@
+"""Measures the sustained upload throughput of large peary requests.
+
+Uploads `--count` requests carrying `--size` bytes each to a local
+MockPearyServer acknowledging every request, one request at a time and
+pipelined, and reports the throughput. The server is reached over TCP, a Unix
+domain socket or the in-memory loopback, i.e.
+
+    PYTHONPATH=src python benchmark/upload_throughput.py --transport unix
+
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from contextlib import ExitStack
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from peary.peary_frame import FrameEncoder
+from peary.peary_mock_server import MockPearyServer
+from peary.peary_protocol import PearyProtocol
+from peary.peary_transport import LoopbackTransport, TcpTransport, UnixTransport
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from peary.peary_frame import DecodedBytes
+    from peary.peary_transport import Transport
+
+
+def ack(frame: DecodedBytes) -> bytes:
+    """Answers every frame with an empty payload, like a register write."""
+    if frame.payload == b"protocol_version":  # pylint: disable=magic-value-comparison
+        return FrameEncoder.encode(PearyProtocol.VERSION, frame.tag, frame.status)
+    return FrameEncoder.encode(b"", frame.tag, frame.status)
+
+
+def tcp(stack: ExitStack) -> TcpTransport:
+    """Returns a transport to a mock server on localhost closed with the stack."""
+    server = stack.enter_context(MockPearyServer(handler=ack))
+    return TcpTransport(*server.address)
+
+
+def unix(stack: ExitStack) -> UnixTransport:
+    """Returns a transport to a mock server on a Unix domain socket."""
+    path = str(Path(stack.enter_context(tempfile.TemporaryDirectory())) / "peary.sock")
+    stack.enter_context(MockPearyServer(handler=ack, path=path))
+    return UnixTransport(path)
+
+
+TRANSPORTS: dict[str, Callable[[ExitStack], Transport]] = {
+    "tcp": tcp,
+    "unix": unix,
+    "loopback": lambda _: LoopbackTransport(ack),
+}
+
+
+def connect(name: str, stack: ExitStack) -> Transport:
+    """Connects a transport to a mock server.
+
+    Args:
+        name: The name of the transport, one of TRANSPORTS.
+        stack: Exit stack closing the server and connection.
+
+    Returns:
+        Transport: The connected transport.
+
+    """
+    transport = TRANSPORTS[name](stack)
+    transport.connect()
+    stack.callback(transport.socket.close)
+    return transport
+
+
+def main() -> None:
+    """Runs the upload throughput benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=1 << 20, help="bytes/request")
+    parser.add_argument("--count", type=int, default=64, help="requests per run")
+    parser.add_argument("--transport", choices=[*TRANSPORTS], default="tcp")
+    args = parser.parse_args()
+
+    payload = "0" * args.size
+    total = args.size * args.count
+    with ExitStack() as stack:
+        protocol = PearyProtocol(connect(args.transport, stack).socket, timeout=10)
+        modes = {
+            "request": lambda: [
+                protocol.request("set_memory", payload) for _ in range(args.count)
+            ],
+            "request_many": lambda: protocol.request_many(
+                [("set_memory", payload)] * args.count
+            ),
+        }
+        for mode, upload in modes.items():
+            start = time.perf_counter()
+            upload()
+            elapsed = time.perf_counter() - start
+            print(f"{mode:>12}: {total / elapsed / 1e6:8.1f} MB/s")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
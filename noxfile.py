@@ -12,6 +12,12 @@ nox.options.error_on_external_run = True
 nox.options.envdir = os.environ.get("NOX_ENVDIR", ".nox")
 
 
+@nox.session(reuse_venv=True, default=False)
+def benchmark(session):
+    """Runs the benchmark suite and the latency, upload and stress benchmarks."""
+    session.notify("build_venv", posargs=([_benchmark], *session.posargs))
+
+
 @nox.session(reuse_venv=True, default=False)
 def build_venv(session):
     """Builds the virtual environment."""
@@ -40,6 +46,12 @@ def lint(session):
     session.notify("build_venv", posargs=([_lint], *session.posargs))
 
 
+@nox.session(reuse_venv=True, default=False)
+def stress(session):
+    """Runs the stress suite under injected network faults."""
+    session.notify("build_venv", posargs=([_stress], *session.posargs))
+
+
 @nox.session(reuse_venv=True)
 def style(session):
     """Runs linters and fixers."""
@@ -52,6 +64,17 @@ def test(session):
     session.notify("build_venv", posargs=([_test], *session.posargs))
 
 
+def _benchmark(session, *args):
+    """Executes the environment command for the benchmark suite and scripts."""
+    session.run("python", "benchmark/suite.py", *args)
+    session.run("python", "benchmark/request_latency.py")
+    for transport in ("tcp", "unix", "loopback"):
+        session.run(
+            "python", "benchmark/upload_throughput.py", "--transport", transport
+        )
+    session.run("python", "benchmark/stress.py", "--duration", "0.5")
+
+
 def _cli(session, *args):
     """Executes the environment command for the CLI."""
     if session.posargs:
@@ -83,6 +106,11 @@ def _lint(session):
     session.run("mypy", "src", "test")
 
 
+def _stress(session, *args):
+    """Executes the environment command for the stress suite."""
+    session.run("python", "benchmark/stress.py", *args)
+
+
 def _style(session):
     """Executes the environment command for the stylers and fixers."""
     session.run("black", "--verbose", ".")
@@ -1 +1,16 @@
+from .peary_async_client import AsyncPearyClient, AsyncPearyProxy  # noqa: F401
+from .peary_async_mock_server import AsyncMockPearyServer  # noqa: F401
 from .peary_client import PearyClient, PearyProxy  # noqa: F401
+from .peary_cluster import PearyCluster  # noqa: F401
+from .peary_fault_proxy import FaultInjectingProxy, FaultProfile  # noqa: F401
+from .peary_handshake_cache import HandshakeCache  # noqa: F401
+from .peary_heartbeat import PearyHeartbeat  # noqa: F401
+from .peary_mock import MockPearyModel  # noqa: F401
+from .peary_mock_server import MockPearyServer  # noqa: F401
+from .peary_pool import PearyClientPool, PearyPoolProxy  # noqa: F401
+from .peary_reconnect import ReconnectPolicy  # noqa: F401
+from .peary_recorder import WireRecorder  # noqa: F401
+from .peary_register_cache import RegisterCache  # noqa: F401
+from .peary_replay import PearyReplay  # noqa: F401
+from .peary_stats import ProtocolStats  # noqa: F401
+from .peary_timeout import AdaptiveTimeout  # noqa: F401
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import asyncio
+
+from peary.peary_async_protocol import AsyncPearyProtocol
+from peary.peary_async_proxy import AsyncPearyProxy
+from peary.peary_client import PearyClient
+
+
+class AsyncPearyClient:
+    """Connect to a remote peary server instance using asyncio streams.
+
+    The asyncio peary client supports the asynchronous context manager protocol
+    and should be used in an async with statement for automatic connection closing
+    on errors, i.e.
+
+        async with AsyncPearyClient(host='localhost') as proxy:
+            device = await proxy.add_device("SpacelyCaribouBasic")
+            voltages = await asyncio.gather(
+                device.get_voltage("PWR_OUT_1"), device.get_voltage("PWR_OUT_2")
+            )
+
+    """
+
+    PearySockerError = PearyClient.PearySockerError
+
+    def __init__(
+        self,
+        host: str,
+        port: int = 12345,
+        *,
+        protocol_class: type[AsyncPearyProtocol] = AsyncPearyProtocol,
+    ) -> None:
+        """Initializes a new asyncio peary client.
+
+        Args:
+            host: Hostname of the remote peary server.
+            port: Port number of the remote peary server. Defaults to 12345.
+            protocol_class: Class used for the protocol. Defaults to
+                AsyncPearyProtocol.
+
+        """
+        self._host = host
+        self._port = port
+        self._protocol_class = protocol_class
+        self._protocol: AsyncPearyProtocol | None = None
+
+    async def __aenter__(self) -> AsyncPearyProxy:
+        """Enters a connection with a peary server.
+
+        Returns:
+            AsyncPearyProxy: Proxy for the connected peary server.
+
+        Raises:
+            PearySockerError: If client cannot not connect to remote host.
+            VersionError: If protocol version doesn match with remote host.
+            BaseException: Any error opening the protocol, after the connection was
+                closed.
+
+        """
+        try:
+            reader, writer = await asyncio.open_connection(self._host, self._port)
+        except Exception as e:
+            raise AsyncPearyClient.PearySockerError(
+                f"Unable to connect to host {self._host} using port {self._port}."
+            ) from e
+
+        self._protocol = self._protocol_class(reader, writer)
+        try:
+            await self._protocol.open()
+        except BaseException:
+            await self._protocol.close()
+            self._protocol = None
+            raise
+        return AsyncPearyProxy(self._protocol)
+
+    async def __aexit__(self, *_: object) -> None:
+        """Exits a context block.
+
+        Args:
+            _: Catches the usued arguments required for the __aexit__ function.
+
+        """
+        if self._protocol is not None:
+            await self._protocol.close()
+            self._protocol = None
@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from peary.peary_async_protocol import AsyncPearyProtocol
+
+
+class AsyncPearyDevice:
+    """An asyncio Peary device."""
+
+    def __init__(self, index: int, protocol: AsyncPearyProtocol) -> None:
+        """Initializes a remote peary device.
+
+        Args:
+            index: Numerical identifier for the device.
+            protocol: Asyncio protocol connected to the remote peary server.
+
+        """
+        self._index = index
+        self._protocol = protocol
+        self._name: str | None = None
+
+    @property
+    def index(self) -> int:
+        """Returns the device index."""
+        return self._index
+
+    @property
+    def protocol(self) -> AsyncPearyProtocol:
+        """Returns the connected protocol."""
+        return self._protocol
+
+    async def name(self) -> str:
+        """Returns the device type."""
+        if self._name is None:
+            self._name = (await self._request("name")).decode("utf-8")
+        return self._name
+
+    # fixed device functionality is added explicitly with
+    # additional return value decoding where appropriate
+    async def power_on(self) -> bytes:
+        """Power on the device."""
+        return await self._request("power_on")
+
+    async def power_off(self) -> bytes:
+        """Power off the device."""
+        return await self._request("power_off")
+
+    async def reset(self) -> bytes:
+        """Reset the device."""
+        return await self._request("reset")
+
+    async def configure(self) -> bytes:
+        """Initialize and configure the device."""
+        return await self._request("configure")
+
+    async def daq_start(self) -> bytes:
+        """Start data aquisition for the device."""
+        return await self._request("daq_start")
+
+    async def daq_stop(self) -> bytes:
+        """Stop data aquisition for the device."""
+        return await self._request("daq_stop")
+
+    async def list_registers(self) -> list[str]:
+        """List all available registers by name."""
+        return (await self._request("list_registers")).decode("utf-8").split()
+
+    async def get_register(self, name: str) -> int:
+        """Get the value of a named register."""
+        return int(await self._request("get_register", name))
+
+    async def set_register(self, name: str, value: int) -> bytes:
+        """Set the value of a named register."""
+        return await self._request("set_register", name, str(value))
+
+    async def get_memory(self, name: str) -> int:
+        """Get the value of a named memory."""
+        return int(await self._request("get_memory", name))
+
+    async def set_memory(self, name: str, value: int) -> bytes:
+        """Set the value of a named memory."""
+        return await self._request("set_memory", name, str(value))
+
+    async def get_current(self, name: str) -> float:
+        """Get the measured current of a named periphery port."""
+        return float(await self._request("get_current", name))
+
+    async def set_current(self, name: str, value: float) -> bytes:
+        """Set the current of a named periphery port."""
+        return await self._request("set_current", name, str(value))
+
+    async def get_voltage(self, name: str) -> float:
+        """Get the measured voltage of a named periphery port."""
+        return float(await self._request("get_voltage", name))
+
+    async def set_voltage(self, name: str, value: float) -> bytes:
+        """Set the voltage of a named periphery port."""
+        return await self._request("set_voltage", name, str(value))
+
+    async def switch_on(self, name: str) -> bytes:
+        """Switch on a periphery port."""
+        return await self._request("switch_on", name)
+
+    async def switch_off(self, name: str) -> bytes:
+        """Switch off a periphery port."""
+        return await self._request("switch_off", name)
+
+    async def _request(self, cmd: str, *args: str) -> bytes:
+        """Send a per-device request to the host and returns response payload.
+
+        Args:
+            cmd: The device command to be performed by the host.
+            args: Additional device command arguments sent to host.
+
+        Returns:
+            bytes: response payload.
+
+        """
+        return await self._protocol.request(f"device.{cmd}", str(self.index), *args)
+
+    def __repr__(self) -> str:
+        """Returns a string representation for the device.
+
+        Returns:
+            String: The string representation of the device instance.
+
+        """
+        return f"{self._name or type(self).__name__}({self.index})"
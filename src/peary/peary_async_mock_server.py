@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import asyncio
+from contextlib import suppress
+from typing import TYPE_CHECKING
+
+from peary.peary_frame import FrameDecoder
+from peary.peary_mock import MockPearyModel
+
+if TYPE_CHECKING:
+    from typing_extensions import Self
+
+
+class AsyncMockPearyServer:
+    """Asyncio TCP server speaking the peary wire format for tests and benchmarks.
+
+    The asyncio counterpart of MockPearyServer serves any number of connections
+    from a single event loop, i.e.
+
+        async with AsyncMockPearyServer() as server:
+            async with AsyncPearyClient(*server.address) as proxy:
+                device = await proxy.add_device("SpacelyCaribouBasic")
+
+    Responses are delayed by the latency of the model without blocking the loop;
+    the responses of pipelined requests overlap their latencies.
+
+    """
+
+    def __init__(
+        self, model: MockPearyModel | None = None, *, host: str = "127.0.0.1"
+    ) -> None:
+        """Initializes a new asyncio mock peary server.
+
+        Args:
+            model: The model answering the requests. Defaults to a model without
+                registers or latency.
+            host: The address the server listens on. Defaults to 127.0.0.1.
+
+        """
+        self._model = model if model is not None else MockPearyModel()
+        self._host = host
+        self._server: asyncio.Server | None = None
+        self._writers: set[asyncio.StreamWriter] = set()
+
+    @property
+    def address(self) -> tuple[str, int]:
+        """Returns the host and port the server listens on.
+
+        Raises:
+            RuntimeError: If the server has not been started.
+
+        """
+        if self._server is None:
+            raise RuntimeError("Mock peary server not started.")
+        host, port = self._server.sockets[0].getsockname()[:2]
+        return host, port
+
+    @property
+    def model(self) -> MockPearyModel:
+        """Returns the model answering the requests."""
+        return self._model
+
+    async def start(self) -> None:
+        """Starts listening on a free port."""
+        self._server = await asyncio.start_server(self._serve, self._host, 0)
+
+    async def stop(self) -> None:
+        """Stops listening and closes the open connections."""
+        if self._server is not None:
+            self._server.close()
+            for writer in tuple(self._writers):
+                writer.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def _serve(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Answers the requests of a connection until it closes.
+
+        Args:
+            reader: The stream of the requests.
+            writer: The stream of the responses.
+
+        """
+        self._writers.add(writer)
+        with suppress(ConnectionError):
+            try:
+                await self._answer(reader, writer)
+            finally:
+                self._writers.discard(writer)
+                writer.close()
+
+    async def _answer(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Answers the requests of a connection after their latency.
+
+        Args:
+            reader: The stream of the requests.
+            writer: The stream of the responses.
+
+        """
+        decoder = FrameDecoder()
+        loop = asyncio.get_running_loop()
+        while data := await reader.read(65536):  # pylint: disable=while-used
+            received_at = loop.time()
+            for frame in decoder.feed(data):
+                response, delay = self._model.respond(frame)
+                await asyncio.sleep(max(0, received_at + delay - loop.time()))
+                writer.write(response)
+            await writer.drain()
+
+    async def __aenter__(self) -> Self:
+        """Starts listening on a free port.
+
+        Returns:
+            AsyncMockPearyServer: The started server.
+
+        """
+        await self.start()
+        return self
+
+    async def __aexit__(self, *_: object) -> None:
+        """Stops the server.
+
+        Args:
+            _: Catches the usued arguments required for the __aexit__ function.
+
+        """
+        await self.stop()
@@ -0,0 +1,249 @@
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from itertools import islice
+from typing import TYPE_CHECKING
+
+from peary.peary_frame import FrameDecoder, FrameEncoder
+from peary.peary_protocol import PearyProtocol
+from peary.peary_tags import TagAllocator
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+
+    from peary.peary_frame import DecodedBytes
+
+
+class AsyncPearyProtocol:
+    """Asyncio protocol for communication with a remote peary server.
+
+    Responses are read by a background task and matched to their requests by tag,
+    so any number of requests can be in flight on a single connection.
+
+    """
+
+    Checks = PearyProtocol.Checks
+
+    def __init__(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+        *,
+        timeout: float = 1,
+        checks: PearyProtocol.Checks = PearyProtocol.Checks.CHECK_VERSION,
+    ) -> None:
+        """Initializes a new asyncio peary protocol.
+
+        The protocol only starts receiving responses once opened.
+
+        Args:
+            reader: Stream reader connected to the remote peary server.
+            writer: Stream writer connected to the remote peary server.
+            timeout: Response timeout value in seconds. Defaults to 1.
+            checks: Checks performed when opening. Defaults to CHECK_VERSION.
+
+        """
+        self._tags = TagAllocator()
+        self._reader = reader
+        self._writer = writer
+        self._timeout = timeout
+        self._checks = checks
+        self._pending: dict[int, asyncio.Future[DecodedBytes]] = {}
+        self._reader_task: asyncio.Task[None] | None = None
+
+    async def open(self) -> None:
+        """Starts receiving responses and performs the initialization checks.
+
+        Raises:
+            VersionError: If protocol version doesn match with remote host.
+
+        """
+        self._reader_task = asyncio.get_running_loop().create_task(self._read())
+        if PearyProtocol.Checks.CHECK_VERSION in self._checks:
+            await self._verify_compatible_version()
+
+    async def close(self) -> None:
+        """Stops receiving responses and closes the connection."""
+        if self._reader_task is not None:
+            self._reader_task.cancel()
+            await asyncio.gather(self._reader_task, return_exceptions=True)
+        self._writer.close()
+        await self._writer.wait_closed()
+
+    async def request(self, msg: str, *args: str) -> bytes:
+        """Initiates a requst to the connected peary server.
+
+        Args:
+            msg: The request message to be sent.
+            *args: Additiona message argumnets.
+
+        Returns:
+            bytes: The received response.
+
+        Raises:
+            ResponseStatusError: If response returns a failing status.
+
+        """
+        tag, future = self._submit([(msg, *args)])[0]
+        await self._writer.drain()
+        resp, _, resp_status = await self._wait_for(tag, future)
+        if resp_status != PearyProtocol.STATUS_OK:
+            raise PearyProtocol.status_error(msg, resp_status)
+        return resp
+
+    async def request_many(
+        self, requests: Iterable[Sequence[str]], *, window: int = 256
+    ) -> list[bytes | PearyProtocol.ResponseStatusError]:
+        """Initiates a pipelined batch of requests to the connected peary server.
+
+        At most a window of requests is in flight; whenever half of the window has
+        been answered the free tags are refilled with the next burst, like the
+        request_many of PearyProtocol.
+
+        Args:
+            requests: Request messages, each followed by its additional arguments.
+            window: Maximum number of requests in flight. Defaults to 256.
+
+        Returns:
+            list: The response payload or status error for each request, in order.
+
+        Raises:
+            ValueError: If the window is not positive.
+
+        """
+        PearyProtocol.check_window(window)
+        in_flight: deque[tuple[str, int, asyncio.Future[DecodedBytes]]] = deque()
+        responses: list[bytes | PearyProtocol.ResponseStatusError] = []
+        requests = iter(requests)
+        # pylint: disable-next=while-used
+        while burst := [*islice(requests, window - len(in_flight))]:
+            for (msg, *_), (tag, future) in zip(burst, self._submit(burst)):
+                in_flight.append((msg, tag, future))
+            await self._writer.drain()
+            while len(in_flight) > window // 2:  # pylint: disable=while-used
+                responses.append(await self._response(*in_flight.popleft()))
+        while in_flight:  # pylint: disable=while-used
+            responses.append(await self._response(*in_flight.popleft()))
+        return responses
+
+    def _submit(
+        self, requests: Sequence[Sequence[str]]
+    ) -> list[tuple[int, asyncio.Future[DecodedBytes]]]:
+        """Writes requests as one burst and registers the futures of their responses.
+
+        Args:
+            requests: Request messages, each followed by its additional arguments.
+
+        Returns:
+            list: The tag and the future resolved with the response per request.
+
+        Raises:
+            ResponseReceiveError: If the protocol is not receiving responses.
+
+        """
+        if self._reader_task is None or self._reader_task.done():
+            raise PearyProtocol.ResponseReceiveError("Failed to receive response.")
+        submitted = []
+        frames = []
+        for msg, *args in requests:
+            tag = self._tags.acquire()
+            future = asyncio.get_running_loop().create_future()
+            self._pending[tag] = future
+            frames.append(
+                (" ".join([msg, *args]).encode("utf-8"), tag, PearyProtocol.STATUS_OK)
+            )
+            submitted.append((tag, future))
+        self._writer.write(FrameEncoder.encode_many(frames))
+        return submitted
+
+    async def _response(
+        self, msg: str, tag: int, future: asyncio.Future[DecodedBytes]
+    ) -> bytes | PearyProtocol.ResponseStatusError:
+        """Waits for the response of a pipelined request.
+
+        Args:
+            msg: The request message.
+            tag: The tag of the request.
+            future: The future registered for the response.
+
+        Returns:
+            bytes: The response payload, or the status error of a failing response.
+
+        """
+        resp, _, resp_status = await self._wait_for(tag, future)
+        if resp_status != PearyProtocol.STATUS_OK:
+            return PearyProtocol.status_error(msg, resp_status)
+        return resp
+
+    async def _wait_for(
+        self, tag: int, future: asyncio.Future[DecodedBytes]
+    ) -> DecodedBytes:
+        """Waits for a response while applying the protocol timeout.
+
+        Args:
+            tag: The tag of the request.
+            future: The future registered for the response.
+
+        Returns:
+            DecodedBytes: The decoded response.
+
+        """
+        try:
+            return await asyncio.wait_for(future, self._timeout)
+        finally:
+            if self._pending.get(tag) is future:
+                del self._pending[tag]
+
+    async def _read(self) -> None:
+        """Receives responses until the connection stops.
+
+        When the connection stops all pending requests fail with it.
+
+        """
+        try:
+            await self._dispatch_responses()
+        except (OSError, FrameDecoder.DecodeError) as e:
+            self._fail_pending(e)
+        else:
+            self._fail_pending(EOFError("Connection closed by remote host."))
+
+    async def _dispatch_responses(self) -> None:
+        """Resolves the futures waiting for the received responses.
+
+        Requests that timed out keep their tag in flight until their late response
+        arrives. Such responses are dropped and only then is the tag released, so
+        they are never mistaken for the response of a newer request.
+
+        """
+        decoder = FrameDecoder()
+        while data := await self._reader.read(65536):  # pylint: disable=while-used
+            for frame in decoder.feed(data):
+                self._tags.release(frame.tag)
+                future = self._pending.pop(frame.tag, None)
+                if future is not None and not future.done():
+                    future.set_result(frame)
+
+    def _fail_pending(self, error: Exception) -> None:
+        """Fails all pending requests after the connection stopped receiving.
+
+        Args:
+            error: The error that stopped the connection.
+
+        """
+        for future in self._pending.values():
+            if not future.done():
+                future.set_exception(PearyProtocol.receive_error(error))
+        self._pending.clear()
+
+    async def _verify_compatible_version(self) -> None:
+        """Verify the remote version is suppoted by this protocol.
+
+        Raises:
+            VersionError: If versions are incompatible.
+
+        """
+        if (version := await self.request("protocol_version")) != PearyProtocol.VERSION:
+            raise PearyProtocol.VersionError(
+                f"Unsupported protocol version: {version!r}"
+            )
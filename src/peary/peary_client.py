@@ -1,9 +1,22 @@
 from __future__ import annotations
 
 import socket as socket_module
+from contextlib import suppress
+from typing import TYPE_CHECKING
 
+from peary import peary_transport_options
 from peary.peary_protocol import PearyProtocol
 from peary.peary_proxy import PearyProxy
+from peary.peary_reconnect import PearyReconnectingProtocol
+from peary.peary_transport import TcpTransport
+
+if TYPE_CHECKING:
+    from peary.peary_handshake_cache import HandshakeCache
+    from peary.peary_reconnect import ReconnectPolicy
+    from peary.peary_recorder import WireRecorder
+    from peary.peary_timeout import AdaptiveTimeout
+    from peary.peary_transport import Connection, Transport
+    from peary.peary_transport_options import TransportOptions
 
 
 class PearyClient:
@@ -15,18 +28,38 @@ class PearyClient:
         with PearyClient(host='localhost') as client:
             # do something with the client
 
+    Peary servers on the same system can be reached without the TCP/IP stack by
+    passing another transport, e.g. `PearyClient(transport=UnixTransport(path))`.
+
+    Clients sharing a handshake cache skip the version check when reconnecting to a
+    server verified within the time to live of the cache, and otherwise defer it to
+    the first request.
+
+    With a reconnect policy, dropped connections are re-established with backoff
+    and the added devices are restored, so callers see a stall instead of an error.
+
     """
 
     class PearySockerError(Exception):
         """Exception for socket errors."""
 
-    def __init__(
+    BULK_THROUGHPUT = peary_transport_options.BULK_THROUGHPUT
+    LONG_LIVED = peary_transport_options.LONG_LIVED
+    LOW_LATENCY = peary_transport_options.LOW_LATENCY
+
+    def __init__(  # noqa: PLR0913 # pylint: disable=too-many-arguments
         self,
-        host: str,
+        host: str = "localhost",
         port: int = 12345,
         *,
         protocol_class: type[PearyProtocol] = PearyProtocol,
         socket_class: type[socket_module.socket] = socket_module.socket,
+        transport_options: TransportOptions | None = None,
+        transport: Transport | None = None,
+        handshake_cache: HandshakeCache | None = None,
+        reconnect: ReconnectPolicy | None = None,
+        timeout: float | AdaptiveTimeout = 1,
+        recorder: WireRecorder | None = None,
     ) -> None:
         """Initializes a new peary client.
 
@@ -35,17 +68,89 @@ class PearyClient:
             port: Port number of the remote peary server. Defaults to 12345.
             socket_class: Class used for the remote socket. Defaults to socket.
             protocol_class: Class used for the protocol. Defaults to PearyProtocol.
+            transport_options: Socket options applied before connecting, e.g.
+                LOW_LATENCY. Defaults to the socket defaults.
+            transport: Transport used instead of connecting to host and port over TCP.
+            handshake_cache: Cache of the versions verified with peary servers.
+                Defaults to verifying the version on every connection.
+            reconnect: Backoff used to restore dropped connections with a
+                PearyReconnectingProtocol, or with the protocol class if it derives
+                from it. Defaults to failing on dropped connections.
+            timeout: Response timeout of the protocol in seconds, or an adaptive
+                timeout applied per request. Defaults to 1.
+            recorder: Recorder of the frames sent and received by the protocol.
+                Defaults to not recording.
+
+        Raises:
+            ValueError: If the protocol class cannot restore dropped connections.
 
         """
-        self._host = host
-        self._port = port
+        if (
+            reconnect is not None
+            and protocol_class is not PearyProtocol
+            and not issubclass(protocol_class, PearyReconnectingProtocol)
+        ):
+            raise ValueError(
+                f"Invalid protocol class with reconnect: {protocol_class.__name__}"
+            )
         self._protocol_class = protocol_class
-        self._socket = socket_class(socket_module.AF_INET, socket_module.SOCK_STREAM)
+        self._handshake_cache = handshake_cache
+        self._protocol: PearyProtocol | None = None
+        self._reconnect_policy = reconnect
+        self._timeout = timeout
+        self._recorder = recorder
+        self._transport = (
+            transport
+            if transport is not None
+            else TcpTransport(
+                host,
+                port,
+                socket_class=socket_class,
+                transport_options=transport_options,
+            )
+        )
 
     @property
-    def socket(self) -> socket_module.socket:
+    def socket(self) -> Connection:
         """Returns the socket."""
-        return self._socket
+        return self._transport.socket
+
+    def _handshake_checks(self, cache: HandshakeCache) -> PearyProtocol.Checks:
+        """Returns the checks of a new connection given the handshake cache.
+
+        Args:
+            cache: Cache of the versions verified with peary servers.
+
+        Returns:
+            Checks: No check if the server version is cached, else a lazy check.
+
+        """
+        if cache.lookup(self._transport.key) == PearyProtocol.VERSION:
+            return PearyProtocol.Checks.CHECK_NONE
+        return PearyProtocol.Checks.CHECK_VERSION_LAZY
+
+    def _cache_handshake(self, version: bytes) -> None:
+        """Records the version verified by the protocol in the handshake cache.
+
+        Args:
+            version: The verified protocol version.
+
+        """
+        if self._handshake_cache is not None:
+            self._handshake_cache.store(self._transport.key, version)
+
+    def _reconnect(self) -> Connection:
+        """Replaces a dropped connection with a new one.
+
+        Returns:
+            Connection: The new connection to the peary server.
+
+        """
+        with suppress(OSError):
+            self.socket.close()
+        self._transport.reopen()
+        self._transport.connect()
+        return self.socket
 
     def __enter__(self) -> PearyProxy:
         """Enters a connection with a peary server.
@@ -58,13 +163,37 @@ class PearyClient:
 
         """
         try:
-            self.socket.connect((self._host, self._port))
+            self._transport.connect()
         except Exception as e:
             raise PearyClient.PearySockerError(
-                f"Unable to connect to host {self._host} using port {self._port}."
+                f"Unable to connect to {self._transport}."
             ) from e
 
-        return PearyProxy(self._protocol_class(self.socket))
+        checks = (
+            PearyProtocol.Checks.CHECK_VERSION
+            if self._handshake_cache is None
+            else self._handshake_checks(self._handshake_cache)
+        )
+        if self._reconnect_policy is None:
+            self._protocol = self._protocol_class(
+                self.socket, timeout=self._timeout, checks=checks
+            )
+        else:
+            reconnecting_class = (
+                self._protocol_class
+                if issubclass(self._protocol_class, PearyReconnectingProtocol)
+                else PearyReconnectingProtocol
+            )
+            self._protocol = reconnecting_class(
+                self.socket,
+                reconnect=self._reconnect,
+                policy=self._reconnect_policy,
+                timeout=self._timeout,
+                checks=checks,
+            )
+        self._protocol.record(self._recorder)
+        self._protocol.on_verified(self._cache_handshake)
+        return PearyProxy(self._protocol)
 
     def __exit__(self, *_: object) -> None:
         """Exits a context block.
@@ -73,5 +202,6 @@ class PearyClient:
             _: Catches the usued arguments required for the __exit__ function.
 
         """
-        self.socket.shutdown(socket_module.SHUT_RDWR)
+        with suppress(OSError):
+            self.socket.shutdown(socket_module.SHUT_RDWR)
         self.socket.close()
@@ -0,0 +1,205 @@
+from __future__ import annotations
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from peary.peary_client import PearyClient
+from peary.peary_device import PearyDevice
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+    from typing_extensions import Self
+
+    from peary.peary_proxy import PearyProxy
+
+
+class PearyCluster:
+    """Drive a farm of remote peary servers concurrently.
+
+    Every host is connected and called from its own worker thread, so a call across
+    the cluster takes as long as the slowest host rather than the sum of all hosts.
+    Failures are reported per host instead of aborting the other hosts, i.e.
+
+        with PearyCluster(["caribou-01", "caribou-02"]) as cluster:
+            cluster.add_device("SpacelyCaribouBasic")
+            results = cluster.call_device(
+                "SpacelyCaribouBasic", "get_voltage", "PWR_OUT_1"
+            )
+            for host, result in results.items():
+                print(host, result.value, result.error, result.elapsed)
+
+    """
+
+    class Result(NamedTuple):
+        """Outcome of a call on a single host."""
+
+        host: str
+        value: Any
+        error: Exception | None
+        elapsed: float
+
+    def __init__(
+        self,
+        hosts: Iterable[str],
+        port: int = 12345,
+        *,
+        client_factory: Callable[[str], PearyClient] | None = None,
+    ) -> None:
+        """Initializes a new peary cluster.
+
+        Args:
+            hosts: Hostnames of the remote peary servers.
+            port: Port number of the remote peary servers. Defaults to 12345.
+            client_factory: Creates the client of a host instead of a PearyClient
+                connecting to the host and port.
+
+        """
+        self._hosts = [*dict.fromkeys(hosts)]
+        self._client_factory = client_factory or (lambda host: PearyClient(host, port))
+        self._proxies: dict[str, PearyProxy] = {}
+        self._failures: dict[str, PearyCluster.Result] = {}
+        self._executor = ThreadPoolExecutor(max(len(self._hosts), 1))
+        self._stack = ExitStack()
+
+    @property
+    def hosts(self) -> list[str]:
+        """Returns the hostnames of the cluster."""
+        return [*self._hosts]
+
+    @property
+    def proxies(self) -> dict[str, PearyProxy]:
+        """Returns the proxies of the connected hosts."""
+        return {**self._proxies}
+
+    @staticmethod
+    def _timed(
+        host: str, function: Callable[..., object], *args: object
+    ) -> PearyCluster.Result:
+        """Calls a function and captures its value or error and duration.
+
+        Args:
+            host: The host the function is called for.
+            function: The function to be called.
+            *args: Arguments passed to the function.
+
+        Returns:
+            Result: The outcome of the call.
+
+        """
+        start = time.perf_counter()
+        try:
+            value = function(*args)
+        except Exception as e:  # noqa: BLE001 # pylint: disable=broad-exception-caught
+            return PearyCluster.Result(host, None, e, time.perf_counter() - start)
+        return PearyCluster.Result(host, value, None, time.perf_counter() - start)
+
+    def map(self, function: Callable[[PearyProxy], object]) -> dict[str, Result]:
+        """Calls a function with the proxy of every host concurrently.
+
+        Hosts that failed to connect report their connection error.
+
+        Args:
+            function: The function called with the proxy of each host.
+
+        Returns:
+            dict: The outcome of the call per host, in the order of the hosts.
+
+        """
+        futures = {
+            host: self._executor.submit(PearyCluster._timed, host, function, proxy)
+            for host, proxy in self._proxies.items()
+        }
+        return {
+            host: (futures[host].result() if host in futures else self._failures[host])
+            for host in self._hosts
+        }
+
+    def broadcast(self, method: str, *args: object) -> dict[str, Result]:
+        """Calls a proxy method on every host concurrently.
+
+        Args:
+            method: Name of the proxy method, e.g. keep_alive.
+            *args: Arguments passed to the method.
+
+        Returns:
+            dict: The outcome of the call per host, in the order of the hosts.
+
+        """
+        return self.map(lambda proxy: getattr(proxy, method)(*args))
+
+    def add_device(
+        self, name: str, device_class: type[PearyDevice] = PearyDevice
+    ) -> dict[str, Result]:
+        """Adds a device on every host concurrently.
+
+        Args:
+            name: Name of device to add.
+            device_class: Class used to construct the device. Defaults to PearyDevice.
+
+        Returns:
+            dict: The added device or error per host, in the order of the hosts.
+
+        """
+        return self.map(lambda proxy: proxy.add_device(name, device_class))
+
+    def call_device(self, name: str, method: str, *args: object) -> dict[str, Result]:
+        """Calls a device method on every host concurrently.
+
+        Args:
+            name: Name of the device added on every host.
+            method: Name of the device method, e.g. power_on or get_voltage.
+            *args: Arguments passed to the method.
+
+        Returns:
+            dict: The outcome of the call per host, in the order of the hosts.
+
+        """
+        return self.map(lambda proxy: getattr(proxy.get_device(name), method)(*args))
+
+    def _connect(self, host: str) -> tuple[ExitStack, PearyProxy]:
+        """Connects the client of a host.
+
+        Args:
+            host: Hostname of the remote peary server.
+
+        Returns:
+            tuple: The exit stack disconnecting the client and its proxy.
+
+        """
+        with ExitStack() as stack:
+            proxy = stack.enter_context(self._client_factory(host))
+            return stack.pop_all(), proxy
+
+    def __enter__(self) -> Self:
+        """Connects to all hosts concurrently.
+
+        Returns:
+            PearyCluster: The cluster with every reachable host connected.
+
+        """
+        futures = {
+            host: self._executor.submit(PearyCluster._timed, host, self._connect, host)
+            for host in self._hosts
+        }
+        for host, future in futures.items():
+            if (result := future.result()).error is None:
+                disconnect, self._proxies[host] = result.value
+                self._stack.push(disconnect)
+            else:
+                self._failures[host] = result
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        """Disconnects from all hosts.
+
+        Args:
+            _: Catches the usued arguments required for the __exit__ function.
+
+        """
+        self._stack.close()
+        self._proxies.clear()
+        self._failures.clear()
+        self._executor.shutdown()
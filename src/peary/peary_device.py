@@ -1,12 +1,26 @@
 from __future__ import annotations
 
+import threading
+from collections.abc import Mapping
+from contextlib import contextmanager
 from typing import TYPE_CHECKING
 
+from peary.peary_protocol import PearyProtocol
+from peary.peary_register_cache import RegisterCache
+
 if TYPE_CHECKING:
-    from peary.peary_protocol import PearyProtocol
+    from collections.abc import Iterable, Iterator
+
+
+class _Deferral(threading.local):
+    """Writes deferred by the current thread, or None if it does not defer."""
 
+    def __init__(self) -> None:
+        """Initializes the deferral of a thread without deferred writes."""
+        self.pending: dict[tuple[str, str], str] | None = None
 
-class PearyDevice:
+
+class PearyDevice:  # pylint: disable=too-many-public-methods
     """A Peary device."""
 
     def __init__(self, index: int, protocol: PearyProtocol) -> None:
@@ -20,6 +34,8 @@ class PearyDevice:
         self._index = index
         self._protocol = protocol
         self._name: None | str = None
+        self._cache: RegisterCache | None = None
+        self._deferral = _Deferral()
 
     @property
     def index(self) -> int:
@@ -38,6 +54,77 @@ class PearyDevice:
         """Returns the connected protocol."""
         return self._protocol
 
+    @property
+    def register_cache(self) -> RegisterCache | None:
+        """Returns the cache of the register and memory values, if any."""
+        return self._cache
+
+    @staticmethod
+    def diff_registers(
+        before: Mapping[str, int], after: Mapping[str, int]
+    ) -> dict[str, tuple[int | None, int | None]]:
+        """Compares two register snapshots.
+
+        Args:
+            before: The earlier snapshot, e.g. after configuring the device.
+            after: The later snapshot, e.g. after a run.
+
+        Returns:
+            dict: The value before and after of each register that differs, with
+                None for registers missing from a snapshot.
+
+        """
+        return {
+            name: (before.get(name), after.get(name))
+            for name in {**before, **after}
+            if before.get(name) != after.get(name)
+        }
+
+    def cache_registers(self, cache: RegisterCache | None) -> None:
+        """Caches the register and memory values read and written by the device.
+
+        Args:
+            cache: Cache of the values, or None to always read from the device.
+
+        """
+        self._cache = cache
+
+    @contextmanager
+    def deferred(self) -> Iterator[None]:
+        """Defers the register, memory, voltage and current writes within the block.
+
+        Deferred writes are queued and coalesced per register, memory or port, so
+        only the last value written to each is sent. The queue is sent as one
+        pipelined batch when the block exits, also if it raises, or before any
+        other request of the device, e.g. a read, so reads always see the writes,
+        i.e.
+
+            with device.deferred():
+                for value in range(100):
+                    device.set_register("vdac", value)  # queued
+                device.get_voltage("PWR_OUT_1")  # sends vdac=99 first
+
+        Deferred writes return an empty response. Nested blocks defer to the
+        outermost one. Deferral is per thread, so the writes of other threads
+        sharing the device are neither deferred nor flushed by the block.
+
+        Yields:
+            None: Control to the block.
+
+        Raises:
+            ResponseStatusError: If a deferred write failed when sent.
+
+        """
+        if self._deferral.pending is not None:
+            yield
+            return
+        self._deferral.pending = {}
+        try:
+            yield
+        finally:
+            pending, self._deferral.pending = self._deferral.pending, None
+            self._send_deferred(pending)
+
     # fixed device functionality is added explicitly with
     # additional return value decoding where appropriate
     def power_on(self) -> bytes:
@@ -46,15 +133,24 @@ class PearyDevice:
 
     def power_off(self) -> bytes:
         """Power off the device."""
-        return self._request("power_off")
+        try:
+            return self._request("power_off")
+        finally:
+            self._clear_cache()
 
     def reset(self) -> bytes:
         """Reset the device."""
-        return self._request("reset")
+        try:
+            return self._request("reset")
+        finally:
+            self._clear_cache()
 
     def configure(self) -> bytes:
         """Initialize and configure the device."""
-        return self._request("configure")
+        try:
+            return self._request("configure")
+        finally:
+            self._clear_cache()
 
     def daq_start(self) -> bytes:
         """Start data aquisition for the device."""
@@ -70,19 +166,109 @@ class PearyDevice:
 
     def get_register(self, name: str) -> int:
         """Get the value of a named register."""
-        return int(self._request("get_register", name))
+        return self._read(RegisterCache.REGISTER, name)
 
     def set_register(self, name: str, value: int) -> bytes:
         """Set the value of a named register."""
-        return self._request("set_register", name, str(value))
+        return self._write(RegisterCache.REGISTER, name, value)
+
+    def snapshot_registers(self, names: Iterable[str] | None = None) -> dict[str, int]:
+        """Reads the values of many registers with pipelined requests.
+
+        Args:
+            names: The names of the registers. Defaults to all registers listed by
+                the device.
+
+        Returns:
+            dict: The value of each register by name.
+
+        Raises:
+            ResponseStatusError: If a register failed to be read.
+
+        """
+        self._flush()
+        names = [*(self.list_registers() if names is None else names)]
+        responses = self._protocol.request_many(
+            [("device.get_register", str(self.index), name) for name in names]
+        )
+        snapshot = {}
+        for name, response in zip(names, responses):
+            if isinstance(response, PearyProtocol.ResponseStatusError):
+                raise response
+            snapshot[name] = int(response)
+            if self._cache is not None:
+                self._cache.store(RegisterCache.REGISTER, name, snapshot[name])
+        return snapshot
+
+    def set_registers(
+        self,
+        registers: Mapping[str, int] | Iterable[tuple[str, int]],
+        *,
+        verify: bool = False,
+    ) -> dict[str, tuple[int | None, int | None]]:
+        """Sets the values of many registers with pipelined requests.
+
+        Repeated writes to a register are collapsed into the last one, which is
+        written in the position of that last write, and writes of the value already
+        known by the register cache are skipped. All writes are sent even if some
+        fail; the failed registers are then reported together.
+
+        Args:
+            registers: The values by register name, or name and value pairs in the
+                order they are written.
+            verify: Whether the registers are read back after writing.
+
+        Returns:
+            dict: The written and read back value of each register that differs,
+                empty if not verified.
+
+        Raises:
+            ResponseStatusError: If registers failed to be written, naming all of
+                them, or to be read back.
+
+        """
+        self._flush()
+        values: dict[str, int] = {}
+        for name, value in (
+            registers.items() if isinstance(registers, Mapping) else registers
+        ):
+            values.pop(name, None)
+            values[name] = value
+        writes = [
+            (name, value)
+            for name, value in values.items()
+            if self._cache is None
+            or self._cache.peek(RegisterCache.REGISTER, name) != value
+        ]
+        responses = self._protocol.request_many(
+            [
+                ("device.set_register", str(self.index), name, str(value))
+                for name, value in writes
+            ]
+        )
+        errors: dict[str, PearyProtocol.ResponseStatusError] = {}
+        for (name, value), response in zip(writes, responses):
+            if isinstance(response, PearyProtocol.ResponseStatusError):
+                errors[name] = response
+            elif self._cache is not None:
+                self._cache.store(RegisterCache.REGISTER, name, value)
+        if errors:
+            raise PearyProtocol.ResponseStatusError(
+                f"Failed to set registers: {', '.join(errors)}"
+            ) from next(iter(errors.values()))
+        return (
+            self.diff_registers(values, self.snapshot_registers(values))
+            if verify
+            else {}
+        )
 
     def get_memory(self, name: str) -> int:
         """Get the value of a named memory."""
-        return int(self._request("get_memory", name))
+        return self._read(RegisterCache.MEMORY, name)
 
     def set_memory(self, name: str, value: int) -> bytes:
         """Set the value of a named memory."""
-        return self._request("set_memory", name, str(value))
+        return self._write(RegisterCache.MEMORY, name, value)
 
     def get_current(self, name: str) -> float:
         """Get the measured current of a named periphery port."""
@@ -90,7 +276,7 @@ class PearyDevice:
 
     def set_current(self, name: str, value: float) -> bytes:
         """Set the current of a named periphery port."""
-        return self._request("set_current", name, str(value))
+        return self._request_or_defer("set_current", name, str(value))
 
     def get_voltage(self, name: str) -> float:
         """Get the measured voltage of a named periphery port."""
@@ -98,7 +284,7 @@ class PearyDevice:
 
     def set_voltage(self, name: str, value: float) -> bytes:
         """Set the voltage of a named periphery port."""
-        return self._request("set_voltage", name, str(value))
+        return self._request_or_defer("set_voltage", name, str(value))
 
     def switch_on(self, name: str) -> bytes:
         """Switch on a periphery port."""
@@ -119,8 +305,103 @@ class PearyDevice:
             bytes: response payload.
 
         """
+        self._flush()
         return self._protocol.request(f"device.{cmd}", str(self.index), *args)
 
+    def _request_or_defer(self, cmd: str, name: str, value: str) -> bytes:
+        """Sends a write request, or queues it while deferring writes.
+
+        Args:
+            cmd: The device command writing the value, e.g. set_voltage.
+            name: The name of the written register, memory or port.
+            value: The written value.
+
+        Returns:
+            bytes: response payload, empty if deferred.
+
+        """
+        if (pending := self._deferral.pending) is None:
+            return self._request(cmd, name, value)
+        pending.pop((cmd, name), None)
+        pending[cmd, name] = value
+        return b""
+
+    def _flush(self) -> None:
+        """Sends the deferred writes queued so far by the current thread."""
+        if self._deferral.pending:
+            pending, self._deferral.pending = self._deferral.pending, {}
+            self._send_deferred(pending)
+
+    def _send_deferred(self, pending: dict[tuple[str, str], str]) -> None:
+        """Sends deferred writes as one pipelined batch.
+
+        Args:
+            pending: The value of each write by command and name, in the order they
+                were last written.
+
+        Raises:
+            ResponseStatusError: If a write failed.
+
+        """
+        responses = self._protocol.request_many(
+            [
+                (f"device.{cmd}", str(self.index), name, value)
+                for (cmd, name), value in pending.items()
+            ]
+        )
+        errors = []
+        for ((cmd, name), value), response in zip(pending.items(), responses):
+            if isinstance(response, PearyProtocol.ResponseStatusError):
+                errors.append(response)
+            elif self._cache is not None and (kind := cmd.removeprefix("set_")) in (
+                RegisterCache.REGISTER,
+                RegisterCache.MEMORY,
+            ):
+                self._cache.store(kind, name, int(value))
+        if errors:
+            raise errors[0]
+
+    def _read(self, kind: str, name: str) -> int:
+        """Reads a register or memory value, from the cache if possible.
+
+        Args:
+            kind: Whether the value is a REGISTER or MEMORY.
+            name: The name of the register or memory.
+
+        Returns:
+            int: The value of the register or memory.
+
+        """
+        self._flush()
+        if self._cache is None:
+            return int(self._request(f"get_{kind}", name))
+        if (value := self._cache.lookup(kind, name)) is None:
+            value = int(self._request(f"get_{kind}", name))
+            self._cache.store(kind, name, value)
+        return value
+
+    def _write(self, kind: str, name: str, value: int) -> bytes:
+        """Writes a register or memory value through the cache.
+
+        Args:
+            kind: Whether the value is a REGISTER or MEMORY.
+            name: The name of the register or memory.
+            value: The new value of the register or memory.
+
+        Returns:
+            bytes: response payload.
+
+        """
+        response = self._request_or_defer(f"set_{kind}", name, str(value))
+        if self._cache is not None and self._deferral.pending is None:
+            self._cache.store(kind, name, value)
+        return response
+
+    def _clear_cache(self) -> None:
+        """Forgets the cached values after the device state was changed."""
+        if self._cache is not None:
+            self._cache.clear()
+
     def _request_name(self) -> str:
         """Requests the name of the device."""
         return self._request("name").decode("utf-8")
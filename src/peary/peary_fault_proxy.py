@@ -0,0 +1,349 @@
+from __future__ import annotations
+
+import random
+import socket as socket_module
+import threading
+import time
+from collections import deque
+from contextlib import suppress
+from types import MappingProxyType
+from typing import TYPE_CHECKING, NamedTuple
+
+from peary.peary_frame import FrameDecoder, FrameEncoder
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping
+
+    from typing_extensions import Self
+
+SEGMENT_GAP = 0.0002  # seconds between split segments, so they arrive separately
+
+
+class FaultProfile(NamedTuple):
+    """Network conditions injected between a peary client and a peary server.
+
+    Every response is delayed by the round-trip time, varied uniformly by the
+    jitter, plus the extra time of slow commands. Responses keep their order like on
+    a TCP stream. The predefined profiles cover the conditions seen in the field,
+    i.e.
+
+        FaultInjectingProxy(server.address, peary_fault_proxy.WAN)
+
+    """
+
+    rtt: float = 0
+    jitter: float = 0
+    segment_size: int | None = None  # bytes per segment responses are split into
+    coalesce: float = 0  # seconds responses are held back to be sent together
+    drop_rate: float = 0  # probability that a response drops the connection instead
+    slow_commands: Mapping[str, float] = MappingProxyType({})
+
+    def delay(self, command: str, rng: random.Random) -> float:
+        """Returns the delay of a response.
+
+        Args:
+            command: The request message of the response, e.g. device.configure.
+            rng: Source of the jitter.
+
+        Returns:
+            float: The delay in seconds.
+
+        """
+        return max(
+            0.0, self.rtt + rng.uniform(-self.jitter, self.jitter)
+        ) + self.slow_commands.get(command, 0)
+
+
+LAN = FaultProfile(rtt=0.005, jitter=0.001)
+WAN = FaultProfile(rtt=0.05, jitter=0.005)
+JITTER = FaultProfile(rtt=0.02, jitter=0.015)
+SPLIT_SEGMENTS = FaultProfile(rtt=0.005, segment_size=5)
+COALESCED_FRAMES = FaultProfile(rtt=0.005, coalesce=0.02)
+DROPPED_CONNECTIONS = FaultProfile(rtt=0.005, drop_rate=0.01)
+SLOW_CONFIGURE = FaultProfile(
+    rtt=0.005, slow_commands=MappingProxyType({"device.configure": 2.0})
+)
+
+
+class _Response(NamedTuple):
+    """Response waiting to be delivered, or None to close the connection."""
+
+    due: float
+    data: bytes | None
+
+
+class _FaultyLink:  # pylint: disable=too-many-instance-attributes
+    """Connection between a client and the peary server with injected faults."""
+
+    def __init__(
+        self,
+        client: socket_module.socket,
+        upstream: socket_module.socket,
+        profile: FaultProfile,
+        rng: random.Random,
+        on_closed: Callable[[_FaultyLink], None],
+    ) -> None:
+        """Initializes a new faulty link and starts relaying.
+
+        Args:
+            client: The accepted client connection.
+            upstream: The connection to the peary server.
+            profile: The injected faults.
+            rng: Source of the jitter and dropped connections.
+            on_closed: Called with the link once both connections are closed.
+
+        """
+        self._client = client
+        self._upstream = upstream
+        self._profile = profile
+        self._rng = rng
+        self._on_closed = on_closed
+        self._commands: dict[int, str] = {}
+        self._condition = threading.Condition()
+        self._responses: deque[_Response] = deque()
+        self._closed = False
+        self._threads = [
+            threading.Thread(target=target, daemon=True)
+            for target in (self._relay_requests, self._receive_responses, self._deliver)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def close(self) -> None:
+        """Drops the connections and waits until the relaying threads closed them."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        self._shutdown()
+        for thread in self._threads:
+            thread.join()
+
+    def _relay_requests(self) -> None:
+        """Forwards the requests of the client, noting the command of each tag."""
+        decoder = FrameDecoder()
+        with suppress(OSError, FrameDecoder.DecodeError):
+            while data := self._client.recv(65536):  # pylint: disable=while-used
+                for frame in decoder.feed(data):
+                    command = frame.payload.partition(b" ")[0]
+                    self._commands[frame.tag] = command.decode("utf-8", "replace")
+                self._upstream.sendall(data)
+        with suppress(OSError):
+            self._upstream.shutdown(socket_module.SHUT_WR)
+
+    def _receive_responses(self) -> None:
+        """Schedules the responses of the server for delivery."""
+        decoder = FrameDecoder()
+        with suppress(OSError, FrameDecoder.DecodeError):
+            while data := self._upstream.recv(65536):  # pylint: disable=while-used
+                received_at = time.perf_counter()
+                for frame in decoder.feed(data):
+                    drop = self._rng.random() < self._profile.drop_rate
+                    self._schedule(
+                        received_at
+                        + self._profile.delay(
+                            self._commands.get(frame.tag, ""), self._rng
+                        ),
+                        None if drop else FrameEncoder.encode(*frame),
+                    )
+        self._schedule(time.perf_counter(), None)
+
+    def _schedule(self, due: float, data: bytes | None) -> None:
+        """Queues a response behind the earlier ones.
+
+        Args:
+            due: The performance counter in seconds when the response is delivered.
+            data: The encoded response, or None to close the connection.
+
+        """
+        with self._condition:
+            if self._responses:
+                due = max(due, self._responses[-1].due)
+            self._responses.append(_Response(due, data))
+            self._condition.notify()
+
+    def _deliver(self) -> None:
+        """Sends the responses once due, then closes both connections."""
+        closing = False
+        with suppress(OSError):
+            while not closing:  # pylint: disable=while-used
+                batch, closing = self._next_batch()
+                self._send(batch)
+        self._shutdown()
+        for thread in self._threads:
+            if thread is not threading.current_thread():
+                thread.join()
+        self._client.close()
+        self._upstream.close()
+        self._on_closed(self)
+
+    def _next_batch(self) -> tuple[bytes, bool]:
+        """Waits for the next due responses.
+
+        Returns:
+            tuple: The responses due within the coalescing window, and whether the
+                connection is to be closed after them.
+
+        """
+        with self._condition:
+            self._condition.wait_for(lambda: self._responses or self._closed)
+            if not self._closed:
+                self._condition.wait_for(
+                    lambda: self._closed,
+                    self._responses[0].due
+                    + self._profile.coalesce
+                    - time.perf_counter(),
+                )
+            if self._closed:
+                return b"", True
+            batch = bytearray()
+            # pylint: disable-next=while-used
+            while self._responses and self._responses[0].due <= time.perf_counter():
+                if (data := self._responses.popleft().data) is None:
+                    return bytes(batch), True
+                batch += data
+        return bytes(batch), False
+
+    def _send(self, data: bytes) -> None:
+        """Sends responses to the client, split into segments if configured.
+
+        Args:
+            data: The encoded responses.
+
+        """
+        if self._profile.segment_size is None:
+            self._client.sendall(data)
+            return
+        for offset in range(0, len(data), self._profile.segment_size):
+            self._client.sendall(data[offset : offset + self._profile.segment_size])
+            time.sleep(SEGMENT_GAP)
+
+    def _shutdown(self) -> None:
+        """Shuts down both connections."""
+        for connection in (self._client, self._upstream):
+            with suppress(OSError):
+                connection.shutdown(socket_module.SHUT_RDWR)
+
+
+class FaultInjectingProxy:
+    """TCP proxy injecting network faults between a peary client and server.
+
+    Each accepted connection is relayed to the server while the responses are
+    delayed, jittered, split into segments, coalesced or dropped as given by the
+    profile, so timeouts and pipelining can be stressed offline, i.e.
+
+        with (
+            MockPearyServer() as server,
+            FaultInjectingProxy(server.address, peary_fault_proxy.WAN) as proxy,
+            PearyClient(*proxy.address) as client,
+        ):
+            # every request takes about 50 ms
+
+    """
+
+    def __init__(
+        self,
+        upstream: tuple[str, int],
+        profile: FaultProfile = FaultProfile(),  # noqa: B008
+        *,
+        seed: int | None = None,
+    ) -> None:
+        """Initializes a new fault injecting proxy listening on a free port.
+
+        Args:
+            upstream: The host and port of the peary server.
+            profile: The injected faults. Defaults to none.
+            seed: Seed of the jitter and dropped connections. Defaults to random.
+
+        """
+        self._upstream = upstream
+        self._profile = profile
+        self._rng = random.Random(seed)  # noqa: S311
+        self._listener = socket_module.create_server(("127.0.0.1", 0))
+        self._thread = threading.Thread(target=self._accept, daemon=True)
+        self._lock = threading.Lock()
+        self._links: set[_FaultyLink] = set()
+
+    @property
+    def address(self) -> tuple[str, int]:
+        """Returns the host and port the proxy listens on."""
+        host, port = self._listener.getsockname()[:2]
+        return host, port
+
+    @property
+    def connections(self) -> int:
+        """Returns the number of relayed connections that are still open."""
+        with self._lock:
+            return len(self._links)
+
+    @property
+    def profile(self) -> FaultProfile:
+        """Returns the injected faults."""
+        return self._profile
+
+    def start(self) -> None:
+        """Starts relaying connections to the server."""
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stops relaying and drops the open connections."""
+        with suppress(OSError):
+            self._listener.shutdown(socket_module.SHUT_RDWR)
+        self._listener.close()
+        if self._thread.is_alive():
+            self._thread.join()
+        with self._lock:
+            links = [*self._links]
+        for link in links:
+            link.close()
+
+    def _accept(self) -> None:
+        """Relays each accepted connection to the server until stopped."""
+        while True:  # pylint: disable=while-used
+            try:
+                client, _ = self._listener.accept()
+            except OSError:
+                return
+            try:
+                upstream = socket_module.create_connection(self._upstream)
+            except OSError:
+                client.close()
+                continue
+            for connection in (client, upstream):
+                connection.setsockopt(
+                    socket_module.IPPROTO_TCP, socket_module.TCP_NODELAY, 1
+                )
+            with self._lock:
+                self._links.add(
+                    _FaultyLink(
+                        client, upstream, self._profile, self._rng, self._forget
+                    )
+                )
+
+    def _forget(self, link: _FaultyLink) -> None:
+        """Forgets a relayed connection once it is closed.
+
+        Args:
+            link: The closed link.
+
+        """
+        with self._lock:
+            self._links.discard(link)
+
+    def __enter__(self) -> Self:
+        """Starts relaying connections to the server.
+
+        Returns:
+            FaultInjectingProxy: The started proxy.
+
+        """
+        self.start()
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        """Stops the proxy.
+
+        Args:
+            _: Catches the usued arguments required for the __exit__ function.
+
+        """
+        self.stop()
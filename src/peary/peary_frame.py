@@ -0,0 +1,292 @@
+from __future__ import annotations
+
+import struct
+from typing import TYPE_CHECKING, NamedTuple
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from typing_extensions import Buffer
+
+STRUCT_HEADER = struct.Struct("!HH")
+STRUCT_LENGTH = struct.Struct("!L")
+FRAME_OVERHEAD = STRUCT_LENGTH.size + STRUCT_HEADER.size
+
+
+class DecodedBytes(NamedTuple):
+    """Return type for decoded bytes."""
+
+    payload: bytes
+    tag: int
+    status: int
+
+
+class DecodedView(NamedTuple):
+    """Return type for decoded frames referencing their payload without a copy."""
+
+    payload: memoryview
+    tag: int
+    status: int
+
+
+class FrameEncoder:
+    """Socket-free encoder for the peary wire format.
+
+    Frames written to the encoder are collected until the outgoing data is taken
+    by the transport, i.e.
+
+        encoder = FrameEncoder()
+        encoder.write(b"protocol_version", 1, 0)
+        sock.sendall(encoder.data_to_send())
+
+    """
+
+    def __init__(self) -> None:
+        """Initializes a new frame encoder."""
+        self._buffer = bytearray()
+
+    @staticmethod
+    def encode(payload: bytes, tag: int, status: int) -> bytes:
+        """Encodes a single frame into a sequence of bytes.
+
+        Args:
+            payload: The data payload encoded into the sequence.
+            tag: Identifier encoded into the sequence.
+            status: Status encoded into the sequence.
+
+        Returns:
+            bytes: The encoded sequence of bytes.
+
+        """
+        header = STRUCT_HEADER.pack(tag, status)
+        length = STRUCT_LENGTH.pack(len(header) + len(payload))
+        return b"".join([length, header, payload])
+
+    @staticmethod
+    def encode_many(frames: Iterable[tuple[bytes, int, int]]) -> bytearray:
+        """Encodes a burst of frames into a single preallocated buffer.
+
+        The length prefix and header of each frame are packed in place, so a burst
+        of requests is sent with a single call instead of one call per frame.
+
+        Args:
+            frames: The payload, tag and status of each frame.
+
+        Returns:
+            bytearray: The encoded frames, in order.
+
+        """
+        frames = [*frames]
+        buffer = bytearray(
+            sum(FRAME_OVERHEAD + len(payload) for payload, _, _ in frames)
+        )
+        offset = 0
+        for payload, tag, status in frames:
+            STRUCT_LENGTH.pack_into(buffer, offset, STRUCT_HEADER.size + len(payload))
+            STRUCT_HEADER.pack_into(buffer, offset + STRUCT_LENGTH.size, tag, status)
+            offset += FRAME_OVERHEAD
+            buffer[offset : offset + len(payload)] = payload
+            offset += len(payload)
+        return buffer
+
+    def write(self, payload: bytes, tag: int, status: int) -> None:
+        """Encodes a frame and appends it to the outgoing data.
+
+        Args:
+            payload: The data payload encoded into the frame.
+            tag: Identifier encoded into the frame.
+            status: Status encoded into the frame.
+
+        """
+        self._buffer += FrameEncoder.encode(payload, tag, status)
+
+    def data_to_send(self) -> bytes:
+        """Takes all outgoing data written since the previous call.
+
+        Returns:
+            bytes: The encoded frames ready to be sent.
+
+        """
+        data = bytes(self._buffer)
+        self._buffer.clear()
+        return data
+
+
+class FrameDecoder:
+    """Socket-free incremental decoder for the peary wire format.
+
+    The decoder accepts arbitrary chunks of a byte stream and returns the frames
+    completed by each chunk. Data can either be pushed with `feed`, or be received
+    directly into the decoder with `get_buffer` and `buffer_updated`. The latter
+    exposes a preallocated buffer sized exactly to the rest of the current frame
+    once its length prefix is known, so large frames are received without copies.
+
+        decoder = FrameDecoder()
+        for frame in decoder.feed(sock.recv(4096)):
+            # do something with the frame
+
+    """
+
+    class DecodeError(Exception):
+        """Exception for failing decode."""
+
+    def __init__(self) -> None:
+        """Initializes a new frame decoder."""
+        self._prefix = bytearray()
+        self._frame: bytearray | None = None
+        self._received = 0
+        self._chunk = bytearray()
+
+    @property
+    def pending(self) -> int:
+        """Returns the number of buffered bytes of the incomplete frame."""
+        if self._frame is None:
+            return len(self._prefix)
+        return STRUCT_LENGTH.size + self._received
+
+    @staticmethod
+    def decode(data: bytes) -> DecodedBytes:
+        """Decodes a single complete frame.
+
+        Args:
+            data: The encoded bytes
+
+        Returns:
+            A tuple containing the response message, response id, and response status.
+
+        Raises:
+            DecodeError: If data does not contain exactly one frame.
+
+        """
+        payload, tag, status = FrameDecoder.decode_view(data)
+        return DecodedBytes(payload.tobytes(), tag, status)
+
+    @staticmethod
+    def decode_view(data: Buffer) -> DecodedView:
+        """Decodes a single complete frame without copying its payload.
+
+        The returned payload is a view into `data`, so it is only valid as long as
+        `data` is not modified. Use `payload.tobytes()` for an independent copy.
+
+        Args:
+            data: The encoded bytes, e.g. a bytearray or memoryview.
+
+        Returns:
+            A tuple containing the payload view, response id, and response status.
+
+        Raises:
+            DecodeError: If data does not contain exactly one frame.
+
+        """
+        view = memoryview(data).cast("B")
+        if len(view) < STRUCT_LENGTH.size:
+            raise FrameDecoder.DecodeError(f"Insufficent number of bytes: {len(view)}.")
+        (length,) = STRUCT_LENGTH.unpack_from(view)
+
+        if len(view) != (STRUCT_LENGTH.size + length):
+            raise FrameDecoder.DecodeError("Incorrect number of bytes")
+        tag, status = STRUCT_HEADER.unpack_from(view, STRUCT_LENGTH.size)
+        return DecodedView(view[STRUCT_LENGTH.size + STRUCT_HEADER.size :], tag, status)
+
+    def feed(self, data: Buffer) -> list[DecodedBytes]:
+        """Adds a chunk of the byte stream to the decoder.
+
+        Args:
+            data: The next chunk of the byte stream.
+
+        Returns:
+            list: The frames completed by the chunk, in stream order.
+
+        Raises:
+            DecodeError: If a length prefix announces an invalid frame length.
+
+        """
+        frames = []
+        with memoryview(data) as view:
+            offset = 0
+            while offset < len(view):  # pylint: disable=while-used
+                if self._frame is None:
+                    needed = STRUCT_LENGTH.size - len(self._prefix)
+                    chunk = view[offset : offset + needed]
+                    self._prefix += chunk
+                    offset += len(chunk)
+                    self._start_frame()
+                else:
+                    needed = len(self._frame) - self._received
+                    chunk = view[offset : offset + needed]
+                    self._frame[self._received : self._received + len(chunk)] = chunk
+                    self._received += len(chunk)
+                    offset += len(chunk)
+                if (frame := self._finish_frame()) is not None:
+                    frames.append(frame)
+        return frames
+
+    def get_buffer(self, size_hint: int = 4096) -> memoryview:
+        """Returns a writable buffer for receiving the next chunk of the stream.
+
+        While the length prefix of a frame is outstanding a reusable buffer of the
+        hinted size is returned. Afterwards the buffer is a view into the frame
+        itself covering exactly the bytes still missing.
+
+        Args:
+            size_hint: Size of the buffer used while reading the length prefix.
+
+        Returns:
+            memoryview: The buffer to be filled and reported by `buffer_updated`.
+
+        """
+        if self._frame is not None:
+            return memoryview(self._frame)[self._received :]
+        if len(self._chunk) != size_hint:
+            self._chunk = bytearray(size_hint)
+        return memoryview(self._chunk)
+
+    def buffer_updated(self, nbytes: int) -> list[DecodedBytes]:
+        """Reports the number of bytes written into the buffer from `get_buffer`.
+
+        Args:
+            nbytes: Number of bytes written into the buffer.
+
+        Returns:
+            list: The frames completed by the new bytes, in stream order.
+
+        """
+        if self._frame is None:
+            with memoryview(self._chunk) as chunk:
+                return self.feed(chunk[:nbytes])
+        self._received += nbytes
+        if (frame := self._finish_frame()) is not None:
+            return [frame]
+        return []
+
+    def _start_frame(self) -> None:
+        """Allocates the frame buffer once the length prefix is complete.
+
+        Raises:
+            DecodeError: If the length prefix announces an invalid frame length.
+
+        """
+        if len(self._prefix) < STRUCT_LENGTH.size:
+            return
+        (length,) = STRUCT_LENGTH.unpack(self._prefix)
+        if length < STRUCT_HEADER.size:
+            raise FrameDecoder.DecodeError(f"Invalid frame length: {length}")
+        self._prefix.clear()
+        self._frame = bytearray(length)
+        self._received = 0
+
+    def _finish_frame(self) -> DecodedBytes | None:
+        """Decodes the current frame if all of its bytes have been received.
+
+        Returns:
+            DecodedBytes | None: The completed frame or None if still incomplete.
+
+        """
+        if self._frame is None or self._received < len(self._frame):
+            return None
+        tag, status = STRUCT_HEADER.unpack_from(self._frame)
+        with memoryview(self._frame) as view:
+            payload = bytes(view[STRUCT_HEADER.size :])
+        self._frame = None
+        self._received = 0
+        return DecodedBytes(payload, tag, status)
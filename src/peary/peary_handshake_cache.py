@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import threading
+import time
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Hashable
+
+
+class HandshakeCache:
+    """Remembers the protocol versions verified with peary servers for a while.
+
+    Clients sharing a cache skip the protocol_version round-trip when reconnecting
+    to a server verified within the time to live, i.e.
+
+        cache = HandshakeCache(ttl=60)
+        with PearyClient(host, handshake_cache=cache) as proxy:
+            # the version is verified together with the first request
+        with PearyClient(host, handshake_cache=cache) as proxy:
+            # the version check is skipped
+
+    """
+
+    def __init__(
+        self, ttl: float = 300, *, clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        """Initializes a new handshake cache.
+
+        Args:
+            ttl: Seconds a verified version is trusted. Defaults to 300.
+            clock: Returns the current time in seconds. Defaults to time.monotonic.
+
+        Raises:
+            ValueError: If the time to live is not positive.
+
+        """
+        if ttl <= 0:
+            raise ValueError(f"Invalid handshake cache ttl: {ttl}")
+        self._ttl = ttl
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: dict[Hashable, tuple[bytes, float]] = {}
+
+    @property
+    def ttl(self) -> float:
+        """Returns the seconds a verified version is trusted."""
+        return self._ttl
+
+    def lookup(self, key: Hashable) -> bytes | None:
+        """Returns the version verified with a peary server unless it expired.
+
+        Args:
+            key: Identifies the peary server, e.g. the key of its transport.
+
+        Returns:
+            bytes: The verified version, or None if unknown or expired.
+
+        """
+        with self._lock:
+            if (entry := self._entries.get(key)) is None:
+                return None
+            version, verified_at = entry
+            if self._clock() - verified_at >= self._ttl:
+                del self._entries[key]
+                return None
+            return version
+
+    def store(self, key: Hashable, version: bytes) -> None:
+        """Records a version verified with a peary server.
+
+        Args:
+            key: Identifies the peary server, e.g. the key of its transport.
+            version: The verified protocol version.
+
+        """
+        with self._lock:
+            self._entries[key] = (version, self._clock())
+
+    def invalidate(self, key: Hashable) -> None:
+        """Forgets the version verified with a peary server.
+
+        Args:
+            key: Identifies the peary server, e.g. the key of its transport.
+
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Forgets all verified versions."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        """Returns the number of cached versions.
+
+        Returns:
+            int: The number of cached versions, including expired ones.
+
+        """
+        return len(self._entries)
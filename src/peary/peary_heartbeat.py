@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import threading
+import time
+from typing import TYPE_CHECKING
+
+from peary.peary_protocol import PearyProtocol
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from typing_extensions import Self
+
+    from peary.peary_proxy import PearyProxy
+    from peary.peary_timeout import RttEstimator
+
+
+class PearyHeartbeat:
+    """Background keep-alive measuring the round-trip time to a peary server.
+
+    A daemon thread sends a keep-alive message every interval and feeds the measured
+    round-trip times to an estimator, e.g. the one of an adaptive timeout. The first
+    keep-alive that fails stops the heartbeat and reports the dead link, i.e.
+
+        timeout = AdaptiveTimeout()
+        with (
+            PearyClient(
+                host, protocol_class=PearyMultiplexProtocol, timeout=timeout
+            ) as proxy,
+            PearyHeartbeat(proxy, timeout.estimator) as heartbeat,
+        ):
+            # heartbeat.alive turns False once the link is dead
+
+    The keep-alive messages are sent from the heartbeat thread, so the proxy must be
+    connected with a thread-safe protocol such as PearyMultiplexProtocol.
+
+    """
+
+    FAILURES = (
+        OSError,
+        PearyProtocol.RequestSendError,
+        PearyProtocol.ResponseReceiveError,
+        PearyProtocol.ResponseStatusError,
+    )
+
+    def __init__(
+        self,
+        proxy: PearyProxy,
+        estimator: RttEstimator,
+        *,
+        interval: float = 1,
+        on_failure: Callable[[Exception], object] | None = None,
+    ) -> None:
+        """Initializes a new heartbeat.
+
+        Args:
+            proxy: Proxy of the peary server connected with a thread-safe protocol.
+            estimator: Estimator fed with the measured round-trip times.
+            interval: Seconds between keep-alive messages. Defaults to 1.
+            on_failure: Called from the heartbeat thread with the error of the
+                failed keep-alive.
+
+        """
+        self._proxy = proxy
+        self._estimator = estimator
+        self._interval = interval
+        self._on_failure = on_failure
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._error: Exception | None = None
+
+    @property
+    def alive(self) -> bool:
+        """Returns whether the heartbeat is running without a failed keep-alive."""
+        return self._thread.is_alive() and self._error is None
+
+    @property
+    def error(self) -> Exception | None:
+        """Returns the error of the failed keep-alive, or None."""
+        return self._error
+
+    def start(self) -> None:
+        """Starts sending keep-alive messages."""
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stops sending keep-alive messages and waits for the heartbeat thread."""
+        self._stopped.set()
+        if self._thread.ident is not None:
+            self._thread.join()
+
+    def _run(self) -> None:
+        """Sends keep-alive messages until stopped or a keep-alive failed."""
+        while not self._stopped.wait(self._interval):  # pylint: disable=while-used
+            start = time.perf_counter()
+            try:
+                self._proxy.keep_alive()
+            except PearyHeartbeat.FAILURES as e:
+                self._error = e
+                if self._on_failure is not None:
+                    self._on_failure(e)
+                return
+            self._estimator.update(time.perf_counter() - start)
+
+    def __enter__(self) -> Self:
+        """Starts sending keep-alive messages.
+
+        Returns:
+            PearyHeartbeat: The started heartbeat.
+
+        """
+        self.start()
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        """Stops sending keep-alive messages.
+
+        Args:
+            _: Catches the usued arguments required for the __exit__ function.
+
+        """
+        self.stop()
@@ -0,0 +1,304 @@
+from __future__ import annotations
+
+import threading
+import time
+from typing import TYPE_CHECKING
+
+from peary.peary_frame import FrameEncoder
+from peary.peary_protocol import PearyProtocol
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping
+
+    from peary.peary_frame import DecodedBytes
+
+_ADD_DEVICE = "add_device"
+_CLEAR_DEVICES = "clear_devices"
+_DEVICE_PREFIX = "device."
+_LIST_DEVICES = "list_devices"
+_PROTOCOL_VERSION = "protocol_version"
+
+_CAMEL_CASE_COMMANDS = {
+    "setInputCMOSLevel": "set_input_cmos_level",
+    "setOutputCMOSLevel": "set_output_cmos_level",
+}
+
+
+class MockPearyDevice:  # pylint: disable=too-many-instance-attributes
+    """In-memory model of a device added to a peary server.
+
+    The state changed by the device commands is kept in public attributes, so tests
+    can set it up and inspect it directly. Commands named in camel case by the
+    Caribou software, e.g. setInputCMOSLevel, are served as well.
+
+    """
+
+    class CommandError(Exception):
+        """Exception for device commands the device cannot execute."""
+
+    def __init__(self, name: str, registers: Mapping[str, int] | None = None) -> None:
+        """Initializes a new device model.
+
+        Args:
+            name: The name of the device, e.g. SpacelyCaribouBasic.
+            registers: The registers of the device with their value after a reset.
+
+        """
+        self.name = name
+        self.reset_registers = {**(registers or {})}
+        self.registers = {**self.reset_registers}
+        self.memory: dict[str, int] = {}
+        self.voltages: dict[str, float] = {}
+        self.currents: dict[str, float] = {}
+        self.switches: dict[str, bool] = {}
+        self.i2c: dict[tuple[int, int, int], int] = {}
+        self.powered = False
+        self.running = False
+
+    def execute(self, cmd: str, *args: str) -> bytes:
+        """Executes a device command.
+
+        Args:
+            cmd: The command without the device prefix, e.g. get_voltage.
+            *args: The arguments following the device index.
+
+        Returns:
+            bytes: The response payload.
+
+        Raises:
+            CommandError: If the command is unknown or its arguments are invalid.
+
+        """
+        cmd = _CAMEL_CASE_COMMANDS.get(cmd, cmd)
+        if cmd.startswith("_") or (command := getattr(self, f"_{cmd}", None)) is None:
+            raise MockPearyDevice.CommandError(f"Unknown device command: {cmd}")
+        try:
+            result = command(*args)
+        except (KeyError, TypeError, ValueError) as e:
+            raise MockPearyDevice.CommandError(
+                f"Invalid arguments of {cmd}: {args}"
+            ) from e
+        return str(result).encode("utf-8") if result is not None else b""
+
+    def _name(self) -> str:
+        """Returns the name of the device."""
+        return self.name
+
+    def _power_on(self) -> None:
+        """Powers the device on."""
+        self.powered = True
+
+    def _power_off(self) -> None:
+        """Powers the device off."""
+        self.powered = False
+
+    def _reset(self) -> None:
+        """Restores the reset values of the registers."""
+        self.registers = {**self.reset_registers}
+
+    def _configure(self) -> None:
+        """Configures the device with the reset values of the registers."""
+        self._reset()
+
+    def _daq_start(self) -> None:
+        """Starts the data acquisition."""
+        self.running = True
+
+    def _daq_stop(self) -> None:
+        """Stops the data acquisition."""
+        self.running = False
+
+    def _list_registers(self) -> str:
+        """Returns the names of the registers."""
+        return " ".join(self.registers)
+
+    def _get_register(self, name: str) -> int:
+        """Returns the value of a register."""
+        return self.registers[name]
+
+    def _set_register(self, name: str, value: str) -> None:
+        """Sets the value of an existing register."""
+        if name not in self.registers:
+            raise KeyError(name)
+        self.registers[name] = int(value, 0)
+
+    def _get_memory(self, name: str) -> int:
+        """Returns the value of a memory location."""
+        return self.memory.get(name, 0)
+
+    def _set_memory(self, name: str, value: str) -> None:
+        """Sets the value of a memory location."""
+        self.memory[name] = int(value, 0)
+
+    def _get_voltage(self, name: str) -> float:
+        """Returns the voltage of a supply."""
+        return self.voltages.get(name, 0.0)
+
+    def _set_voltage(self, name: str, value: str) -> None:
+        """Sets the voltage of a supply."""
+        self.voltages[name] = float(value)
+
+    def _get_current(self, name: str) -> float:
+        """Returns the current of a supply."""
+        return self.currents.get(name, 0.0)
+
+    def _set_current(self, name: str, value: str) -> None:
+        """Sets the current of a supply."""
+        self.currents[name] = float(value)
+
+    def _switch_on(self, name: str) -> None:
+        """Switches a supply on."""
+        self.switches[name] = True
+
+    def _switch_off(self, name: str) -> None:
+        """Switches a supply off."""
+        self.switches[name] = False
+
+    def _set_input_cmos_level(self, value: str) -> None:
+        """Sets the logic level of the CMOS inputs."""
+        self.voltages["CMOS_LEVEL_IN"] = float(value)
+
+    def _set_output_cmos_level(self, value: str) -> None:
+        """Sets the logic level of the CMOS outputs."""
+        self.voltages["CMOS_LEVEL_OUT"] = float(value)
+
+    def _car_i2c_write(self, bus: str, address: str, register: str, *data: str) -> None:
+        """Writes consecutive registers of a component on an I2C bus."""
+        for offset, value in enumerate(data):
+            self.i2c[int(bus, 0), int(address, 0), int(register, 0) + offset] = int(
+                value, 0
+            )
+
+    def _car_i2c_read(self, bus: str, address: str, register: str, count: str) -> str:
+        """Reads consecutive registers of a component on an I2C bus."""
+        return " ".join(
+            str(self.i2c.get((int(bus, 0), int(address, 0), int(register, 0) + ii), 0))
+            for ii in range(int(count, 0))
+        )
+
+
+class MockPearyModel:
+    """In-memory model of a peary server answering request frames.
+
+    The model answers the protocol_version, add_device, list_devices and
+    clear_devices requests and forwards the device.* requests to the devices, e.g.
+    device.car_i2c_read. Every response can be delayed to inject latency, either
+    by a fixed number of seconds or per command, i.e.
+
+        model = MockPearyModel(
+            {"SpacelyCaribouBasic": {"vref": 0}},
+            latency=lambda cmd: 0.05 if cmd == "device.configure" else 0.001,
+        )
+        with MockPearyServer(model) as server:
+            with PearyClient(*server.address) as proxy:
+                # do something with the proxy
+
+    The model is a handler of a LoopbackTransport as well.
+
+    """
+
+    STATUS_FAILED = 1
+
+    def __init__(
+        self,
+        registers: Mapping[str, Mapping[str, int]] | None = None,
+        *,
+        latency: float | Callable[[str], float] = 0,
+    ) -> None:
+        """Initializes a new peary server model without devices.
+
+        Args:
+            registers: The registers of the added devices by device name.
+            latency: Seconds every response is delayed by, or returns the delay of a
+                request given its command. Defaults to 0.
+
+        """
+        self._registers = {**(registers or {})}
+        self._latency = latency
+        self._lock = threading.Lock()
+        self.devices: list[MockPearyDevice] = []
+        self.requests = 0
+
+    def respond(self, frame: DecodedBytes) -> tuple[bytes, float]:
+        """Answers a request frame.
+
+        Args:
+            frame: The decoded request.
+
+        Returns:
+            tuple: The encoded response and the seconds it is to be delayed by.
+
+        """
+        msg, *args = frame.payload.decode("utf-8").split(" ")
+        try:
+            payload, status = self.handle(msg, *args), PearyProtocol.STATUS_OK
+        except (MockPearyDevice.CommandError, IndexError, ValueError) as e:
+            payload, status = str(e).encode("utf-8"), MockPearyModel.STATUS_FAILED
+        delay = self._latency(msg) if callable(self._latency) else self._latency
+        return FrameEncoder.encode(payload, frame.tag, status), delay
+
+    def handle(self, msg: str, *args: str) -> bytes:
+        """Executes a request.
+
+        Args:
+            msg: The request message.
+            *args: Additional message arguments.
+
+        Returns:
+            bytes: The response payload.
+
+        Raises:
+            CommandError: If the request is unknown or its arguments are invalid.
+
+        """
+        with self._lock:
+            self.requests += 1
+            if msg.startswith(_DEVICE_PREFIX):
+                index, *device_args = args
+                return self.devices[int(index)].execute(
+                    msg[len(_DEVICE_PREFIX) :], *device_args
+                )
+            return self._handle_host(msg, *args)
+
+    def _handle_host(self, msg: str, *args: str) -> bytes:
+        """Executes a request that is not addressed to a device.
+
+        Args:
+            msg: The request message.
+            *args: Additional message arguments.
+
+        Returns:
+            bytes: The response payload.
+
+        Raises:
+            CommandError: If the request is unknown.
+
+        """
+        if not msg:
+            return b""
+        if msg == _PROTOCOL_VERSION:
+            return PearyProtocol.VERSION
+        if msg == _ADD_DEVICE:
+            (name,) = args
+            self.devices.append(MockPearyDevice(name, self._registers.get(name)))
+            return str(len(self.devices) - 1).encode("utf-8")
+        if msg == _LIST_DEVICES:
+            return " ".join(device.name for device in self.devices).encode("utf-8")
+        if msg == _CLEAR_DEVICES:
+            self.devices.clear()
+            return b""
+        raise MockPearyDevice.CommandError(f"Unknown command: {msg}")
+
+    def __call__(self, frame: DecodedBytes) -> bytes:
+        """Answers a request frame after its latency.
+
+        Args:
+            frame: The decoded request.
+
+        Returns:
+            bytes: The encoded response.
+
+        """
+        response, delay = self.respond(frame)
+        time.sleep(delay)
+        return response
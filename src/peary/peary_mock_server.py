@@ -0,0 +1,248 @@
+from __future__ import annotations
+
+import socket as socket_module
+import threading
+import time
+from contextlib import suppress
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from peary.peary_frame import FrameDecoder
+from peary.peary_mock import MockPearyModel
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+    from typing_extensions import Self
+
+    from peary.peary_frame import DecodedBytes
+
+
+class MockPearyServer:
+    """Threaded TCP server speaking the peary wire format for tests and benchmarks.
+
+    Every connection is served by its own thread from a shared in-memory model, so
+    real framing, pipelining and concurrent clients are exercised, i.e.
+
+        with MockPearyServer(MockPearyModel(latency=0.001)) as server:
+            with PearyClient(*server.address) as proxy:
+                device = proxy.add_device("SpacelyCaribouBasic")
+
+    The injected latency delays each response from the arrival of its request, so
+    pipelined requests overlap their latencies like on a real server. Tests of the
+    wire format can answer the frames with a handler instead of the model, and
+    co-located clients can connect over a Unix domain socket, i.e.
+
+        with MockPearyServer(handler=echo, path="/tmp/peary.sock") as server:
+            with PearyClient(transport=UnixTransport(server.path)) as proxy:
+                # do something with the proxy
+
+    """
+
+    def __init__(
+        self,
+        model: MockPearyModel | None = None,
+        *,
+        host: str = "127.0.0.1",
+        path: str | None = None,
+        handler: Callable[[DecodedBytes], bytes | None] | None = None,
+    ) -> None:
+        """Initializes a new mock peary server listening on a free port.
+
+        Args:
+            model: The model answering the requests. Defaults to a model without
+                registers or latency.
+            host: The address the server listens on. Defaults to 127.0.0.1.
+            path: Filesystem path of a Unix domain socket listened on instead of a
+                port of the host.
+            handler: Returns the encoded response of a request frame, or None to
+                close the connection, instead of the model.
+
+        """
+        self._model = model if model is not None else MockPearyModel()
+        self._handler = handler
+        self._path = path
+        self._listener = (
+            socket_module.create_server((host, 0))
+            if path is None
+            else MockPearyServer._listen_unix(path)
+        )
+        self._thread = threading.Thread(target=self._accept, daemon=True)
+        self._lock = threading.Lock()
+        self._connections: dict[socket_module.socket, threading.Thread] = {}
+
+    @property
+    def address(self) -> tuple[str, int]:
+        """Returns the host and port the server listens on over TCP."""
+        host, port = self._listener.getsockname()[:2]
+        return host, port
+
+    @property
+    def path(self) -> str | None:
+        """Returns the path of the Unix domain socket, or None if served over TCP."""
+        return self._path
+
+    @property
+    def connections(self) -> int:
+        """Returns the number of open connections."""
+        with self._lock:
+            return len(self._connections)
+
+    @property
+    def model(self) -> MockPearyModel:
+        """Returns the model answering the requests."""
+        return self._model
+
+    @staticmethod
+    def _listen_unix(path: str) -> socket_module.socket:
+        """Listens on a Unix domain socket.
+
+        Args:
+            path: Filesystem path of the socket.
+
+        Returns:
+            socket: The listening socket.
+
+        Raises:
+            OSError: If the socket cannot be bound to the path.
+
+        """
+        listener = socket_module.socket(
+            socket_module.AF_UNIX, socket_module.SOCK_STREAM
+        )
+        try:
+            listener.bind(path)
+        except OSError:
+            listener.close()
+            raise
+        listener.listen()
+        return listener
+
+    def start(self) -> None:
+        """Starts accepting connections."""
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stops accepting connections and closes the open ones."""
+        with suppress(OSError):
+            self._listener.shutdown(socket_module.SHUT_RDWR)
+        self._listener.close()
+        if self._path is not None:
+            Path(self._path).unlink(missing_ok=True)
+        if self._thread.ident is not None:
+            self._thread.join()
+        with self._lock:
+            connections = [*self._connections.items()]
+        for connection, thread in connections:
+            with suppress(OSError):
+                connection.shutdown(socket_module.SHUT_RDWR)
+            thread.join()
+
+    def _accept(self) -> None:
+        """Serves each accepted connection from its own thread until stopped."""
+        while True:  # pylint: disable=while-used
+            try:
+                connection, _ = self._listener.accept()
+            except OSError:
+                return
+            if self._path is None:
+                connection.setsockopt(
+                    socket_module.IPPROTO_TCP, socket_module.TCP_NODELAY, 1
+                )
+            thread = threading.Thread(
+                target=self._serve, args=(connection,), daemon=True
+            )
+            with self._lock:
+                self._connections[connection] = thread
+            thread.start()
+
+    def _serve(self, connection: socket_module.socket) -> None:
+        """Answers the requests of a connection and forgets it once it closes.
+
+        Args:
+            connection: The accepted connection.
+
+        """
+        try:
+            self._serve_requests(connection)
+        finally:
+            with self._lock:
+                self._connections.pop(connection, None)
+
+    def _serve_requests(self, connection: socket_module.socket) -> None:
+        """Answers the requests of a connection until it closes.
+
+        Args:
+            connection: The accepted connection.
+
+        """
+        decoder = FrameDecoder()
+        with connection, suppress(OSError):
+            while data := connection.recv(65536):  # pylint: disable=while-used
+                if not self._answer(connection, decoder.feed(data)):
+                    return
+
+    def _answer(
+        self, connection: socket_module.socket, frames: Iterable[DecodedBytes]
+    ) -> bool:
+        """Answers the frames received together, sending the responses in bursts.
+
+        The responses are sent together, unless a response is delayed, in which case
+        the ones before it are sent first.
+
+        Args:
+            connection: The accepted connection.
+            frames: The request frames received together.
+
+        Returns:
+            bool: Whether the connection stays open.
+
+        """
+        received_at = time.perf_counter()
+        responses: list[bytes] = []
+        for frame in frames:
+            response, delay = self._respond(frame)
+            if response is None:
+                connection.sendall(b"".join(responses))
+                return False
+            if (wait := received_at + delay - time.perf_counter()) > 0:
+                connection.sendall(b"".join(responses))
+                responses.clear()
+                time.sleep(wait)
+            responses.append(response)
+        connection.sendall(b"".join(responses))
+        return True
+
+    def _respond(self, frame: DecodedBytes) -> tuple[bytes | None, float]:
+        """Answers a request frame with the handler or else the model.
+
+        Args:
+            frame: The decoded request.
+
+        Returns:
+            tuple: The encoded response, or None to close the connection, and the
+                seconds it is to be delayed by.
+
+        """
+        if self._handler is not None:
+            return self._handler(frame), 0.0
+        return self._model.respond(frame)
+
+    def __enter__(self) -> Self:
+        """Starts accepting connections.
+
+        Returns:
+            MockPearyServer: The started server.
+
+        """
+        self.start()
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        """Stops the server.
+
+        Args:
+            _: Catches the usued arguments required for the __exit__ function.
+
+        """
+        self.stop()
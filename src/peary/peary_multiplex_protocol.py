@@ -0,0 +1,268 @@
+from __future__ import annotations
+
+import socket as socket_module
+import threading
+import time
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import TYPE_CHECKING
+
+from peary import peary_frame
+from peary.peary_protocol import PearyProtocol
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+
+    from peary.peary_frame import DecodedBytes
+    from peary.peary_timeout import AdaptiveTimeout
+    from peary.peary_transport import Connection
+
+
+class PearyMultiplexProtocol(PearyProtocol):
+    """Thread-safe protocol multiplexing requests from many threads on one socket.
+
+    A dedicated reader thread receives all responses and resolves a future per
+    request tag, so every thread can keep requests in flight without waiting for
+    the round-trips of the others. Use it as the protocol class of a client, i.e.
+
+        with PearyClient(host, protocol_class=PearyMultiplexProtocol) as proxy:
+            # share the proxy and its devices between threads
+
+    """
+
+    def __init__(
+        self,
+        socket: Connection,
+        *,
+        timeout: float | AdaptiveTimeout = 1,
+        checks: PearyProtocol.Checks = PearyProtocol.Checks.CHECK_VERSION,
+    ) -> None:
+        """Initializes a new multiplexing peary protocol.
+
+        Args:
+            socket: Socket connected to the remote peary server.
+            timeout: Response timeout value in seconds, or an adaptive timeout
+                applied per request. Defaults to 1.
+            checks: Checks performed during initialization. Defaults to CHECK_VERSION.
+
+        Raises:
+            VersionError: If protocol version doesn match with remote host.
+
+        """
+        self._lock = threading.Lock()
+        self._send_lock = threading.Lock()
+        self._pending: dict[int, Future[DecodedBytes]] = {}
+        self._reader = threading.Thread(target=self._read, daemon=True)
+        self._error: Exception | None = None
+        super().__init__(socket, timeout=timeout, checks=checks)
+
+    def request(self, msg: str, *args: str, buffer_size: int = 4096) -> bytes:
+        """Initiates a thread-safe requst to the connected peary server.
+
+        Args:
+            msg: The request message to be sent.
+            *args: Additiona message argumnets.
+            buffer_size: Unused, responses are received by the reader thread.
+
+        Returns:
+            bytes: The received response.
+
+        Raises:
+            ResponseStatusError: If response returns a failing status.
+
+        """
+        if self._version_pending:
+            return self._request_verifying_version(msg, *args, buffer_size=buffer_size)
+        del buffer_size
+        start = time.perf_counter_ns()
+        tag, future, size = self._submit([(msg, *args)])[0]
+        sent_at = time.perf_counter_ns()
+        try:
+            frame = self._wait_for(tag, future, msg)
+        except Exception:
+            self._stats.failed(msg, answered=False)
+            raise
+        response = self._account(msg, size, frame, sent_at - start, sent_at)
+        if isinstance(response, PearyProtocol.ResponseStatusError):
+            raise response
+        return response
+
+    def request_many(
+        self,
+        requests: Iterable[Sequence[str]],
+        *,
+        buffer_size: int = 4096,
+        window: int = 256,
+    ) -> list[bytes | PearyProtocol.ResponseStatusError]:
+        """Initiates a thread-safe pipelined batch of requests.
+
+        Args:
+            requests: Request messages, each followed by its additional arguments.
+            buffer_size: Unused, responses are received by the reader thread.
+            window: Maximum number of requests of the batch in flight.
+
+        Returns:
+            list: The response payload or status error for each request, in order.
+
+        Raises:
+            ValueError: If the window is not positive.
+
+        """
+        self.check_window(window)
+        if self._version_pending:
+            return self._request_many_verifying_version(
+                requests, buffer_size=buffer_size, window=window
+            )
+        del buffer_size
+        requests = [*requests]
+        responses: list[bytes | PearyProtocol.ResponseStatusError] = []
+        for start in range(0, len(requests), window):
+            batch = requests[start : start + window]
+            submitted_at = time.perf_counter_ns()
+            submitted = self._submit(batch)
+            sent_at = time.perf_counter_ns()
+            send_ns = (sent_at - submitted_at) // len(batch)
+            responses.extend(
+                self._account(
+                    msg, size, self._wait_for(tag, future, msg), send_ns, sent_at
+                )
+                for (msg, *_), (tag, future, size) in zip(batch, submitted)
+            )
+        return responses
+
+    def _submit(
+        self, requests: Sequence[Sequence[str]]
+    ) -> list[tuple[int, Future[DecodedBytes], int]]:
+        """Sends requests as one burst and registers the futures of their responses.
+
+        The futures are registered under the lock shared with the reader thread,
+        while the burst is sent under a separate send lock, so the reader keeps
+        draining responses while a large burst waits for the socket buffers. If the
+        burst fails to send, its tags and futures are released again.
+
+        Args:
+            requests: Request messages, each followed by its additional arguments.
+
+        Returns:
+            list: The tag, the future resolved with the response and the frame size
+                per request.
+
+        Raises:
+            ResponseReceiveError: If the reader thread stopped receiving.
+            RequestSendError: If the burst failed to send.
+
+        """
+        submitted = []
+        frames = []
+        with self._lock:
+            if self._error is not None:
+                raise PearyProtocol.ResponseReceiveError(
+                    "Failed to receive response."
+                ) from self._error
+            if self._reader.ident is None:
+                self._reader.start()
+            for msg, *args in requests:
+                tag = self._tags.acquire()
+                future: Future[DecodedBytes] = Future()
+                self._pending[tag] = future
+                payload = " ".join([msg, *args]).encode("utf-8")
+                frames.append((payload, tag, self.STATUS_OK))
+                submitted.append(
+                    (tag, future, len(payload) + peary_frame.FRAME_OVERHEAD)
+                )
+        try:
+            self._send_burst_locked(PearyProtocol.encode_many(frames))
+        except BaseException:
+            with self._lock:
+                for tag, future, _ in submitted:
+                    self._tags.release(tag)
+                    if self._pending.get(tag) is future:
+                        del self._pending[tag]
+            raise
+        return submitted
+
+    def _send_burst_locked(self, data: bytes | bytearray) -> None:
+        """Sends an encoded burst while no other thread sends.
+
+        Args:
+            data: The encoded requests.
+
+        """
+        with self._send_lock:
+            self._send(data)
+
+    def _wait_for(
+        self, tag: int, future: Future[DecodedBytes], msg: str
+    ) -> DecodedBytes:
+        """Waits for a response while applying the timeout of its request.
+
+        A request that times out keeps its tag in flight until its late response
+        has been received and dropped by the reader thread.
+
+        Args:
+            tag: The tag of the request.
+            future: The future registered for the response.
+            msg: The request message.
+
+        Returns:
+            DecodedBytes: The decoded response.
+
+        Raises:
+            socket.timeout: If the response is not received within the timeout.
+
+        """
+        try:
+            return future.result(self._timeout_for((msg,)))
+        except FutureTimeoutError as e:
+            raise socket_module.timeout("timed out") from e
+        finally:
+            with self._lock:
+                if self._pending.get(tag) is future:
+                    del self._pending[tag]
+
+    def _read(self) -> None:
+        """Receives responses until the connection stops.
+
+        When the connection stops all pending requests fail with it.
+
+        """
+        try:
+            self._dispatch_responses()
+        except (
+            OSError,
+            PearyProtocol.DecodeError,
+            PearyProtocol.ResponseReceiveError,
+        ) as e:
+            self._fail_pending(e)
+
+    def _dispatch_responses(self) -> None:
+        """Resolves the futures waiting for the received responses.
+
+        Responses whose request is no longer pending, e.g. after a timeout, are
+        dropped after releasing their tag. Socket timeouts while idle are ignored.
+
+        """
+        while True:  # pylint: disable=while-used
+            try:
+                frame = self._recv_frame(65536)
+            except socket_module.timeout:
+                continue
+            with self._lock:
+                self._tags.release(frame.tag)
+                future = self._pending.pop(frame.tag, None)
+            if future is not None:
+                future.set_result(frame)
+
+    def _fail_pending(self, error: Exception) -> None:
+        """Fails all pending requests after the connection stopped receiving.
+
+        Args:
+            error: The error that stopped the connection.
+
+        """
+        with self._lock:
+            self._error = error
+            pending = [*self._pending.values()]
+            self._pending.clear()
+        for future in pending:
+            future.set_exception(self.receive_error(error))
@@ -0,0 +1,183 @@
+from __future__ import annotations
+
+import itertools
+import queue
+import socket as socket_module
+from contextlib import ExitStack, contextmanager, suppress
+from typing import TYPE_CHECKING
+
+from peary.peary_client import PearyClient
+from peary.peary_multiplex_protocol import PearyMultiplexProtocol
+from peary.peary_proxy import PearyProxy
+from peary.peary_transport import TcpTransport
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Generator, Sequence
+
+    from peary.peary_protocol import PearyProtocol
+    from peary.peary_transport import Connection, Transport
+
+
+class PearyPoolProxy(PearyProxy):
+    """Proxy for a remote peary server reached through a pool of connections.
+
+    Added devices are assigned to the pooled channels in turn, so commands to
+    devices on different channels run in parallel. Threads can also borrow a
+    channel no other thread has borrowed, i.e.
+
+        with proxy.channel() as protocol:
+            protocol.request_many(requests)
+
+    A borrowed channel is still shared with the devices assigned to it, which is
+    safe with the thread-safe PearyMultiplexProtocol.
+
+    """
+
+    def __init__(self, protocols: Sequence[PearyProtocol]) -> None:
+        """Initializes a new pooled peary proxy.
+
+        Args:
+            protocols: Protocols connected to the same remote peary server.
+
+        """
+        super().__init__(protocols[0])
+        self._channels = tuple(protocols)
+        self._assignments = itertools.cycle(self._channels)
+        self._idle: queue.Queue[PearyProtocol] = queue.Queue()
+        for protocol in self._channels:
+            self._idle.put(protocol)
+
+    @property
+    def channels(self) -> tuple[PearyProtocol, ...]:
+        """Returns the protocols of the pooled connections."""
+        return self._channels
+
+    @contextmanager
+    def channel(self, timeout: float | None = None) -> Generator[PearyProtocol]:
+        """Borrows a pooled channel no other thread has borrowed.
+
+        Devices assigned to the channel keep using it while it is borrowed.
+
+        Args:
+            timeout: Seconds to wait for an idle channel. Defaults to waiting forever.
+
+        Yields:
+            PearyProtocol: The borrowed channel, returned to the pool afterwards.
+
+        """
+        protocol = self._idle.get(timeout=timeout)
+        try:
+            yield protocol
+        finally:
+            self._idle.put(protocol)
+
+    def _device_protocol(self) -> PearyProtocol:
+        """Returns the next pooled channel in turn for a newly added device."""
+        return next(self._assignments)
+
+
+class PearyClientPool:
+    """Connect to a remote peary server instance with a pool of connections.
+
+    Every pooled connection has passed the version handshake before the pool is
+    entered. The pool supports the context manager protocol, i.e.
+
+        with PearyClientPool(host='localhost', size=4) as proxy:
+            chips = [proxy.add_device(name) for name in names]
+            # commands to the chips now run in parallel from separate threads
+
+    """
+
+    PearySockerError = PearyClient.PearySockerError
+
+    def __init__(
+        self,
+        host: str = "localhost",
+        port: int = 12345,
+        *,
+        size: int = 4,
+        protocol_class: type[PearyProtocol] = PearyMultiplexProtocol,
+        transport_factory: Callable[[], Transport] | None = None,
+    ) -> None:
+        """Initializes a new peary client pool.
+
+        Args:
+            host: Hostname of the remote peary server.
+            port: Port number of the remote peary server. Defaults to 12345.
+            size: Number of pooled connections. Defaults to 4.
+            protocol_class: Class used for the protocols. Defaults to the thread-safe
+                PearyMultiplexProtocol.
+            transport_factory: Creates the transport of each pooled connection
+                instead of connecting to host and port over TCP.
+
+        Raises:
+            ValueError: If the pool size is not positive.
+
+        """
+        if size < 1:
+            raise ValueError(f"Invalid pool size: {size}")
+        self._size = size
+        self._protocol_class = protocol_class
+        self._transport_factory = transport_factory or (
+            lambda: TcpTransport(host, port)
+        )
+        self._stack = ExitStack()
+
+    @staticmethod
+    def _shutdown(connection: Connection) -> None:
+        """Shuts a pooled connection down, ignoring connections that already dropped.
+
+        Args:
+            connection: The pooled connection.
+
+        """
+        with suppress(OSError):
+            connection.shutdown(socket_module.SHUT_RDWR)
+
+    def _open(self, stack: ExitStack) -> PearyProtocol:
+        """Opens a pooled connection and performs the protocol handshake.
+
+        Args:
+            stack: Exit stack closing the connection.
+
+        Returns:
+            PearyProtocol: The protocol of the connection.
+
+        Raises:
+            PearySockerError: If the connection to the remote host cannot be made.
+
+        """
+        transport = self._transport_factory()
+        stack.callback(transport.socket.close)
+        try:
+            transport.connect()
+        except Exception as e:
+            raise PearyClientPool.PearySockerError(
+                f"Unable to connect to {transport}."
+            ) from e
+        stack.callback(self._shutdown, transport.socket)
+        return self._protocol_class(transport.socket)
+
+    def __enter__(self) -> PearyPoolProxy:
+        """Enters connections with a peary server.
+
+        Returns:
+            PearyPoolProxy: Proxy for the connected peary server.
+
+        Raises:
+            PearySockerError: If a connection to the remote host cannot be made.
+
+        """
+        with ExitStack() as stack:
+            protocols = [self._open(stack) for _ in range(self._size)]
+            self._stack = stack.pop_all()
+        return PearyPoolProxy(protocols)
+
+    def __exit__(self, *_: object) -> None:
+        """Exits a context block and closes all pooled connections.
+
+        Args:
+            _: Catches the usued arguments required for the __exit__ function.
+
+        """
+        self._stack.close()
@@ -1,27 +1,43 @@
 from __future__ import annotations
 
-import select
-import struct
+import time
+from collections import deque
 from enum import Flag, auto
+from itertools import islice
 from typing import TYPE_CHECKING, NamedTuple
 
+from peary import peary_frame
+from peary.peary_frame import DecodedBytes, DecodedView, FrameDecoder, FrameEncoder
+from peary.peary_stats import ProtocolStats
+from peary.peary_tags import TagAllocator
+from peary.peary_timeout import AdaptiveTimeout
+
 if TYPE_CHECKING:
-    from socket import socket as socket_type
+    from collections.abc import Callable, Collection, Iterable, Sequence
+
+    from typing_extensions import Buffer
+
+    from peary.peary_recorder import WireRecorder
+    from peary.peary_transport import Connection
 
 
-class DecodedBytes(NamedTuple):
-    """Return type for decoded bytes."""
+class _Pending(NamedTuple):
+    """Request of a pipelined batch waiting for its response."""
 
-    payload: bytes
-    tag: int
-    status: int
+    position: int
+    msg: str
+    size: int
+    sent_at: int
+    send_ns: int
 
 
-class PearyProtocol:
-    """Protocol for encoding and decoding communication with a remote peary server."""
+class PearyProtocol:  # pylint: disable=too-many-instance-attributes
+    """Protocol for encoding and decoding communication with a remote peary server.
 
-    class DecodeError(Exception):
-        """Exception for failing decode."""
+    Every request is counted by command with its bytes, errors and latencies, see
+    `stats`. The frames on the wire can be captured with `record`.
+
+    """
 
     class ResponseReceiveError(Exception):
         """Exception for failing to receive responses."""
@@ -43,37 +59,60 @@ class PearyProtocol:
 
         CHECK_NONE = auto()
         CHECK_VERSION = auto()
+        CHECK_VERSION_LAZY = auto()
 
+    SEND_CHUNK_SIZE = 65536
     STATUS_OK = 0
-    STRUCT_HEADER = struct.Struct("!HH")
-    STRUCT_LENGTH = struct.Struct("!L")
+    STRUCT_HEADER = peary_frame.STRUCT_HEADER
+    STRUCT_LENGTH = peary_frame.STRUCT_LENGTH
     VERSION = b"1"
+    DecodeError = FrameDecoder.DecodeError
 
     def __init__(
         self,
-        socket: socket_type,
+        socket: Connection,
         *,
-        timeout: int = 1,
+        timeout: float | AdaptiveTimeout = 1,
         checks: Checks = Checks.CHECK_VERSION,
     ) -> None:
         """Initializes a new peary proxy.
 
         Args:
             socket: Socket connected to the remote peary server.
-            timeout: Socket timeout value in seconds. Defaults to 1.
+            timeout: Socket timeout value in seconds, or an adaptive timeout applied
+                per request. Defaults to 1.
             checks: Checks performed during initialization. Defaults to CHECK_VERSION.
+                CHECK_VERSION_LAZY defers the version check to the first request,
+                which is pipelined with the protocol_version request.
 
         Raises:
             VersionError: If protocol version doesn match with remote host.
 
         """
-        self._tag: int = 0
+        self._tags = TagAllocator()
         self._socket = socket
+        self._decoder = FrameDecoder()
+        self._frames: deque[DecodedBytes] = deque()
+        self._timeout = timeout
+        self._stats = ProtocolStats()
+        self._recorder: WireRecorder | None = None
+        self._version: bytes | None = None
+        self._version_mismatch: bytes | None = None
+        self._on_verified: Callable[[bytes], None] | None = None
+        self._version_pending = (
+            PearyProtocol.Checks.CHECK_VERSION_LAZY in checks
+            and PearyProtocol.Checks.CHECK_VERSION not in checks
+        )
 
-        self._socket.settimeout(timeout)
+        self._socket.settimeout(self._timeout_for(()))
         if PearyProtocol.Checks.CHECK_VERSION in checks:
             self._verify_compatible_version()
 
+    @property
+    def remote_version(self) -> bytes | None:
+        """Returns the verified remote version, or None if not verified yet."""
+        return self._version
+
     @staticmethod
     def encode(payload: bytes, tag: int, status: int) -> bytes:
         """Encodes a request into a sequence of bytes.
@@ -87,9 +126,20 @@ class PearyProtocol:
             bytes: The encoded sequence of bytes.
 
         """
-        header = PearyProtocol.STRUCT_HEADER.pack(tag, status)
-        length = PearyProtocol.STRUCT_LENGTH.pack(len(header) + len(payload))
-        return b"".join([length, header, payload])
+        return FrameEncoder.encode(payload, tag, status)
+
+    @staticmethod
+    def encode_many(frames: Iterable[tuple[bytes, int, int]]) -> bytearray:
+        """Encodes a burst of requests into a single sequence of bytes.
+
+        Args:
+            frames: The payload, tag and status of each request.
+
+        Returns:
+            bytearray: The encoded sequence of bytes.
+
+        """
+        return FrameEncoder.encode_many(frames)
 
     @staticmethod
     def decode(data: bytes) -> DecodedBytes:
@@ -102,24 +152,96 @@ class PearyProtocol:
             A tuple containing the response message, response id, and response status.
 
         """
-        if len(data) < PearyProtocol.STRUCT_LENGTH.size:
-            raise PearyProtocol.DecodeError(
-                f"Insufficent number of bytes: {len(data)}."
-            )
-        (length,) = PearyProtocol.STRUCT_LENGTH.unpack(
-            data[: PearyProtocol.STRUCT_LENGTH.size]
-        )
+        return FrameDecoder.decode(data)
+
+    @staticmethod
+    def decode_view(data: Buffer) -> DecodedView:
+        """Decodes data without copying the payload.
+
+        Args:
+            data: The encoded bytes, e.g. a bytearray or memoryview.
+
+        Returns:
+            A tuple containing the payload view, response id, and response status.
+
+        """
+        return FrameDecoder.decode_view(data)
+
+    @staticmethod
+    def check_window(window: int) -> None:
+        """Verifies the number of requests a batch may keep in flight.
+
+        Args:
+            window: Maximum number of requests in flight.
+
+        Raises:
+            ValueError: If the window is not positive.
+
+        """
+        if window < 1:
+            raise ValueError(f"Invalid request window: {window}")
+
+    @staticmethod
+    def receive_error(error: Exception) -> PearyProtocol.ResponseReceiveError:
+        """Creates the error reported for a request whose response was lost.
+
+        Args:
+            error: The error that stopped the connection.
+
+        Returns:
+            ResponseReceiveError: The error, caused by the stopped connection.
+
+        """
+        lost = PearyProtocol.ResponseReceiveError("Failed to receive response.")
+        lost.__cause__ = error
+        return lost
+
+    @staticmethod
+    def status_error(msg: str, status: int) -> PearyProtocol.ResponseStatusError:
+        """Creates the error reported for a response with a failing status.
+
+        Args:
+            msg: The request message that received the failing response.
+            status: The failing response status.
 
-        if len(data) != (PearyProtocol.STRUCT_LENGTH.size + length):
-            raise PearyProtocol.DecodeError("Incorrect number of bytes")
-        tag, status = PearyProtocol.STRUCT_HEADER.unpack(
-            data[
-                PearyProtocol.STRUCT_LENGTH.size : PearyProtocol.STRUCT_LENGTH.size
-                + PearyProtocol.STRUCT_HEADER.size
-            ]
+        Returns:
+            ResponseStatusError: The error describing the failed request.
+
+        """
+        return PearyProtocol.ResponseStatusError(
+            f"Failed response status {status} from request '{msg!r}'"
         )
-        payload = data[PearyProtocol.STRUCT_HEADER.size - length :]
-        return DecodedBytes(payload, tag, status)
+
+    def stats(self) -> ProtocolStats:
+        """Returns the statistics of the requests by command.
+
+        Returns:
+            ProtocolStats: The statistics, with snapshot and reset calls.
+
+        """
+        return self._stats
+
+    def record(self, recorder: WireRecorder | None) -> None:
+        """Records the frames sent and received by the protocol.
+
+        Args:
+            recorder: Recorder of the frames, or None to stop recording.
+
+        """
+        self._recorder = recorder
+
+    def on_verified(self, callback: Callable[[bytes], None] | None) -> None:
+        """Calls back with the remote version as soon as it is verified.
+
+        A version verified before is passed to the callback right away.
+
+        Args:
+            callback: Called with the verified version, or None to stop calling back.
+
+        """
+        self._on_verified = callback
+        if callback is not None and self._version is not None:
+            callback(self._version)
 
     def request(self, msg: str, *args: str, buffer_size: int = 4096) -> bytes:
         """Initiates a requst to the connected peary server.
@@ -137,28 +259,272 @@ class PearyProtocol:
             ResponseSequenceError: If response id different than request id.
 
         """
-        self._tag += 1
-        self._send(
-            PearyProtocol.encode(
-                " ".join([msg, *args]).encode("utf-8"), self._tag, self.STATUS_OK
-            )
+        if self._version_pending:
+            return self._request_verifying_version(msg, *args, buffer_size=buffer_size)
+        if isinstance(self._timeout, AdaptiveTimeout):
+            self._socket.settimeout(self._timeout.timeout((msg,)))
+        tag = self._tags.acquire()
+        start = time.perf_counter_ns()
+        data = PearyProtocol.encode(
+            " ".join([msg, *args]).encode("utf-8"), tag, self.STATUS_OK
         )
-        resp, resp_id, resp_status = PearyProtocol.decode(self._recv(buffer_size))
+        self._send(data)
+        sent_at = time.perf_counter_ns()
+        try:
+            frame = self._recv_response(buffer_size, (tag,))
+        except Exception:
+            self._stats.failed(msg, answered=False)
+            raise
+        response = self._account(msg, len(data), frame, sent_at - start, sent_at)
+        if frame.tag == tag:
+            self._tags.release(tag)
+
+        if isinstance(response, PearyProtocol.ResponseStatusError):
+            raise response
+        if frame.tag != tag:
+            raise PearyProtocol.ResponseSequenceError(
+                f"Recieved out of order repsonse from '{msg}': {frame.tag} != {tag}"
+            )
 
-        if resp_status != PearyProtocol.STATUS_OK:
-            raise PearyProtocol.ResponseStatusError(
-                f"Failed response status {resp_status} from request '{msg!r}'"
+        return response
+
+    def request_many(
+        self,
+        requests: Iterable[Sequence[str]],
+        *,
+        buffer_size: int = 4096,
+        window: int = 256,
+    ) -> list[bytes | PearyProtocol.ResponseStatusError]:
+        """Initiates a pipelined batch of requests to the connected peary server.
+
+        Requests are encoded into bursts that are each sent with a single call
+        before any response is read, so a batch costs a single round-trip per window
+        of requests. Whenever half of the window has been answered the free tags
+        are refilled with the next burst. Responses are matched to their requests by
+        tag. A failing response status does not abort the batch; the corresponding
+        ResponseStatusError is returned in place of the payload.
+
+        Args:
+            requests: Request messages, each followed by its additional arguments.
+            buffer_size: Size of the reciever buffer.
+            window: Maximum number of requests in flight. Defaults to 256.
+
+        Returns:
+            list: The response payload or status error for each request, in order.
+
+        Raises:
+            ValueError: If the window is not positive.
+            ResponseSequenceError: If a response tag matches no pending request.
+
+        """
+        PearyProtocol.check_window(window)
+        if self._version_pending:
+            return self._request_many_verifying_version(
+                requests, buffer_size=buffer_size, window=window
             )
-        if resp_id != self._tag:
+        pending: dict[int, _Pending] = {}
+        responses: list[bytes | PearyProtocol.ResponseStatusError] = []
+        indexed_requests = enumerate(requests)
+        # pylint: disable-next=while-used
+        while burst := [*islice(indexed_requests, window - len(pending))]:
+            self._send_burst(burst, pending, responses)
+            while len(pending) > window // 2:  # pylint: disable=while-used
+                self._recv_pending(buffer_size, pending, responses)
+
+        while pending:  # pylint: disable=while-used
+            self._recv_pending(buffer_size, pending, responses)
+        return responses
+
+    def _request_verifying_version(
+        self, msg: str, *args: str, buffer_size: int
+    ) -> bytes:
+        """Initiates a request pipelined with the deferred version check.
+
+        Args:
+            msg: The request message to be sent.
+            *args: Additiona message argumnets.
+            buffer_size: Size of the reciever buffer.
+
+        Returns:
+            bytes: The received response.
+
+        Raises:
+            ResponseStatusError: If response returns a failing status.
+
+        """
+        resp = self._request_many_verifying_version(
+            [(msg, *args)], buffer_size=buffer_size, window=2
+        )[0]
+        if isinstance(resp, PearyProtocol.ResponseStatusError):
+            raise resp
+        return resp
+
+    def _request_many_verifying_version(
+        self, requests: Iterable[Sequence[str]], *, buffer_size: int, window: int
+    ) -> list[bytes | PearyProtocol.ResponseStatusError]:
+        """Initiates a batch of requests pipelined with the deferred version check.
+
+        The protocol_version request is sent in the same burst as the batch, so the
+        check does not cost a round-trip of its own. The batch is executed by the
+        remote host before the version is checked. Once the remote version was found
+        incompatible, every later batch fails before anything is sent.
+
+        Args:
+            requests: Request messages, each followed by its additional arguments.
+            buffer_size: Size of the reciever buffer.
+            window: Maximum number of requests in flight.
+
+        Returns:
+            list: The response payload or status error for each request, in order.
+
+        Raises:
+            VersionError: If versions are incompatible.
+            ResponseStatusError: If the version request failed.
+
+        """
+        if self._version_mismatch is not None:
+            self._accept_version(self._version_mismatch)
+        self._version_pending = False
+        try:
+            version, *responses = self.request_many(
+                [("protocol_version",), *requests],
+                buffer_size=buffer_size,
+                window=window,
+            )
+        finally:
+            self._version_pending = True
+        self._accept_version(version)
+        self._version_pending = False
+        return responses
+
+    def _timeout_for(self, msgs: Iterable[str]) -> float:
+        """Returns the response timeout of a batch of requests.
+
+        Args:
+            msgs: The request messages of the batch.
+
+        Returns:
+            float: The timeout in seconds.
+
+        """
+        if isinstance(self._timeout, AdaptiveTimeout):
+            return self._timeout.timeout(msgs)
+        return self._timeout
+
+    def _attach(self, socket: Connection) -> None:
+        """Replaces the connection, dropping the state of the previous one.
+
+        Args:
+            socket: Socket connected to the remote peary server.
+
+        """
+        self._socket = socket
+        self._tags = TagAllocator()
+        self._decoder = FrameDecoder()
+        self._frames.clear()
+        self._socket.settimeout(self._timeout_for(()))
+
+    def _send_burst(
+        self,
+        burst: Sequence[tuple[int, Sequence[str]]],
+        pending: dict[int, _Pending],
+        responses: list[bytes | PearyProtocol.ResponseStatusError],
+    ) -> None:
+        """Send a burst of pipelined requests with a single call.
+
+        Args:
+            burst: Index and message with its additional arguments of each request.
+            pending: The pending requests by tag, extended by the burst.
+            responses: Responses of the batch extended by the requests of the burst.
+
+        """
+        start = time.perf_counter_ns()
+        frames = []
+        for _, (msg, *args) in burst:
+            frames.append(
+                (
+                    " ".join([msg, *args]).encode("utf-8"),
+                    self._tags.acquire(),
+                    self.STATUS_OK,
+                )
+            )
+            responses.append(b"")
+        self._send(PearyProtocol.encode_many(frames))
+        sent_at = time.perf_counter_ns()
+        send_ns = (sent_at - start) // len(frames)
+        for (index, (msg, *_)), (payload, tag, _) in zip(burst, frames):
+            pending[tag] = _Pending(
+                index, msg, len(payload) + peary_frame.FRAME_OVERHEAD, sent_at, send_ns
+            )
+        if isinstance(self._timeout, AdaptiveTimeout):
+            self._socket.settimeout(
+                self._timeout.timeout(request.msg for request in pending.values())
+            )
+
+    def _recv_pending(
+        self,
+        buffer_size: int,
+        pending: dict[int, _Pending],
+        responses: list[bytes | PearyProtocol.ResponseStatusError],
+    ) -> None:
+        """Receive the response of one pending pipelined request.
+
+        Args:
+            buffer_size: Size of the reciever buffer.
+            pending: The pending requests by tag.
+            responses: Responses of the batch updated with the received response.
+
+        Raises:
+            ResponseSequenceError: If the response tag matches no pending request.
+
+        """
+        frame = self._recv_response(buffer_size, pending)
+        if frame.tag not in pending:
             raise PearyProtocol.ResponseSequenceError(
-                f"Recieved out of order repsonse from '{msg}': {resp_id} != {self._tag}"
+                f"Recieved response with unknown tag: {frame.tag}"
             )
+        self._tags.release(frame.tag)
+        request = pending.pop(frame.tag)
+        responses[request.position] = self._account(
+            request.msg, request.size, frame, request.send_ns, request.sent_at
+        )
 
-        return resp
+    def _account(
+        self, msg: str, size: int, frame: DecodedBytes, send_ns: int, sent_at: int
+    ) -> bytes | PearyProtocol.ResponseStatusError:
+        """Records the statistics of a received response and checks its status.
+
+        Args:
+            msg: The request message.
+            size: The number of bytes of the request frame.
+            frame: The received response.
+            send_ns: The time spent encoding and sending the request in nanoseconds.
+            sent_at: The performance counter in nanoseconds when the request was sent.
 
-    def _send(self, data: bytes) -> int:
+        Returns:
+            The response payload, or the status error of a failing response.
+
+        """
+        self._stats.record(
+            msg,
+            size,
+            len(frame.payload) + peary_frame.FRAME_OVERHEAD,
+            send_ns,
+            time.perf_counter_ns() - sent_at,
+        )
+        if frame.status == PearyProtocol.STATUS_OK:
+            return frame.payload
+        self._stats.failed(msg, answered=True)
+        return self.status_error(msg, frame.status)
+
+    def _send(self, data: bytes | bytearray) -> int:
         """Sends data through the connected socket.
 
+        Partial writes are normal for large frames or a full send buffer, so the
+        data is sent in chunks of at most SEND_CHUNK_SIZE bytes until all of it has
+        been written. Each send blocks up to the socket timeout while the send buffer
+        is full, which applies backpressure instead of failing the request.
+
         Args:
             data: Bytes to be sent.
 
@@ -169,35 +535,88 @@ class PearyProtocol:
             RequestSendError: If the data failed to send
 
         """
-        if (size := self._socket.send(data)) != len(data):
-            raise PearyProtocol.RequestSendError(f"Failed to send request: {data!r}")
+        if self._recorder is not None:
+            self._recorder.sent(data)
+        with memoryview(data) as view:
+            sent = 0
+            while sent < len(view):  # pylint: disable=while-used
+                with view[sent : sent + self.SEND_CHUNK_SIZE] as chunk:
+                    if not (size := self._socket.send(chunk)):
+                        raise PearyProtocol.RequestSendError(
+                            f"Failed to send request: connection closed after {sent} "
+                            f"of {len(view)} bytes."
+                        )
+                sent += size
+        return sent
+
+    def _recv_into(self, buffer: memoryview) -> int:
+        """Receive data from the connected socket into a buffer.
+
+        Args:
+            buffer: Writable buffer receiving the data.
+
+        Returns:
+            int: The number of received bytes.
+
+        Raises:
+            ResponseReceiveError: If failed to receive response.
+
+        """
+        if not (size := self._socket.recv_into(buffer)):
+            raise PearyProtocol.ResponseReceiveError("Failed to receive response.")
         return size
 
-    def _recv(self, buffer_size: int) -> bytes:
-        """Receive data from the connected socket.
+    def _recv_frame(self, buffer_size: int) -> DecodedBytes:
+        """Receive exactly one decoded frame from the connected socket.
+
+        Data is received directly into the buffer provided by the frame decoder.
+        Frames completed beyond the requested one are kept for the next call so
+        pipelined responses arriving in a single read are not lost.
 
         Args:
-            buffer_size: Number of bytes to receive.
+            buffer_size: Number of bytes to receive per read of the length prefix.
 
         Returns:
-            bytes: The received data.
+            DecodedBytes: The received frame.
 
         Raises:
             ResponseReceiveError: If failed to receive response.
 
         """
-        data = bytearray()
+        while not self._frames:  # pylint: disable=while-used
+            with self._decoder.get_buffer(buffer_size) as buffer:
+                size = self._recv_into(buffer)
+            start = time.perf_counter_ns()
+            frames = self._decoder.buffer_updated(size)
+            self._stats.decoded(time.perf_counter_ns() - start)
+            if self._recorder is not None:
+                self._recorder.received(frames)
+            self._frames.extend(frames)
+        return self._frames.popleft()
+
+    def _recv_response(
+        self, buffer_size: int, expected: Collection[int]
+    ) -> DecodedBytes:
+        """Receive the next response that is not stale.
+
+        Requests that failed before receiving their response, e.g. on a timeout,
+        keep their tag in flight. Their late responses are discarded here and the
+        tag is released, so they are never mistaken for the response of a newer
+        request reusing the same tag.
+
+        Args:
+            buffer_size: Number of bytes to receive per read of the length prefix.
+            expected: Tags of the requests waiting for a response.
+
+        Returns:
+            DecodedBytes: The received frame.
+
+        """
         while True:  # pylint: disable=while-used
-            block: bytes = self._socket.recv(buffer_size)
-            data.extend(block)
-            if len(block) < buffer_size:
-                break
-            readable, _, _ = select.select([self._socket], [], [], 0)
-            if self._socket not in readable:
-                break
-        if not data:
-            raise PearyProtocol.ResponseReceiveError("Failed to receive response.")
-        return bytes(data)
+            frame = self._recv_frame(buffer_size)
+            if frame.tag in expected or frame.tag not in self._tags:
+                return frame
+            self._tags.release(frame.tag)
 
     def _verify_compatible_version(self) -> None:
         """Verify the remote version is suppoted by this protocol.
@@ -206,7 +625,27 @@ class PearyProtocol:
             VersionError: If versions are incompatible.
 
         """
-        if (version := self.request("protocol_version")) != self.VERSION:
+        self._accept_version(self.request("protocol_version"))
+
+    def _accept_version(self, version: bytes | Exception) -> None:
+        """Records the remote version if it is supported by this protocol.
+
+        Args:
+            version: The response to the protocol_version request.
+
+        Raises:
+            VersionError: If versions are incompatible.
+            ResponseStatusError: If the version request failed.
+
+        """
+        if isinstance(version, Exception):
+            raise version
+        if version != self.VERSION:
+            self._version_mismatch = version
             raise PearyProtocol.VersionError(
                 f"Unsupported protocol version: {version!r}"
             )
+        self._version = version
+        self._version_mismatch = None
+        if self._on_verified is not None:
+            self._on_verified(version)
@@ -6,6 +6,7 @@ from peary.peary_device import PearyDevice
 
 if TYPE_CHECKING:
     from peary.peary_protocol import PearyProtocol
+    from peary.peary_stats import ProtocolStats
 
 
 class PearyProxy:
@@ -50,7 +51,7 @@ class PearyProxy:
         if name in self._devices:
             raise PearyProxy.PearyProxyAddDeviceError(f"Device already exists: {name}")
         index = int(self._protocol.request("add_device", name))
-        self._devices[name] = device_class(index, self._protocol)
+        self._devices[name] = device_class(index, self._device_protocol())
         return self._devices[name]
 
     def get_device(self, name: str) -> PearyDevice:
@@ -83,3 +84,11 @@ class PearyProxy:
     def list_remote_devices(self) -> bytes:
         """List devices known to the remote server."""
         return self._protocol.request("list_devices")
+
+    def stats(self) -> ProtocolStats:
+        """Returns the request statistics of the protocol by command."""
+        return self._protocol.stats()
+
+    def _device_protocol(self) -> PearyProtocol:
+        """Returns the protocol used by a newly added device."""
+        return self._protocol
@@ -0,0 +1,385 @@
+from __future__ import annotations
+
+import socket as socket_module
+import time
+from typing import TYPE_CHECKING, NamedTuple
+
+from peary.peary_protocol import PearyProtocol
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator, Sequence
+
+    from peary.peary_timeout import AdaptiveTimeout
+    from peary.peary_transport import Connection
+
+_ADD_DEVICE = "add_device"
+_CLEAR_DEVICES = "clear_devices"
+
+IDEMPOTENT_COMMANDS = frozenset(
+    {
+        "",
+        "protocol_version",
+        "list_devices",
+        "device.name",
+        "device.list_registers",
+        "device.get_register",
+        "device.get_memory",
+        "device.get_voltage",
+        "device.get_current",
+    }
+)
+
+
+class _Setting(NamedTuple):
+    """Setting changed by a device command."""
+
+    kind: str
+    arguments: int  # leading arguments identifying the setting, e.g. index and port
+
+
+_REPLAYED_COMMANDS = {
+    "device.power_on": _Setting("power", 1),
+    "device.power_off": _Setting("power", 1),
+    "device.set_register": _Setting("register", 2),
+    "device.set_memory": _Setting("memory", 2),
+    "device.set_voltage": _Setting("voltage", 2),
+    "device.set_current": _Setting("current", 2),
+    "device.switch_on": _Setting("switch", 2),
+    "device.switch_off": _Setting("switch", 2),
+}
+
+
+class ReconnectPolicy(NamedTuple):
+    """Backoff of the attempts to reconnect after the connection dropped.
+
+    The delay before each attempt grows by the backoff factor up to the maximum
+    delay. With replay enabled, the last known power, supply and register settings
+    of the devices are sent again after the devices have been re-added. Only
+    requests of idempotent commands, which default to the read-only commands, are
+    sent again once the session is restored, i.e.
+
+        ReconnectPolicy(idempotent=IDEMPOTENT_COMMANDS | {"device.set_voltage"})
+
+    """
+
+    attempts: int = 5
+    delay: float = 0.1
+    max_delay: float = 5
+    backoff: float = 2
+    replay: bool = False
+    idempotent: frozenset[str] = IDEMPOTENT_COMMANDS
+
+    def delays(self) -> Iterator[float]:
+        """Returns the delay in seconds before each reconnection attempt.
+
+        Returns:
+            Iterator: The delays of the attempts.
+
+        """
+        return (
+            min(self.delay * self.backoff**attempt, self.max_delay)
+            for attempt in range(self.attempts)
+        )
+
+
+class PearyReconnectingProtocol(PearyProtocol):
+    """Protocol restoring its session when the connection to the peary server drops.
+
+    Devices added through the protocol are tracked. When a request fails because the
+    connection dropped, the protocol reconnects with backoff, repeats the version
+    check, re-adds the devices in a single pipelined burst and sends an idempotent
+    request again, so callers only see a stall. Other requests may have been
+    executed before the connection dropped, so they raise RequestInterruptedError
+    instead of being sent twice. Devices keep the index they were added with;
+    requests are translated to the index assigned by the restored session. Use it
+    through the reconnect argument of a client, i.e.
+
+        with PearyClient(host, reconnect=ReconnectPolicy(replay=True)) as proxy:
+            # devices survive dropped connections
+
+    """
+
+    class ReconnectError(Exception):
+        """Exception for failing to restore a dropped connection."""
+
+    class RequestInterruptedError(Exception):
+        """Exception for an interrupted request that is not idempotent."""
+
+    CONNECTION_ERRORS = (
+        OSError,
+        PearyProtocol.ResponseReceiveError,
+        PearyProtocol.RequestSendError,
+    )
+
+    def __init__(
+        self,
+        socket: Connection,
+        *,
+        reconnect: Callable[[], Connection],
+        policy: ReconnectPolicy = ReconnectPolicy(),  # noqa: B008
+        timeout: float | AdaptiveTimeout = 1,
+        checks: PearyProtocol.Checks = PearyProtocol.Checks.CHECK_VERSION,
+    ) -> None:
+        """Initializes a new reconnecting peary protocol.
+
+        Args:
+            socket: Socket connected to the remote peary server.
+            reconnect: Returns a new socket connected to the remote peary server.
+            policy: Backoff of the reconnection attempts. Defaults to five attempts.
+            timeout: Socket timeout value in seconds, or an adaptive timeout applied
+                per request. Defaults to 1.
+            checks: Checks performed during initialization and after reconnecting.
+                Defaults to CHECK_VERSION.
+
+        Raises:
+            VersionError: If protocol version doesn match with remote host.
+
+        """
+        self._reconnect = reconnect
+        self._policy = policy
+        self._checks = checks
+        self._devices: dict[str, tuple[str, str]] = {}
+        self._settings: dict[tuple[str, ...], tuple[str, Sequence[str]]] = {}
+        super().__init__(socket, timeout=timeout, checks=checks)
+
+    def request(self, msg: str, *args: str, buffer_size: int = 4096) -> bytes:
+        """Initiates a requst, restoring the session if the connection dropped.
+
+        Args:
+            msg: The request message to be sent.
+            *args: Additiona message argumnets.
+            buffer_size: Size of the reciever buffer.
+
+        Returns:
+            bytes: The received response.
+
+        Raises:
+            RequestInterruptedError: If the connection dropped during a request that
+                is not idempotent.
+
+        """
+        if self._version_pending:
+            return self._request_verifying_version(msg, *args, buffer_size=buffer_size)
+        try:
+            resp = self._request_remote(msg, args, buffer_size)
+        except socket_module.timeout:
+            raise
+        except PearyReconnectingProtocol.CONNECTION_ERRORS as e:
+            self._restore_session()
+            if msg not in self._policy.idempotent:
+                raise PearyReconnectingProtocol.RequestInterruptedError(
+                    f"Connection dropped during '{msg}', which is not sent again."
+                ) from e
+            resp = self._request_remote(msg, args, buffer_size)
+        return self._record(msg, args, resp)
+
+    def request_many(
+        self,
+        requests: Iterable[Sequence[str]],
+        *,
+        buffer_size: int = 4096,
+        window: int = 256,
+    ) -> list[bytes | PearyProtocol.ResponseStatusError]:
+        """Initiates a pipelined batch, restoring the session if the connection dropped.
+
+        A batch interrupted by a dropped connection is sent again as a whole if all
+        of its requests are idempotent.
+
+        Args:
+            requests: Request messages, each followed by its additional arguments.
+            buffer_size: Size of the reciever buffer.
+            window: Maximum number of requests in flight. Defaults to 256.
+
+        Returns:
+            list: The response payload or status error for each request, in order.
+
+        Raises:
+            RequestInterruptedError: If the connection dropped during a batch with a
+                request that is not idempotent.
+
+        """
+        if self._version_pending:
+            return self._request_many_verifying_version(
+                requests, buffer_size=buffer_size, window=window
+            )
+        requests = [*requests]
+        try:
+            responses = self._request_many_remote(requests, buffer_size, window)
+        except socket_module.timeout:
+            raise
+        except PearyReconnectingProtocol.CONNECTION_ERRORS as e:
+            self._restore_session()
+            if interrupted := [
+                msg for msg, *_ in requests if msg not in self._policy.idempotent
+            ]:
+                raise PearyReconnectingProtocol.RequestInterruptedError(
+                    f"Connection dropped during '{interrupted[0]}', which is not sent "
+                    "again."
+                ) from e
+            responses = self._request_many_remote(requests, buffer_size, window)
+        return [
+            resp if isinstance(resp, Exception) else self._record(msg, args, resp)
+            for (msg, *args), resp in zip(requests, responses)
+        ]
+
+    def _request_remote(self, msg: str, args: Sequence[str], buffer_size: int) -> bytes:
+        """Initiates a request addressing devices by their index in the session.
+
+        Args:
+            msg: The request message to be sent.
+            args: Additiona message argumnets.
+            buffer_size: Size of the reciever buffer.
+
+        Returns:
+            bytes: The received response.
+
+        """
+        return super().request(
+            msg, *self._remote_args(msg, args), buffer_size=buffer_size
+        )
+
+    def _request_many_remote(
+        self, requests: Sequence[Sequence[str]], buffer_size: int, window: int
+    ) -> list[bytes | PearyProtocol.ResponseStatusError]:
+        """Initiates a batch addressing devices by their index in the session.
+
+        Args:
+            requests: Request messages, each followed by its additional arguments.
+            buffer_size: Size of the reciever buffer.
+            window: Maximum number of requests in flight.
+
+        Returns:
+            list: The response payload or status error for each request, in order.
+
+        """
+        return super().request_many(
+            [(msg, *self._remote_args(msg, args)) for msg, *args in requests],
+            buffer_size=buffer_size,
+            window=window,
+        )
+
+    def _remote_args(self, msg: str, args: Sequence[str]) -> Sequence[str]:
+        """Translates the device index of a device command to the session index.
+
+        Args:
+            msg: The request message.
+            args: Additional message arguments, led by the device index.
+
+        Returns:
+            Sequence: The arguments addressing the device in the current session.
+
+        """
+        if not msg.startswith("device.") or not args or args[0] not in self._devices:
+            return args
+        return (self._devices[args[0]][1], *args[1:])
+
+    def _record(self, msg: str, args: Sequence[str], resp: bytes) -> bytes:
+        """Tracks the devices and settings changed by a successful request.
+
+        Args:
+            msg: The request message.
+            args: Additional message arguments.
+            resp: The response of the request.
+
+        Returns:
+            bytes: The response, with the index of added devices as seen locally.
+
+        """
+        if msg == _ADD_DEVICE:
+            return self._add_device(args[0], resp)
+        if msg == _CLEAR_DEVICES:
+            self._devices.clear()
+            self._settings.clear()
+        elif msg in _REPLAYED_COMMANDS:
+            setting = _REPLAYED_COMMANDS[msg]
+            key = (setting.kind, *args[: setting.arguments])
+            self._settings.pop(key, None)
+            self._settings[key] = (msg, args)
+        return resp
+
+    def _add_device(self, name: str, resp: bytes) -> bytes:
+        """Tracks an added device under an index that is unique locally.
+
+        Args:
+            name: The name of the added device.
+            resp: The index assigned to the device by the current session.
+
+        Returns:
+            bytes: The index of the device as seen locally.
+
+        """
+        local = remote = str(int(resp))
+        if local in self._devices:
+            local = str(max(int(index) for index in self._devices) + 1)
+        self._devices[local] = (name, remote)
+        return local.encode("utf-8")
+
+    def _restore_session(self) -> None:
+        """Reconnects with backoff and restores the session.
+
+        Raises:
+            ReconnectError: If no attempt of the policy succeeded.
+
+        """
+        error: Exception | None = None
+        for delay in self._policy.delays():
+            time.sleep(delay)
+            try:
+                self._restore(self._reconnect())
+            except PearyReconnectingProtocol.CONNECTION_ERRORS as e:
+                error = e
+            else:
+                return
+        raise PearyReconnectingProtocol.ReconnectError(
+            f"Failed to reconnect after {self._policy.attempts} attempts."
+        ) from error
+
+    def _restore(self, socket: Connection) -> None:
+        """Restores the session on a new connection.
+
+        The version check and the re-added devices share a single pipelined burst.
+
+        Args:
+            socket: Socket connected to the remote peary server.
+
+        Raises:
+            ResponseStatusError: If a device cannot be re-added.
+
+        """
+        self._attach(socket)
+
+        devices = [*self._devices.items()]
+        requests: list[Sequence[str]] = [
+            ("add_device", name) for _, (name, _) in devices
+        ]
+        verify = bool(
+            self._checks
+            & (
+                PearyProtocol.Checks.CHECK_VERSION
+                | PearyProtocol.Checks.CHECK_VERSION_LAZY
+            )
+        )
+        if verify:
+            requests.insert(0, ("protocol_version",))
+        responses = super().request_many(requests)
+        if verify:
+            self._accept_version(responses.pop(0))
+        for (local, (name, _)), resp in zip(devices, responses):
+            if isinstance(resp, Exception):
+                raise resp
+            self._devices[local] = (name, str(int(resp)))
+        if self._policy.replay:
+            self._replay_settings()
+
+    def _replay_settings(self) -> None:
+        """Sends the last known settings of the devices again.
+
+        Raises:
+            ResponseStatusError: If a setting cannot be restored.
+
+        """
+        for resp in self._request_many_remote(
+            [(msg, *args) for msg, args in self._settings.values()], 4096, 256
+        ):
+            if isinstance(resp, Exception):
+                raise resp
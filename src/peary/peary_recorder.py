@@ -0,0 +1,258 @@
+from __future__ import annotations
+
+import pathlib
+import struct
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, NamedTuple
+
+from peary import peary_frame
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator
+    from os import PathLike
+
+    from typing_extensions import Buffer
+
+    from peary.peary_frame import DecodedBytes
+
+STRUCT_RECORD = struct.Struct("<QBHHL")
+
+
+class WireRecord(NamedTuple):
+    """Frame sent or received by a protocol."""
+
+    time: int  # nanoseconds since the recorder was created
+    direction: int
+    tag: int
+    status: int
+    payload: bytes
+
+
+class WireRecorder:
+    """Ring buffer of the frames sent and received by a protocol.
+
+    Each frame is packed into a compact binary record with its timestamp, direction,
+    tag, status and payload. Once the records exceed the capacity the oldest ones
+    are dropped, so a recorder can stay attached to a long running session and be
+    dumped when something goes wrong, i.e.
+
+        recorder = WireRecorder()
+        with (
+            PearyClient(host, recorder=recorder) as proxy,
+            recorder.dump_on_error("session.prec"),
+        ):
+            # the last megabyte of traffic is dumped if the block fails
+
+    Dumped sessions are loaded with `load` and replayed with `PearyReplay`.
+
+    """
+
+    class FormatError(Exception):
+        """Exception for files that do not contain recorded frames."""
+
+    MAGIC = b"PEARYREC1"
+    SENT = 0
+    RECEIVED = 1
+
+    def __init__(
+        self,
+        capacity: int = 1 << 20,
+        *,
+        clock: Callable[[], int] = time.perf_counter_ns,
+    ) -> None:
+        """Initializes a new empty wire recorder.
+
+        Args:
+            capacity: Maximum number of bytes of the kept records. Defaults to 1 MiB.
+            clock: Returns the current time in nanoseconds. Defaults to
+                time.perf_counter_ns.
+
+        Raises:
+            ValueError: If the capacity is not positive.
+
+        """
+        if capacity <= 0:
+            raise ValueError(f"Invalid wire recorder capacity: {capacity}")
+        self._capacity = capacity
+        self._clock = clock
+        self._origin = clock()
+        self._lock = threading.Lock()
+        self._records: deque[bytes] = deque()
+        self._size = 0
+
+    @property
+    def capacity(self) -> int:
+        """Returns the maximum number of bytes of the kept records."""
+        return self._capacity
+
+    @property
+    def size(self) -> int:
+        """Returns the number of bytes of the kept records."""
+        return self._size
+
+    @staticmethod
+    def load(path: str | PathLike[str]) -> list[WireRecord]:
+        """Reads the records dumped to a file.
+
+        Args:
+            path: The file written by `dump`.
+
+        Returns:
+            list: The records, oldest first.
+
+        Raises:
+            FormatError: If the file does not contain dumped records.
+
+        """
+        data = pathlib.Path(path).read_bytes()
+        if not data.startswith(WireRecorder.MAGIC):
+            raise WireRecorder.FormatError(f"Not a wire recording: {path}")
+        try:
+            return WireRecorder._unpack(data, len(WireRecorder.MAGIC))
+        except struct.error as e:
+            raise WireRecorder.FormatError(f"Truncated wire recording: {path}") from e
+
+    @staticmethod
+    def _unpack(data: bytes, offset: int) -> list[WireRecord]:
+        """Unpacks consecutive records.
+
+        Args:
+            data: The packed records.
+            offset: The position of the first record.
+
+        Returns:
+            list: The unpacked records, in order.
+
+        Raises:
+            struct.error: If the last record is truncated.
+
+        """
+        records = []
+        while offset < len(data):  # pylint: disable=while-used
+            timestamp, direction, tag, status, length = STRUCT_RECORD.unpack_from(
+                data, offset
+            )
+            offset += STRUCT_RECORD.size
+            if offset + length > len(data):
+                raise struct.error("truncated payload")
+            payload = data[offset : offset + length]
+            offset += length
+            records.append(WireRecord(timestamp, direction, tag, status, payload))
+        return records
+
+    def sent(self, data: Buffer) -> None:
+        """Records the frames of sent data.
+
+        Args:
+            data: Complete encoded frames, e.g. a burst of requests.
+
+        """
+        now = self._clock() - self._origin
+        with memoryview(data) as view:
+            offset = 0
+            with self._lock:
+                while offset < len(view):  # pylint: disable=while-used
+                    (length,) = peary_frame.STRUCT_LENGTH.unpack_from(view, offset)
+                    tag, status = peary_frame.STRUCT_HEADER.unpack_from(
+                        view, offset + peary_frame.STRUCT_LENGTH.size
+                    )
+                    start = offset + peary_frame.FRAME_OVERHEAD
+                    offset += peary_frame.STRUCT_LENGTH.size + length
+                    self._append(
+                        now, WireRecorder.SENT, tag, status, view[start:offset]
+                    )
+
+    def received(self, frames: Iterable[DecodedBytes]) -> None:
+        """Records received frames.
+
+        Args:
+            frames: The decoded frames.
+
+        """
+        now = self._clock() - self._origin
+        with self._lock:
+            for payload, tag, status in frames:
+                self._append(now, WireRecorder.RECEIVED, tag, status, payload)
+
+    def records(self) -> list[WireRecord]:
+        """Returns the kept records.
+
+        Returns:
+            list: The records, oldest first.
+
+        """
+        with self._lock:
+            data = b"".join(self._records)
+        return WireRecorder._unpack(data, 0)
+
+    def dump(self, path: str | PathLike[str]) -> None:
+        """Writes the kept records to a file.
+
+        Args:
+            path: The file to be written.
+
+        """
+        with self._lock:
+            data = b"".join([WireRecorder.MAGIC, *self._records])
+        pathlib.Path(path).write_bytes(data)
+
+    @contextmanager
+    def dump_on_error(self, path: str | PathLike[str]) -> Iterator[None]:
+        """Writes the kept records to a file if the block raises an exception.
+
+        Args:
+            path: The file to be written.
+
+        Yields:
+            None: Control to the block.
+
+        """
+        try:
+            yield
+        except Exception:
+            self.dump(path)
+            raise
+
+    def clear(self) -> None:
+        """Drops all records."""
+        with self._lock:
+            self._records.clear()
+            self._size = 0
+
+    def _append(
+        self, timestamp: int, direction: int, tag: int, status: int, payload: Buffer
+    ) -> None:
+        """Packs a record and drops the oldest records beyond the capacity.
+
+        Args:
+            timestamp: Nanoseconds since the recorder was created.
+            direction: SENT or RECEIVED.
+            tag: The tag of the frame.
+            status: The status of the frame.
+            payload: The payload of the frame.
+
+        """
+        record = b"".join(
+            [
+                STRUCT_RECORD.pack(
+                    timestamp, direction, tag, status, memoryview(payload).nbytes
+                ),
+                payload,
+            ]
+        )
+        self._records.append(record)
+        self._size += len(record)
+        while self._size > self._capacity:  # pylint: disable=while-used
+            self._size -= len(self._records.popleft())
+
+    def __len__(self) -> int:
+        """Returns the number of kept records.
+
+        Returns:
+            int: The number of kept records.
+
+        """
+        return len(self._records)
@@ -0,0 +1,191 @@
+from __future__ import annotations
+
+import threading
+import time
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+
+class RegisterCache:
+    """Remembers the register and memory values read and written by a device.
+
+    A device with a cache answers reads of values it wrote or read before without a
+    round-trip. Writes go through to the device and update the cache, while a reset,
+    configure or power off of the device clears it, i.e.
+
+        cache = RegisterCache(ttl=10, volatile=["status"])
+        device.cache_registers(cache)
+        device.set_register("vref", 12)
+        device.get_register("vref")  # answered by the cache
+        device.get_register("status")  # always read from the device
+
+    Registers changed by the device itself, e.g. status or counter registers, are
+    to be flagged as volatile so they are never cached.
+
+    """
+
+    REGISTER = "register"
+    MEMORY = "memory"
+
+    def __init__(
+        self,
+        ttl: float | None = None,
+        *,
+        volatile: Iterable[str] = (),
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initializes a new empty register cache.
+
+        Args:
+            ttl: Seconds a value is trusted. Defaults to until invalidated.
+            volatile: Names of the registers and memories never cached.
+            clock: Returns the current time in seconds. Defaults to time.monotonic.
+
+        Raises:
+            ValueError: If the time to live is not positive.
+
+        """
+        if ttl is not None and ttl <= 0:
+            raise ValueError(f"Invalid register cache ttl: {ttl}")
+        self._ttl = ttl
+        self._volatile = set(volatile)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: dict[tuple[str, str], tuple[int, float]] = {}
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def ttl(self) -> float | None:
+        """Returns the seconds a value is trusted, or None until invalidated."""
+        return self._ttl
+
+    @property
+    def volatile(self) -> frozenset[str]:
+        """Returns the names of the registers and memories never cached."""
+        return frozenset(self._volatile)
+
+    @property
+    def hits(self) -> int:
+        """Returns the number of reads answered by the cache."""
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """Returns the number of reads sent to the device."""
+        return self._misses
+
+    def lookup(self, kind: str, name: str) -> int | None:
+        """Returns a cached value unless it is volatile or expired.
+
+        Args:
+            kind: Whether the value is a REGISTER or MEMORY.
+            name: The name of the register or memory.
+
+        Returns:
+            int: The cached value, or None if it is to be read from the device.
+
+        """
+        with self._lock:
+            if (value := self._get(kind, name)) is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+            return value
+
+    def peek(self, kind: str, name: str) -> int | None:
+        """Returns a cached value like lookup without counting a hit or miss.
+
+        Args:
+            kind: Whether the value is a REGISTER or MEMORY.
+            name: The name of the register or memory.
+
+        Returns:
+            int: The cached value, or None if unknown or expired.
+
+        """
+        with self._lock:
+            return self._get(kind, name)
+
+    def store(self, kind: str, name: str, value: int) -> None:
+        """Records a value read from or written to the device unless it is volatile.
+
+        Args:
+            kind: Whether the value is a REGISTER or MEMORY.
+            name: The name of the register or memory.
+            value: The value of the register or memory.
+
+        """
+        with self._lock:
+            if name not in self._volatile:
+                self._entries[kind, name] = (value, self._clock())
+
+    def set_volatile(self, name: str, *, volatile: bool = True) -> None:
+        """Flags a register or memory as volatile, forgetting its cached values.
+
+        Args:
+            name: The name of the register or memory.
+            volatile: Whether the values are never cached. Defaults to True.
+
+        """
+        with self._lock:
+            if volatile:
+                self._volatile.add(name)
+                self._invalidate(name)
+            else:
+                self._volatile.discard(name)
+
+    def invalidate(self, name: str) -> None:
+        """Forgets the cached values of a register or memory.
+
+        Args:
+            name: The name of the register or memory.
+
+        """
+        with self._lock:
+            self._invalidate(name)
+
+    def clear(self) -> None:
+        """Forgets all cached values, keeping the hit and miss counters."""
+        with self._lock:
+            self._entries.clear()
+
+    def _get(self, kind: str, name: str) -> int | None:
+        """Returns a cached value unless it expired, with the lock held.
+
+        Args:
+            kind: Whether the value is a REGISTER or MEMORY.
+            name: The name of the register or memory.
+
+        Returns:
+            int: The cached value, or None if unknown or expired.
+
+        """
+        if (entry := self._entries.get((kind, name))) is None:
+            return None
+        value, stored_at = entry
+        if self._ttl is not None and self._clock() - stored_at >= self._ttl:
+            del self._entries[kind, name]
+            return None
+        return value
+
+    def _invalidate(self, name: str) -> None:
+        """Forgets the cached values of a register or memory with the lock held.
+
+        Args:
+            name: The name of the register or memory.
+
+        """
+        for kind in (RegisterCache.REGISTER, RegisterCache.MEMORY):
+            self._entries.pop((kind, name), None)
+
+    def __len__(self) -> int:
+        """Returns the number of cached values.
+
+        Returns:
+            int: The number of cached values, including expired ones.
+
+        """
+        return len(self._entries)
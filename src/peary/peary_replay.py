@@ -0,0 +1,271 @@
+from __future__ import annotations
+
+import argparse
+import socket as socket_module
+import threading
+import time
+from typing import TYPE_CHECKING, NamedTuple
+
+from peary.peary_frame import FrameDecoder, FrameEncoder
+from peary.peary_protocol import PearyProtocol
+from peary.peary_recorder import WireRecorder
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+
+    from peary.peary_recorder import WireRecord
+    from peary.peary_stats import ProtocolStats
+
+
+class _Exchange(NamedTuple):
+    """Recorded request with its recorded response."""
+
+    sent_at: int
+    request: bytes
+    response: WireRecord
+
+
+class PearyReplay:
+    """Replays a recorded session against a local stand-in server.
+
+    The requests of the session are sent again by a protocol in their recorded
+    bursts, and a stand-in server answers each of them with its recorded response.
+    At the original speed the requests are paced and the responses delayed like in
+    the recording, so field performance problems can be reproduced; at maximum
+    speed the session runs as fast as the client allows, so client changes can be
+    benchmarked against real traffic, i.e.
+
+        result = PearyReplay(WireRecorder.load("session.prec"), speed=None).run()
+        print(result.elapsed, result.mismatches)
+        print(result.stats)
+
+    Requests that were not answered in the recording are skipped.
+
+    """
+
+    class Result(NamedTuple):
+        """Outcome of a replayed session."""
+
+        requests: int
+        mismatches: int
+        elapsed: float
+        stats: ProtocolStats
+
+    def __init__(
+        self,
+        records: Iterable[WireRecord],
+        *,
+        speed: float | None = 1,
+        protocol_class: type[PearyProtocol] = PearyProtocol,
+    ) -> None:
+        """Initializes a new replay of a recorded session.
+
+        Args:
+            records: The frames of the session, e.g. loaded with WireRecorder.load.
+            speed: Factor applied to the recorded pace and latencies, or None for
+                maximum speed. Defaults to 1.
+            protocol_class: Class of the protocol sending the requests. Defaults to
+                PearyProtocol.
+
+        Raises:
+            ValueError: If the speed is not positive.
+
+        """
+        if speed is not None and speed <= 0:
+            raise ValueError(f"Invalid replay speed: {speed}")
+        self._exchanges = PearyReplay._pair(records)
+        self._speed = speed
+        self._protocol_class = protocol_class
+
+    @staticmethod
+    def _pair(records: Iterable[WireRecord]) -> list[_Exchange]:
+        """Pairs the recorded requests with their responses by tag.
+
+        Args:
+            records: The frames of the session.
+
+        Returns:
+            list: The answered requests, in the order they were sent.
+
+        """
+        sent: dict[int, WireRecord] = {}
+        exchanges = []
+        for record in records:
+            if record.direction == WireRecorder.SENT:
+                sent[record.tag] = record
+            elif (request := sent.pop(record.tag, None)) is not None:
+                exchanges.append(_Exchange(request.time, request.payload, record))
+        exchanges.sort(key=lambda exchange: exchange.sent_at)
+        return exchanges
+
+    @staticmethod
+    def _matches(exchange: _Exchange, resp: bytes | Exception) -> bool:
+        """Returns whether a replayed response matches the recorded one.
+
+        Args:
+            exchange: The recorded request and response.
+            resp: The replayed response payload or status error.
+
+        Returns:
+            bool: True if both succeeded with the same payload or both failed.
+
+        """
+        if isinstance(resp, Exception):
+            return exchange.response.status != PearyProtocol.STATUS_OK
+        return (
+            exchange.response.status == PearyProtocol.STATUS_OK
+            and resp == exchange.response.payload
+        )
+
+    @staticmethod
+    def _latency(exchange: _Exchange) -> int:
+        """Returns the recorded latency of a request.
+
+        Args:
+            exchange: The recorded request and response.
+
+        Returns:
+            int: Nanoseconds between sending the request and receiving the response.
+
+        """
+        return exchange.response.time - exchange.sent_at
+
+    def run(self) -> PearyReplay.Result:
+        """Replays the session.
+
+        Returns:
+            Result: The number of requests and of responses differing from the
+                recording, the elapsed seconds and the statistics of the protocol.
+
+        """
+        client, server = socket_module.socketpair()
+        thread = threading.Thread(target=self._serve, args=(server,), daemon=True)
+        thread.start()
+        with client:
+            protocol = self._protocol_class(
+                client,
+                timeout=self._scaled(
+                    max((self._latency(e) for e in self._exchanges), default=0)
+                )
+                + 1,
+                checks=PearyProtocol.Checks.CHECK_NONE,
+            )
+            start = time.perf_counter()
+            mismatches = sum(
+                not PearyReplay._matches(exchange, resp)
+                for burst in self._bursts()
+                for exchange, resp in zip(burst, self._send(protocol, burst, start))
+            )
+            elapsed = time.perf_counter() - start
+            client.shutdown(socket_module.SHUT_RDWR)
+        thread.join()
+        return PearyReplay.Result(
+            len(self._exchanges), mismatches, elapsed, protocol.stats()
+        )
+
+    def _bursts(self) -> list[list[_Exchange]]:
+        """Groups the requests sent with a single call.
+
+        Returns:
+            list: The bursts of requests, in the order they were sent.
+
+        """
+        bursts: list[list[_Exchange]] = []
+        for exchange in self._exchanges:
+            if bursts and bursts[-1][0].sent_at == exchange.sent_at:
+                bursts[-1].append(exchange)
+            else:
+                bursts.append([exchange])
+        return bursts
+
+    def _send(
+        self, protocol: PearyProtocol, burst: Sequence[_Exchange], start: float
+    ) -> list[bytes | PearyProtocol.ResponseStatusError]:
+        """Sends a burst of requests once it is due.
+
+        Args:
+            protocol: The protocol sending the requests.
+            burst: The requests sent with a single call in the recording.
+            start: The performance counter in seconds when the replay started.
+
+        Returns:
+            list: The response payload or status error for each request, in order.
+
+        """
+        offset = burst[0].sent_at - self._exchanges[0].sent_at
+        time.sleep(max(0, start + self._scaled(offset) - time.perf_counter()))
+        return protocol.request_many(
+            [exchange.request.decode("utf-8").split(" ") for exchange in burst]
+        )
+
+    def _serve(self, server: socket_module.socket) -> None:
+        """Answers each received request with the next recorded response.
+
+        Args:
+            server: The stand-in server end of the connection.
+
+        """
+        decoder = FrameDecoder()
+        exchanges = iter(self._exchanges)
+        with server:
+            while data := server.recv(65536):  # pylint: disable=while-used
+                received_at = time.perf_counter()
+                for frame, exchange in zip(decoder.feed(data), exchanges):
+                    due = received_at + self._scaled(PearyReplay._latency(exchange))
+                    time.sleep(max(0, due - time.perf_counter()))
+                    server.sendall(
+                        FrameEncoder.encode(
+                            exchange.response.payload,
+                            frame.tag,
+                            exchange.response.status,
+                        )
+                    )
+
+    def _scaled(self, ns: int) -> float:
+        """Converts a recorded duration to the replay speed.
+
+        Args:
+            ns: The recorded duration in nanoseconds.
+
+        Returns:
+            float: The duration in seconds at the replay speed, or 0 at maximum
+                speed.
+
+        """
+        if self._speed is None:
+            return 0
+        return ns / 1e9 / self._speed
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Replays a recorded session from the command line.
+
+    Args:
+        argv: The command line arguments. Defaults to sys.argv.
+
+    Returns:
+        int: The exit status, non-zero if responses differed from the recording.
+
+    """
+    parser = argparse.ArgumentParser(
+        description="Replay a session recorded with a WireRecorder."
+    )
+    parser.add_argument("path", help="file written by WireRecorder.dump")
+    pace = parser.add_mutually_exclusive_group()
+    pace.add_argument(
+        "--speed", type=float, default=1, help="factor applied to the recorded pace"
+    )
+    pace.add_argument(
+        "--max-speed",
+        action="store_const",
+        const=None,
+        dest="speed",
+        help="send the requests as fast as possible",
+    )
+    args = parser.parse_args(argv)
+    result = PearyReplay(WireRecorder.load(args.path), speed=args.speed).run()
+    print(  # noqa: T201
+        f"{result.requests} requests in {result.elapsed:.3f}s, "
+        f"{result.mismatches} mismatches\n{result.stats}"
+    )
+    return int(result.mismatches > 0)
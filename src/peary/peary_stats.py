@@ -0,0 +1,226 @@
+from __future__ import annotations
+
+import copy
+import threading
+
+
+class LatencyHistogram:
+    """Histogram of latencies in logarithmic buckets.
+
+    Bucket zero counts latencies below one microsecond and bucket k the latencies
+    from 2**(k-1) up to 2**k microseconds, so recording a latency only costs a
+    bit_length and an increment.
+
+    """
+
+    BUCKETS = 32
+
+    def __init__(self) -> None:
+        """Initializes a new empty latency histogram."""
+        self._counts = [0] * LatencyHistogram.BUCKETS
+        self._count = 0
+        self._total_ns = 0
+        self._max_ns = 0
+
+    def __str__(self) -> str:
+        """Returns a summary of the histogram.
+
+        Returns:
+            str: The number of latencies and their mean, median, p99 and maximum.
+
+        """
+        return (
+            f"n={self._count} mean={self.mean * 1e6:.1f}us "
+            f"p50<={self.quantile(0.5) * 1e6:.0f}us "
+            f"p99<={self.quantile(0.99) * 1e6:.0f}us max={self.max * 1e6:.1f}us"
+        )
+
+    @property
+    def count(self) -> int:
+        """Returns the number of recorded latencies."""
+        return self._count
+
+    @property
+    def total(self) -> float:
+        """Returns the sum of the recorded latencies in seconds."""
+        return self._total_ns / 1e9
+
+    @property
+    def mean(self) -> float:
+        """Returns the mean of the recorded latencies in seconds."""
+        return self._total_ns / self._count / 1e9 if self._count else 0.0
+
+    @property
+    def max(self) -> float:
+        """Returns the longest recorded latency in seconds."""
+        return self._max_ns / 1e9
+
+    @property
+    def buckets(self) -> tuple[int, ...]:
+        """Returns the number of latencies recorded per bucket."""
+        return tuple(self._counts)
+
+    def record(self, ns: int) -> None:
+        """Records a latency.
+
+        Args:
+            ns: The latency in nanoseconds.
+
+        """
+        self._counts[min((ns // 1000).bit_length(), LatencyHistogram.BUCKETS - 1)] += 1
+        self._count += 1
+        self._total_ns += ns
+        self._max_ns = max(self._max_ns, ns)
+
+    def quantile(self, q: float) -> float:
+        """Returns an upper bound of a quantile of the recorded latencies.
+
+        Args:
+            q: The quantile between 0 and 1, e.g. 0.99.
+
+        Returns:
+            float: The upper edge of the bucket holding the quantile in seconds.
+
+        """
+        rank = q * self._count
+        seen = 0
+        for bucket, count in enumerate(self._counts):
+            seen += count
+            if count and seen >= rank:
+                return min((1 << bucket) * 1e-6, self.max)
+        return self.max
+
+
+class CommandStats:
+    """Counters and latency histograms of the requests of one command.
+
+    Latencies are split into sending the request and waiting for the response.
+
+    """
+
+    def __init__(self) -> None:
+        """Initializes new empty command statistics."""
+        self.calls = 0
+        self.errors = 0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.send = LatencyHistogram()
+        self.wait = LatencyHistogram()
+
+    def __str__(self) -> str:
+        """Returns a summary of the statistics.
+
+        Returns:
+            str: The counters and the summaries of the latency histograms.
+
+        """
+        return (
+            f"calls={self.calls} errors={self.errors} "
+            f"out={self.bytes_sent}B in={self.bytes_received}B\n"
+            f"  send: {self.send}\n  wait: {self.wait}"
+        )
+
+
+class ProtocolStats:
+    """Statistics of the requests of a protocol by command, e.g. device.get_voltage.
+
+    Recording is thread-safe and cheap enough to stay enabled. Decoding time is
+    recorded for the protocol as a whole, once per chunk of received data, since a
+    chunk can hold the responses of several requests.
+
+    """
+
+    def __init__(self) -> None:
+        """Initializes new empty protocol statistics."""
+        self._lock = threading.Lock()
+        self._commands: dict[str, CommandStats] = {}
+        self._decode = LatencyHistogram()
+
+    def __str__(self) -> str:
+        """Returns a summary of the statistics of all commands.
+
+        Returns:
+            str: The summaries by command and of the decoding time.
+
+        """
+        return "\n".join(
+            [
+                *(f"{command}: {stats}" for command, stats in self.snapshot().items()),
+                f"decode: {self.decode}",
+            ]
+        )
+
+    @property
+    def decode(self) -> LatencyHistogram:
+        """Returns a copy of the histogram of the time spent decoding received data."""
+        with self._lock:
+            return copy.deepcopy(self._decode)
+
+    def decoded(self, ns: int) -> None:
+        """Records the time spent decoding a chunk of received data.
+
+        Args:
+            ns: The decoding time in nanoseconds.
+
+        """
+        with self._lock:
+            self._decode.record(ns)
+
+    def record(
+        self, command: str, sent: int, received: int, send_ns: int, wait_ns: int
+    ) -> None:
+        """Records a request that received its response.
+
+        Args:
+            command: The request message, e.g. device.get_voltage.
+            sent: The number of bytes of the request frame.
+            received: The number of bytes of the response frame.
+            send_ns: The time spent encoding and sending the request in nanoseconds.
+            wait_ns: The time spent waiting for the response in nanoseconds.
+
+        """
+        with self._lock:
+            if (stats := self._commands.get(command)) is None:
+                stats = self._commands[command] = CommandStats()
+            stats.calls += 1
+            stats.bytes_sent += sent
+            stats.bytes_received += received
+            stats.send.record(send_ns)
+            stats.wait.record(wait_ns)
+
+    def failed(self, command: str, *, answered: bool) -> None:
+        """Records a failed request.
+
+        Args:
+            command: The request message, e.g. device.get_voltage.
+            answered: Whether the request was already recorded with its response,
+                i.e. a failing response status.
+
+        """
+        with self._lock:
+            if (stats := self._commands.get(command)) is None:
+                stats = self._commands[command] = CommandStats()
+            stats.calls += not answered
+            stats.errors += 1
+
+    def snapshot(self) -> dict[str, CommandStats]:
+        """Returns a copy of the statistics by command.
+
+        Returns:
+            dict: The statistics by command.
+
+        """
+        with self._lock:
+            return copy.deepcopy(self._commands)
+
+    def reset(self) -> dict[str, CommandStats]:
+        """Clears the statistics, including the decoding time.
+
+        Returns:
+            dict: The statistics by command before they were cleared.
+
+        """
+        with self._lock:
+            commands, self._commands = self._commands, {}
+            self._decode = LatencyHistogram()
+        return commands
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+
+class TagAllocator:
+    """Allocates the request tags of the peary wire format.
+
+    Tags are packed as unsigned shorts, so allocation wraps around after the
+    largest tag. Tags still in flight are skipped when wrapping around and the tag
+    zero is never allocated.
+
+    """
+
+    class TagsExhaustedError(Exception):
+        """Exception for all tags being in flight."""
+
+    MAX_TAG = 0xFFFF
+
+    def __init__(self) -> None:
+        """Initializes a new tag allocator."""
+        self._tag = 0
+        self._in_flight: set[int] = set()
+
+    def acquire(self) -> int:
+        """Allocates the next tag that is not in flight.
+
+        Returns:
+            int: The allocated tag.
+
+        Raises:
+            TagsExhaustedError: If all tags are in flight.
+
+        """
+        if len(self._in_flight) >= TagAllocator.MAX_TAG:
+            raise TagAllocator.TagsExhaustedError(
+                f"All {TagAllocator.MAX_TAG} tags are in flight."
+            )
+        tag = self._tag % TagAllocator.MAX_TAG + 1
+        while tag in self._in_flight:  # pylint: disable=while-used
+            tag = tag % TagAllocator.MAX_TAG + 1
+        self._tag = tag
+        self._in_flight.add(tag)
+        return tag
+
+    def release(self, tag: int) -> None:
+        """Returns a tag once its response has been received.
+
+        Args:
+            tag: The tag to release.
+
+        """
+        self._in_flight.discard(tag)
+
+    def __contains__(self, tag: object) -> bool:
+        """Returns whether a tag is in flight.
+
+        Args:
+            tag: The tag to check.
+
+        Returns:
+            bool: True if the tag is in flight.
+
+        """
+        return tag in self._in_flight
+
+    def __len__(self) -> int:
+        """Returns the number of tags in flight.
+
+        Returns:
+            int: The number of tags in flight.
+
+        """
+        return len(self._in_flight)
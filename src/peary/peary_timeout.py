@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping
+
+
+class RttEstimator:
+    """Smoothed round-trip time and its variation estimated from samples.
+
+    Samples are combined into exponentially weighted moving averages of the
+    round-trip time and of its mean deviation, like the TCP retransmission timer.
+
+    """
+
+    ALPHA = 1 / 8
+    BETA = 1 / 4
+
+    def __init__(self) -> None:
+        """Initializes a new round-trip time estimator without samples."""
+        self._lock = threading.Lock()
+        self._srtt: float | None = None
+        self._rttvar = 0.0
+        self._samples = 0
+
+    @property
+    def srtt(self) -> float | None:
+        """Returns the smoothed round-trip time in seconds, or None without samples."""
+        return self._srtt
+
+    @property
+    def rttvar(self) -> float:
+        """Returns the mean deviation of the round-trip time in seconds."""
+        return self._rttvar
+
+    @property
+    def samples(self) -> int:
+        """Returns the number of samples."""
+        return self._samples
+
+    def update(self, rtt: float) -> None:
+        """Adds a round-trip time sample.
+
+        Args:
+            rtt: The measured round-trip time in seconds.
+
+        """
+        with self._lock:
+            if self._srtt is None:
+                self._srtt = rtt
+                self._rttvar = rtt / 2
+            else:
+                self._rttvar += RttEstimator.BETA * (
+                    abs(self._srtt - rtt) - self._rttvar
+                )
+                self._srtt += RttEstimator.ALPHA * (rtt - self._srtt)
+            self._samples += 1
+
+
+class AdaptiveTimeout:
+    """Request timeouts derived from the estimated round-trip time.
+
+    Commands time out after the smoothed round-trip time plus four times its
+    deviation, bounded by the minimum and maximum, so a dead link is detected quickly.
+    Commands that take long on the peary server, e.g. device.configure, are given a
+    fixed timeout by overriding them, i.e.
+
+        timeout = AdaptiveTimeout(overrides={"device.configure": 30})
+        with PearyClient(host, timeout=timeout) as proxy:
+            # requests time out adaptively
+
+    Estimates are fed with samples by a `PearyHeartbeat`.
+
+    """
+
+    DEVIATIONS = 4
+
+    def __init__(
+        self,
+        initial: float = 1,
+        *,
+        minimum: float = 0.05,
+        maximum: float = 10,
+        overrides: Mapping[str, float] | None = None,
+    ) -> None:
+        """Initializes a new adaptive timeout.
+
+        Args:
+            initial: Timeout in seconds until a round-trip time was sampled.
+                Defaults to 1.
+            minimum: Lower bound of the adaptive timeout in seconds. Defaults to 0.05.
+            maximum: Upper bound of the adaptive timeout in seconds. Defaults to 10.
+            overrides: Fixed timeouts in seconds by command, e.g. device.configure.
+
+        """
+        self._initial = initial
+        self._minimum = minimum
+        self._maximum = maximum
+        self._overrides = {**(overrides or {})}
+        self._estimator = RttEstimator()
+
+    @property
+    def estimator(self) -> RttEstimator:
+        """Returns the round-trip time estimator the timeouts adapt to."""
+        return self._estimator
+
+    def timeout(self, commands: Iterable[str] = ()) -> float:
+        """Returns the timeout of a batch of commands.
+
+        Args:
+            commands: Request messages of the batch.
+
+        Returns:
+            float: The longest timeout of the commands in seconds, or the adaptive
+                timeout without commands.
+
+        """
+        estimate = self._estimate()
+        return max(
+            (self._overrides.get(command, estimate) for command in commands),
+            default=estimate,
+        )
+
+    def _estimate(self) -> float:
+        """Returns the adaptive timeout of commands without override.
+
+        Returns:
+            float: The timeout in seconds.
+
+        """
+        if (srtt := self._estimator.srtt) is None:
+            return self._initial
+        return min(
+            max(
+                srtt + AdaptiveTimeout.DEVIATIONS * self._estimator.rttvar,
+                self._minimum,
+            ),
+            self._maximum,
+        )
@@ -0,0 +1,322 @@
+from __future__ import annotations
+
+import socket as socket_module
+import threading
+from typing import TYPE_CHECKING, Protocol
+
+from peary.peary_frame import FrameDecoder
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Hashable
+
+    from typing_extensions import Buffer
+
+    from peary.peary_frame import DecodedBytes
+    from peary.peary_transport_options import TransportOptions
+
+
+class Connection(Protocol):
+    """Byte stream connected to a peary server used by the peary protocol.
+
+    Sockets satisfy this interface, so any connected stream socket can be used.
+
+    """
+
+    def settimeout(self, value: float | None) -> None:
+        """Sets the timeout of blocking operations in seconds."""
+
+    def send(self, data: Buffer, flags: int = 0, /) -> int:
+        """Sends data and returns the number of bytes sent."""
+
+    def recv_into(self, buffer: Buffer, nbytes: int = 0, flags: int = 0, /) -> int:
+        """Receives data into a buffer and returns the number of bytes received."""
+
+    def shutdown(self, how: int, /) -> None:
+        """Shuts down one or both halves of the connection."""
+
+    def close(self) -> None:
+        """Closes the connection."""
+
+
+class Transport(Protocol):
+    """Means of connecting a peary client to a peary server."""
+
+    @property
+    def key(self) -> Hashable:
+        """Returns a stable key identifying the peary server, e.g. for caching."""
+
+    @property
+    def socket(self) -> Connection:
+        """Returns the connection established by `connect`."""
+
+    def connect(self) -> None:
+        """Establishes the connection."""
+
+    def reopen(self) -> None:
+        """Replaces a closed connection with a new one that is not connected yet."""
+
+
+class TcpTransport:
+    """Transport connecting to a peary server over TCP."""
+
+    def __init__(
+        self,
+        host: str,
+        port: int = 12345,
+        *,
+        socket_class: type[socket_module.socket] = socket_module.socket,
+        transport_options: TransportOptions | None = None,
+    ) -> None:
+        """Initializes a new TCP transport.
+
+        Args:
+            host: Hostname of the remote peary server.
+            port: Port number of the remote peary server. Defaults to 12345.
+            socket_class: Class used for the remote socket. Defaults to socket.
+            transport_options: Socket options applied before connecting, e.g.
+                LOW_LATENCY. Defaults to the socket defaults.
+
+        """
+        self._host = host
+        self._port = port
+        self._transport_options = transport_options
+        self._socket_class = socket_class
+        self._socket = socket_class(socket_module.AF_INET, socket_module.SOCK_STREAM)
+
+    def __str__(self) -> str:
+        """Returns the description of the remote peary server.
+
+        Returns:
+            str: The host and port of the remote peary server.
+
+        """
+        return f"host {self._host} using port {self._port}"
+
+    @property
+    def key(self) -> tuple[str, str, int]:
+        """Returns the protocol, host and port identifying the peary server."""
+        return ("tcp", self._host, self._port)
+
+    @property
+    def socket(self) -> socket_module.socket:
+        """Returns the socket."""
+        return self._socket
+
+    def connect(self) -> None:
+        """Applies the transport options, if any, and connects to the peary server."""
+        if self._transport_options is not None:
+            self._transport_options.apply(self._socket)
+        self._socket.connect((self._host, self._port))
+
+    def reopen(self) -> None:
+        """Replaces the socket with a new one that is not connected yet."""
+        self._socket = self._socket_class(
+            socket_module.AF_INET, socket_module.SOCK_STREAM
+        )
+
+
+class UnixTransport:
+    """Transport connecting to a co-located peary server over a Unix domain socket.
+
+    Unix domain sockets bypass the TCP/IP stack, which avoids the loopback overhead
+    when the client runs on the same system as the peary server.
+
+    """
+
+    def __init__(
+        self,
+        path: str,
+        *,
+        socket_class: type[socket_module.socket] = socket_module.socket,
+    ) -> None:
+        """Initializes a new Unix domain socket transport.
+
+        Args:
+            path: Filesystem path of the peary server socket.
+            socket_class: Class used for the socket. Defaults to socket.
+
+        """
+        self._path = path
+        self._socket_class = socket_class
+        self._socket = socket_class(socket_module.AF_UNIX, socket_module.SOCK_STREAM)
+
+    def __str__(self) -> str:
+        """Returns the description of the peary server socket.
+
+        Returns:
+            str: The path of the peary server socket.
+
+        """
+        return f"unix socket {self._path}"
+
+    @property
+    def key(self) -> tuple[str, str]:
+        """Returns the protocol and path identifying the peary server."""
+        return ("unix", self._path)
+
+    @property
+    def socket(self) -> socket_module.socket:
+        """Returns the socket."""
+        return self._socket
+
+    def connect(self) -> None:
+        """Connects to the peary server."""
+        self._socket.connect(self._path)
+
+    def reopen(self) -> None:
+        """Replaces the socket with a new one that is not connected yet."""
+        self._socket = self._socket_class(
+            socket_module.AF_UNIX, socket_module.SOCK_STREAM
+        )
+
+
+class LoopbackConnection:
+    """In-memory connection answering each request frame with a handler.
+
+    Requests are decoded and answered synchronously while sending, so no thread or
+    kernel network stack is involved. The handler returns the encoded response of a
+    frame, or None to close the connection.
+
+    """
+
+    def __init__(self, handler: Callable[[DecodedBytes], bytes | None]) -> None:
+        """Initializes a new loopback connection.
+
+        Args:
+            handler: Returns the encoded response of a request frame.
+
+        """
+        self._handler = handler
+        self._decoder = FrameDecoder()
+        self._condition = threading.Condition()
+        self._responses = bytearray()
+        self._timeout: float | None = None
+        self._closed = False
+
+    def settimeout(self, value: float | None) -> None:
+        """Sets the timeout of receive operations.
+
+        Args:
+            value: Timeout in seconds, or None to block indefinitely.
+
+        """
+        self._timeout = value
+
+    def send(self, data: Buffer, flags: int = 0, /) -> int:
+        """Answers the request frames completed by the data.
+
+        Args:
+            data: Encoded request frames.
+            flags: Unused, accepted for compatibility with sockets.
+
+        Returns:
+            int: The number of bytes sent.
+
+        Raises:
+            BrokenPipeError: If the connection is closed.
+
+        """
+        del flags
+        with self._condition:
+            if self._closed:
+                raise BrokenPipeError("Loopback connection closed.")
+            for frame in self._decoder.feed(data):
+                if (response := self._handler(frame)) is None:
+                    self._closed = True
+                    break
+                self._responses += response
+            self._condition.notify_all()
+        with memoryview(data) as view:
+            return view.nbytes
+
+    def recv_into(self, buffer: Buffer, nbytes: int = 0, flags: int = 0, /) -> int:
+        """Receives responses into a buffer.
+
+        Args:
+            buffer: Writable buffer receiving the responses.
+            nbytes: Maximum number of bytes to receive. Defaults to the buffer size.
+            flags: Unused, accepted for compatibility with sockets.
+
+        Returns:
+            int: The number of bytes received, zero once the connection is closed.
+
+        Raises:
+            timeout: If no response arrived within the timeout.
+
+        """
+        del flags
+        with self._condition:
+            if not self._condition.wait_for(
+                lambda: self._responses or self._closed, self._timeout
+            ):
+                raise socket_module.timeout("timed out")
+            with memoryview(buffer) as view:
+                size = min(nbytes or view.nbytes, len(self._responses))
+                view.cast("B")[:size] = self._responses[:size]
+            del self._responses[:size]
+            return size
+
+    def shutdown(self, how: int, /) -> None:
+        """Closes the connection and wakes up pending receives.
+
+        Args:
+            how: Unused, both directions are always shut down.
+
+        """
+        del how
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+
+    def close(self) -> None:
+        """Closes the connection."""
+        self.shutdown(socket_module.SHUT_RDWR)
+
+
+class LoopbackTransport:
+    """Transport connecting to an in-memory peary server.
+
+    Benchmarks and tests can use the loopback transport to exercise the client
+    without a peary server or the kernel network stack, i.e.
+
+        with PearyClient(transport=LoopbackTransport(handler)) as proxy:
+            # do something with the proxy
+
+    """
+
+    def __init__(self, handler: Callable[[DecodedBytes], bytes | None]) -> None:
+        """Initializes a new loopback transport.
+
+        Args:
+            handler: Returns the encoded response of a request frame, or None to
+                close the connection.
+
+        """
+        self._handler = handler
+        self._socket = LoopbackConnection(handler)
+
+    def __str__(self) -> str:
+        """Returns the description of the in-memory peary server.
+
+        Returns:
+            str: The loopback description.
+
+        """
+        return "loopback"
+
+    @property
+    def key(self) -> tuple[str, Callable[[DecodedBytes], bytes | None]]:
+        """Returns the handler identifying the in-memory peary server."""
+        return ("loopback", self._handler)
+
+    @property
+    def socket(self) -> LoopbackConnection:
+        """Returns the loopback connection."""
+        return self._socket
+
+    def connect(self) -> None:
+        """Connects to the in-memory peary server, which is always available."""
+
+    def reopen(self) -> None:
+        """Replaces the loopback connection with a new one."""
+        self._socket = LoopbackConnection(self._handler)
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import socket as socket_module
+from typing import NamedTuple
+
+
+class TransportOptions(NamedTuple):
+    """Socket options applied to a peary connection before connecting.
+
+    Peary requests are small frames answered one by one, so Nagle's algorithm
+    combined with delayed acknowledgements can stall each request by tens of
+    milliseconds. The predefined profiles cover the common use cases, i.e.
+
+        PearyClient(host, transport_options=PearyClient.BULK_THROUGHPUT)
+
+    """
+
+    nodelay: bool = False
+    keepalive: bool = False
+    send_buffer_size: int | None = None
+    receive_buffer_size: int | None = None
+
+    def apply(self, socket: socket_module.socket) -> None:
+        """Sets the options on a TCP socket.
+
+        Buffer sizes are applied before connecting so the TCP window scaling
+        negotiated during the handshake can make use of them.
+
+        Args:
+            socket: The unconnected TCP socket.
+
+        """
+        socket.setsockopt(
+            socket_module.IPPROTO_TCP, socket_module.TCP_NODELAY, int(self.nodelay)
+        )
+        socket.setsockopt(
+            socket_module.SOL_SOCKET, socket_module.SO_KEEPALIVE, int(self.keepalive)
+        )
+        if self.send_buffer_size is not None:
+            socket.setsockopt(
+                socket_module.SOL_SOCKET, socket_module.SO_SNDBUF, self.send_buffer_size
+            )
+        if self.receive_buffer_size is not None:
+            socket.setsockopt(
+                socket_module.SOL_SOCKET,
+                socket_module.SO_RCVBUF,
+                self.receive_buffer_size,
+            )
+
+
+LOW_LATENCY = TransportOptions(nodelay=True)
+BULK_THROUGHPUT = TransportOptions(
+    nodelay=True, send_buffer_size=4 << 20, receive_buffer_size=4 << 20
+)
+LONG_LIVED = TransportOptions(nodelay=True, keepalive=True)
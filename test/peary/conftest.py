@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import socket as socket_module
+from contextlib import ExitStack
+from typing import TYPE_CHECKING
+
+import pytest
+
+from peary.peary_frame import FrameEncoder
+from peary.peary_mock import MockPearyDevice, MockPearyModel
+from peary.peary_mock_server import MockPearyServer
+from peary.peary_protocol import PearyProtocol
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Generator, Iterable, Mapping
+
+    from peary.peary_frame import DecodedBytes
+
+    Handler = Callable[[DecodedBytes], bytes | None]
+
+
+class Clock:
+    """Clock advanced manually by the tests."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class PearyServerModel(MockPearyModel):
+    """Peary server model with the knobs of the client tests.
+
+    Host requests unknown to the model are echoed back, so tests can send arbitrary
+    messages, and rejected requests fail. The version answered can be overridden,
+    the handshakes are counted and the received payloads recorded. While drop is
+    set the next request closes the connection instead of being answered.
+
+    """
+
+    def __init__(
+        self,
+        registers: Mapping[str, Mapping[str, int]] | None = None,
+        *,
+        version: bytes = PearyProtocol.VERSION,
+        latency: float | Callable[[str], float] = 0,
+        rejected: Iterable[str] = (),
+    ) -> None:
+        super().__init__(registers, latency=latency)
+        self.version = version
+        self.rejected = {*rejected}
+        self.handshakes = 0
+        self.drop = False
+        self.received: list[bytes] = []
+
+    def handle(self, msg: str, *args: str) -> bytes:
+        if msg in self.rejected:
+            raise MockPearyDevice.CommandError(f"Rejected command: {msg}")
+        if msg == "protocol_version":
+            self.handshakes += 1
+            return self.version
+        if msg.startswith("device."):
+            return super().handle(msg, *args)
+        try:
+            return super().handle(msg, *args)
+        except MockPearyDevice.CommandError:
+            return " ".join((msg, *args)).encode("utf-8")
+
+    def __call__(self, frame: DecodedBytes) -> bytes | None:  # type: ignore[override]
+        if self.drop:
+            self.drop = False
+            return None
+        self.received.append(frame.payload)
+        return super().__call__(frame)
+
+
+def _echo(frame: DecodedBytes) -> bytes:
+    return FrameEncoder.encode(*frame)
+
+
+@pytest.fixture(name="clock")
+def _clock() -> Clock:
+    """Clock starting at 0 advanced by setting its now attribute."""
+    return Clock()
+
+
+@pytest.fixture(name="peary_model")
+def _peary_model() -> Callable[..., PearyServerModel]:
+    """Creates peary server models to be used as LoopbackTransport handlers."""
+    return PearyServerModel
+
+
+@pytest.fixture(name="mock_server")
+def _mock_server() -> Generator[Callable[..., socket_module.socket]]:
+    """Connects to mock peary servers answering each frame with a handler.
+
+    The handler returns the bytes sent back for a frame, or None to close the
+    connection. By default every frame is echoed back.
+
+    """
+    with ExitStack() as stack:
+
+        def _connect(handler: Handler = _echo) -> socket_module.socket:
+            server = stack.enter_context(MockPearyServer(handler=handler))
+            client = stack.enter_context(
+                socket_module.create_connection(server.address)
+            )
+            client.setsockopt(socket_module.IPPROTO_TCP, socket_module.TCP_NODELAY, 1)
+            return client
+
+        yield _connect
@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import asyncio
+from functools import partial
+from typing import TYPE_CHECKING, TypeVar
+
+import pytest
+
+from peary.peary_frame import DecodedBytes, FrameDecoder
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+    from ..conftest import PearyServerModel  # noqa: TID252
+
+    Handler = Callable[[DecodedBytes], bytes | None]
+
+T = TypeVar("T")
+
+
+async def _serve(
+    handler: Handler, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+) -> None:
+    decoder = FrameDecoder()
+    while data := await reader.read(4096):  # pylint: disable=while-used
+        for frame in decoder.feed(data):
+            if (response := handler(frame)) is None:
+                writer.close()
+                return
+            writer.write(response)
+        await writer.drain()
+    writer.close()
+
+
+@pytest.fixture(name="run_with_server")
+def _run_with_server(peary_model: Callable[..., PearyServerModel]) -> Callable:
+    def _run(
+        scenario: Callable[[str, int], Awaitable[T]], handler: Handler | None = None
+    ) -> T:
+        async def _main() -> T:
+            server = await asyncio.start_server(
+                partial(_serve, handler or peary_model()), "127.0.0.1", 0
+            )
+            async with server:
+                host, port = server.sockets[0].getsockname()[:2]
+                return await scenario(host, port)
+
+        return asyncio.run(_main())
+
+    return _run
@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from peary import AsyncPearyClient, AsyncPearyProxy
+from peary.peary_async_protocol import AsyncPearyProtocol
+from peary.peary_protocol import PearyProtocol
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from ..conftest import PearyServerModel  # noqa: TID252
+
+
+def test_peary_async_client_context_returns_proxy(run_with_server: Callable) -> None:
+    async def scenario(host: str, port: int) -> None:
+        async with AsyncPearyClient(host, port) as proxy:
+            assert isinstance(proxy, AsyncPearyProxy)
+            assert await proxy.keep_alive() == b""
+
+    run_with_server(scenario)
+
+
+def test_peary_async_client_context_exit_closes(run_with_server: Callable) -> None:
+    async def scenario(host: str, port: int) -> None:
+        async with AsyncPearyClient(host, port) as proxy:
+            pass
+        with pytest.raises(
+            PearyProtocol.ResponseReceiveError, match="Failed to receive response"
+        ):
+            await proxy.keep_alive()
+
+    run_with_server(scenario)
+
+
+def test_peary_async_client_context_connect_error(run_with_server: Callable) -> None:
+    async def scenario(*_: object) -> None:
+        with pytest.raises(AsyncPearyClient.PearySockerError) as e:
+            async with AsyncPearyClient("-", 0):
+                pass  # pragma: no cover
+        assert "Unable to connect to host - using port 0." in str(e)
+
+    run_with_server(scenario)
+
+
+def test_peary_async_client_context_version_error(
+    run_with_server: Callable, peary_model: Callable[..., PearyServerModel]
+) -> None:
+    async def scenario(host: str, port: int) -> None:
+        with pytest.raises(
+            PearyProtocol.VersionError, match="Unsupported protocol version: b'0'"
+        ):
+            async with AsyncPearyClient(host, port):
+                pass  # pragma: no cover
+
+    run_with_server(scenario, peary_model(version=b"0"))
+
+
+def test_peary_async_client_context_open_error_closes(
+    run_with_server: Callable,
+) -> None:
+    closed: list[bool] = []
+
+    class MockProtocol(AsyncPearyProtocol):
+        """A Mock Protocol."""
+
+        async def close(self) -> None:
+            closed.append(True)
+            await super().close()
+
+    async def scenario(host: str, port: int) -> None:
+        with pytest.raises(PearyProtocol.ResponseReceiveError):
+            async with AsyncPearyClient(host, port, protocol_class=MockProtocol):
+                pass  # pragma: no cover
+        assert closed == [True]
+
+    run_with_server(scenario, lambda _: None)
+
+
+def test_peary_async_client_protocol_class(run_with_server: Callable) -> None:
+    class MockProtocol(AsyncPearyProtocol):
+        """A Mock Protocol."""
+
+    async def scenario(host: str, port: int) -> None:
+        async with AsyncPearyClient(host, port, protocol_class=MockProtocol) as proxy:
+            assert isinstance(proxy.protocol, MockProtocol)
+
+    run_with_server(scenario)
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+
+from peary.peary_async_device import AsyncPearyDevice
+from peary.peary_async_protocol import AsyncPearyProtocol
+from peary.peary_frame import FrameEncoder
+from peary.peary_protocol import PearyProtocol
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+    from peary.peary_frame import DecodedBytes
+
+
+def _run_with_device(
+    run_with_server: Callable,
+    scenario: Callable[[AsyncPearyDevice], Awaitable[None]],
+    resp: bytes | None = None,
+) -> None:
+    def handler(frame: DecodedBytes) -> bytes:
+        return FrameEncoder.encode(resp or frame.payload, frame.tag, frame.status)
+
+    async def _scenario(host: str, port: int) -> None:
+        protocol = AsyncPearyProtocol(
+            *await asyncio.open_connection(host, port),
+            checks=PearyProtocol.Checks.CHECK_NONE,
+        )
+        await protocol.open()
+        device = AsyncPearyDevice(1, protocol)
+        assert device.protocol is protocol
+        await scenario(device)
+        await protocol.close()
+
+    run_with_server(_scenario, handler)
+
+
+def test_peary_async_device_commands(run_with_server: Callable) -> None:
+    async def scenario(device: AsyncPearyDevice) -> None:
+        assert await device.power_on() == b"device.power_on 1"
+        assert await device.power_off() == b"device.power_off 1"
+        assert await device.reset() == b"device.reset 1"
+        assert await device.configure() == b"device.configure 1"
+        assert await device.daq_start() == b"device.daq_start 1"
+        assert await device.daq_stop() == b"device.daq_stop 1"
+        assert await device.switch_on("a") == b"device.switch_on 1 a"
+        assert await device.switch_off("a") == b"device.switch_off 1 a"
+        assert await device.set_register("a", 2) == b"device.set_register 1 a 2"
+        assert await device.set_memory("a", 2) == b"device.set_memory 1 a 2"
+        assert await device.set_current("a", 2.0) == b"device.set_current 1 a 2.0"
+        assert await device.set_voltage("a", 2.0) == b"device.set_voltage 1 a 2.0"
+        assert await device.list_registers() == ["device.list_registers", "1"]
+
+    _run_with_device(run_with_server, scenario)
+
+
+def test_peary_async_device_values(run_with_server: Callable) -> None:
+    async def scenario(device: AsyncPearyDevice) -> None:
+        assert device.index == 1
+        assert await device.get_register("a") == 2
+        assert await device.get_memory("a") == 2
+        assert await device.get_current("a") == 2.0
+        assert await device.get_voltage("a") == 2.0
+
+    _run_with_device(run_with_server, scenario, b"2")
+
+
+def test_peary_async_device_concurrent_values(run_with_server: Callable) -> None:
+    async def scenario(device: AsyncPearyDevice) -> None:
+        assert (
+            await asyncio.gather(*(device.get_voltage(str(ii)) for ii in range(10)))
+            == [2.0] * 10
+        )
+
+    _run_with_device(run_with_server, scenario, b"2")
+
+
+def test_peary_async_device_name(run_with_server: Callable) -> None:
+    async def scenario(device: AsyncPearyDevice) -> None:
+        assert repr(device) == "AsyncPearyDevice(1)"
+        assert await device.name() == "device.name 1"
+        assert await device.name() == "device.name 1"
+        assert repr(device) == "device.name 1(1)"
+
+    _run_with_device(run_with_server, scenario)
@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+
+import pytest
+
+from peary.peary_async_protocol import AsyncPearyProtocol
+from peary.peary_frame import FrameEncoder
+from peary.peary_protocol import PearyProtocol
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from peary.peary_frame import DecodedBytes
+
+    from ..conftest import PearyServerModel  # noqa: TID252
+
+
+async def _open_protocol(
+    host: str, port: int, timeout: float = 1
+) -> AsyncPearyProtocol:
+    protocol = AsyncPearyProtocol(
+        *await asyncio.open_connection(host, port),
+        timeout=timeout,
+        checks=PearyProtocol.Checks.CHECK_NONE,
+    )
+    await protocol.open()
+    return protocol
+
+
+def test_peary_async_protocol_request(run_with_server: Callable) -> None:
+    async def scenario(host: str, port: int) -> None:
+        protocol = await _open_protocol(host, port)
+        assert await protocol.request("alpha", "beta") == b"alpha beta"
+        await protocol.close()
+
+    run_with_server(scenario)
+
+
+def test_peary_async_protocol_request_version_check(
+    run_with_server: Callable, peary_model: Callable[..., PearyServerModel]
+) -> None:
+    model = peary_model()
+
+    async def scenario(host: str, port: int) -> None:
+        protocol = AsyncPearyProtocol(*await asyncio.open_connection(host, port))
+        await protocol.open()
+        await protocol.close()
+
+    run_with_server(scenario, model)
+    assert model.received == [b"protocol_version"]
+
+
+def test_peary_async_protocol_concurrent_requests_matched_by_tag(
+    run_with_server: Callable,
+) -> None:
+    received: list[DecodedBytes] = []
+
+    def handler(frame: DecodedBytes) -> bytes:
+        received.append(frame)
+        if len(received) < 3:
+            return b""
+        return b"".join(FrameEncoder.encode(*_) for _ in reversed(received))
+
+    async def scenario(host: str, port: int) -> None:
+        protocol = await _open_protocol(host, port)
+        assert await asyncio.gather(
+            protocol.request("alpha"), protocol.request("beta"), protocol.request("c")
+        ) == [b"alpha", b"beta", b"c"]
+        await protocol.close()
+
+    run_with_server(scenario, handler)
+
+
+def test_peary_async_protocol_request_status_error(run_with_server: Callable) -> None:
+    def handler(frame: DecodedBytes) -> bytes:
+        return FrameEncoder.encode(b"", frame.tag, 1)
+
+    async def scenario(host: str, port: int) -> None:
+        protocol = await _open_protocol(host, port)
+        with pytest.raises(
+            PearyProtocol.ResponseStatusError, match="Failed response status 1"
+        ):
+            await protocol.request("alpha")
+        await protocol.close()
+
+    run_with_server(scenario, handler)
+
+
+def test_peary_async_protocol_request_many(run_with_server: Callable) -> None:
+    def handler(frame: DecodedBytes) -> bytes:
+        return FrameEncoder.encode(frame.payload, frame.tag, frame.payload == b"b")
+
+    async def scenario(host: str, port: int) -> None:
+        protocol = await _open_protocol(host, port)
+        responses = await protocol.request_many([("a",), ("b",), ("c", "d")])
+        await protocol.close()
+        assert responses[0] == b"a"
+        assert isinstance(responses[1], PearyProtocol.ResponseStatusError)
+        assert responses[2] == b"c d"
+
+    run_with_server(scenario, handler)
+
+
+def test_peary_async_protocol_request_many_window(run_with_server: Callable) -> None:
+    async def scenario(host: str, port: int) -> None:
+        protocol = await _open_protocol(host, port)
+        requests = [(str(ii),) for ii in range(70000)]
+        responses = await protocol.request_many(requests, window=64)
+        assert responses == [str(ii).encode() for ii in range(70000)]
+        assert await protocol.request_many([("a",), ("b",)], window=1) == [b"a", b"b"]
+        for window in (0, -1):
+            with pytest.raises(ValueError, match=f"Invalid request window: {window}"):
+                await protocol.request_many(requests, window=window)
+        await protocol.close()
+
+    run_with_server(scenario)
+
+
+def test_peary_async_protocol_request_timeout_drops_late_response(
+    run_with_server: Callable,
+) -> None:
+    withheld: list[DecodedBytes] = []
+
+    def handler(frame: DecodedBytes) -> bytes:
+        if frame.payload == b"slow":
+            withheld.append(frame)
+            return b""
+        return b"".join(FrameEncoder.encode(*_) for _ in (*withheld, frame))
+
+    async def scenario(host: str, port: int) -> None:
+        protocol = await _open_protocol(host, port, timeout=0.05)
+        with pytest.raises(asyncio.TimeoutError):
+            await protocol.request("slow")
+        assert await protocol.request("fast") == b"fast"
+        await protocol.close()
+
+    run_with_server(scenario, handler)
+
+
+def test_peary_async_protocol_connection_closed(run_with_server: Callable) -> None:
+    async def scenario(host: str, port: int) -> None:
+        protocol = await _open_protocol(host, port)
+        with pytest.raises(
+            PearyProtocol.ResponseReceiveError, match="Failed to receive response"
+        ):
+            await protocol.request("alpha")
+        with pytest.raises(
+            PearyProtocol.ResponseReceiveError, match="Failed to receive response"
+        ):
+            await protocol.request("alpha")
+        await protocol.close()
+
+    run_with_server(scenario, lambda _: None)
+
+
+def test_peary_async_protocol_decode_error(run_with_server: Callable) -> None:
+    async def scenario(host: str, port: int) -> None:
+        protocol = await _open_protocol(host, port)
+        with pytest.raises(PearyProtocol.ResponseReceiveError) as e:
+            await protocol.request("alpha")
+        assert isinstance(e.value.__cause__, PearyProtocol.DecodeError)
+        await protocol.close()
+
+    run_with_server(scenario, lambda _: b"\x00\x00\x00\x01")
+
+
+def test_peary_async_protocol_request_before_open(run_with_server: Callable) -> None:
+    async def scenario(host: str, port: int) -> None:
+        protocol = AsyncPearyProtocol(*await asyncio.open_connection(host, port))
+        with pytest.raises(
+            PearyProtocol.ResponseReceiveError, match="Failed to receive response"
+        ):
+            await protocol.request("alpha")
+        await protocol.close()
+
+    run_with_server(scenario)
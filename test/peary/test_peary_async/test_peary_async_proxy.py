@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from peary import AsyncPearyClient, AsyncPearyProxy
+from peary.peary_async_device import AsyncPearyDevice
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+def test_peary_async_proxy_devices(run_with_server: Callable) -> None:
+    class MockDevice(AsyncPearyDevice):
+        pass
+
+    async def scenario(host: str, port: int) -> None:
+        async with AsyncPearyClient(host, port) as proxy:
+            assert not proxy.list_devices()
+            device = await proxy.add_device("alpha")
+            assert isinstance(device, AsyncPearyDevice)
+            assert device.index == 0
+            assert proxy.get_device("alpha") is device
+            assert isinstance(await proxy.add_device("beta", MockDevice), MockDevice)
+            assert proxy.list_devices() == ["alpha", "beta"]
+            assert await proxy.list_remote_devices() == b"alpha beta"
+            await proxy.clear_devices()
+            assert not proxy.list_devices()
+
+    run_with_server(scenario)
+
+
+def test_peary_async_proxy_add_device_repeated_name(run_with_server: Callable) -> None:
+    async def scenario(host: str, port: int) -> None:
+        async with AsyncPearyClient(host, port) as proxy:
+            await proxy.add_device("a")
+            with pytest.raises(
+                AsyncPearyProxy.PearyProxyAddDeviceError,
+                match="Device already exists: a",
+            ):
+                await proxy.add_device("a")
+
+    run_with_server(scenario)
+
+
+def test_peary_async_proxy_get_device_unknown(run_with_server: Callable) -> None:
+    async def scenario(host: str, port: int) -> None:
+        async with AsyncPearyClient(host, port) as proxy:
+            with pytest.raises(
+                AsyncPearyProxy.PearyProxyGetDeviceError, match="Unknown device: a"
+            ):
+                proxy.get_device("a")
+
+    run_with_server(scenario)
@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import asyncio
+import time
+
+import pytest
+
+from peary.peary_async_client import AsyncPearyClient
+from peary.peary_async_mock_server import AsyncMockPearyServer
+from peary.peary_mock import MockPearyModel
+
+
+def test_peary_async_mock_server_client() -> None:
+    async def _main() -> list[float]:
+        async with (
+            AsyncMockPearyServer(MockPearyModel(latency=0.05)) as server,
+            AsyncPearyClient(*server.address) as proxy,
+        ):
+            device = await proxy.add_device("SpacelyCaribouBasic")
+            await device.set_voltage("PWR_OUT_1", 1.8)
+            return await asyncio.gather(
+                *(device.get_voltage("PWR_OUT_1") for _ in range(10))
+            )
+
+    start = time.perf_counter()
+    assert asyncio.run(_main()) == [1.8] * 10
+    assert time.perf_counter() - start < 0.5
+
+
+def test_peary_async_mock_server_stop_with_open_connection() -> None:
+    async def _main() -> None:
+        server = AsyncMockPearyServer()
+        await server.start()
+        reader, writer = await asyncio.open_connection(*server.address)
+        await server.stop()
+        assert await reader.read() == b""
+        writer.close()
+        await server.stop()
+
+    asyncio.run(_main())
+
+
+def test_peary_async_mock_server_not_started() -> None:
+    server = AsyncMockPearyServer()
+    assert isinstance(server.model, MockPearyModel)
+    with pytest.raises(RuntimeError, match="not started"):
+        _ = server.address
@@ -20,6 +20,7 @@ class MockSocket(socket_module.socket):
     is_connected: bool | None = None
     is_shutdown: bool | None = None
     how_shutdown: int | None = None
+    options: dict[tuple[int, int], int] = {}  # noqa: RUF012
 
     # pylint: disable=super-init-not-called,unused-argument,redefined-builtin
     def __init__(
@@ -53,9 +54,24 @@ class MockSocket(socket_module.socket):
     def settimeout(self, value: float | None = None) -> None:
         """Mock settimeout method"""
 
-    # pylint: disable-next=W0613
-    def recv(self, size: int, flags: int = 0) -> bytes:  # noqa: ARG002
-        return PearyProtocol.encode(PearyProtocol.VERSION, 1, PearyProtocol.STATUS_OK)
+    # pylint: disable=unused-argument
+    def setsockopt(  # type: ignore[override]
+        self, level: int, optname: int, value: int, optlen: int = 0  # noqa: ARG002
+    ) -> None:
+        """Mock setsockopt method"""
+        MockSocket.options[level, optname] = value
+
+    # pylint: enable=unused-argument
+
+    # pylint: disable=unused-argument
+    def recv_into(
+        self, buffer: Buffer, nbytes: int = 0, flags: int = 0  # noqa: ARG002
+    ) -> int:
+        data = PearyProtocol.encode(PearyProtocol.VERSION, 1, PearyProtocol.STATUS_OK)
+        memoryview(buffer)[: len(data)] = data
+        return len(data)
+
+    # pylint: enable=unused-argument
 
     # pylint: disable-next=W0613
     def send(self, data: Buffer, flags: int = 0) -> int:  # noqa: ARG002
@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from peary.peary_client import PearyClient
+from peary.peary_handshake_cache import HandshakeCache
+from peary.peary_multiplex_protocol import PearyMultiplexProtocol
+from peary.peary_protocol import PearyProtocol
+from peary.peary_transport import LoopbackTransport
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from ..conftest import Clock, PearyServerModel  # noqa: TID252
+
+
+def _connect(
+    model: PearyServerModel,
+    cache: HandshakeCache | None,
+    protocol_class: type[PearyProtocol] = PearyProtocol,
+) -> PearyClient:
+    return PearyClient(
+        transport=LoopbackTransport(model),
+        protocol_class=protocol_class,
+        handshake_cache=cache,
+    )
+
+
+def test_peary_client_handshake_without_cache(
+    peary_model: Callable[..., PearyServerModel],
+) -> None:
+    server = peary_model()
+    for _ in range(2):
+        with _connect(server, None) as proxy:
+            proxy.keep_alive()
+    assert server.received == [b"protocol_version", b""] * 2
+
+
+@pytest.mark.parametrize("protocol_class", [PearyProtocol, PearyMultiplexProtocol])
+def test_peary_client_handshake_cached(
+    protocol_class: type[PearyProtocol], peary_model: Callable[..., PearyServerModel]
+) -> None:
+    server = peary_model()
+    cache = HandshakeCache()
+    for _ in range(3):
+        with _connect(server, cache, protocol_class) as proxy:
+            proxy.keep_alive()
+    assert server.received == [b"protocol_version", b"", b"", b""]
+    assert cache.lookup(LoopbackTransport(server).key) == PearyProtocol.VERSION
+
+
+def test_peary_client_handshake_not_cached_without_request(
+    peary_model: Callable[..., PearyServerModel],
+) -> None:
+    server = peary_model()
+    cache = HandshakeCache()
+    with _connect(server, cache):
+        pass
+    assert not server.received
+    assert cache.lookup(LoopbackTransport(server).key) is None
+
+
+def test_peary_client_handshake_expired(
+    peary_model: Callable[..., PearyServerModel], clock: Clock
+) -> None:
+    server = peary_model()
+    cache = HandshakeCache(10, clock=clock)
+    with _connect(server, cache) as proxy:
+        proxy.keep_alive()
+    clock.now = 10
+    with _connect(server, cache) as proxy:
+        proxy.keep_alive()
+    assert server.received == [b"protocol_version", b""] * 2
+
+
+@pytest.mark.parametrize("protocol_class", [PearyProtocol, PearyMultiplexProtocol])
+def test_peary_client_handshake_unsupported_not_cached(
+    protocol_class: type[PearyProtocol], peary_model: Callable[..., PearyServerModel]
+) -> None:
+    server = peary_model(version=b"0")
+    cache = HandshakeCache()
+    with _connect(server, cache, protocol_class) as proxy:
+        with pytest.raises(PearyProtocol.VersionError):
+            proxy.keep_alive()
+        with pytest.raises(PearyProtocol.VersionError):
+            proxy.keep_alive()
+    assert server.received == [b"protocol_version", b""]
+    assert cache.lookup(LoopbackTransport(server).key) is None
+
+
+def test_peary_client_handshake_cached_once_verified(
+    peary_model: Callable[..., PearyServerModel],
+) -> None:
+    server = peary_model()
+    cache = HandshakeCache()
+    with _connect(server, cache) as proxy:
+        proxy.keep_alive()
+        assert cache.lookup(LoopbackTransport(server).key) == PearyProtocol.VERSION
+
+
+def test_peary_client_handshake_cached_per_server(
+    peary_model: Callable[..., PearyServerModel],
+) -> None:
+    servers = [peary_model(), peary_model()]
+    cache = HandshakeCache()
+    for server in servers:
+        with _connect(server, cache) as proxy:
+            proxy.keep_alive()
+    assert all(server.received == [b"protocol_version", b""] for server in servers)
+    assert len(cache) == 2
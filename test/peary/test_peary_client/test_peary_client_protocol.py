@@ -2,8 +2,12 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+import pytest
+
 from peary.peary_client import PearyClient
+from peary.peary_multiplex_protocol import PearyMultiplexProtocol
 from peary.peary_protocol import PearyProtocol
+from peary.peary_reconnect import PearyReconnectingProtocol, ReconnectPolicy
 
 if TYPE_CHECKING:
     import socket as socket_module
@@ -28,3 +32,35 @@ def test_peary_client_protocol_class(
     ) as client:
         client.keep_alive()
     assert request_collection == ["protocol_version", ""]
+
+
+def test_peary_client_protocol_class_with_reconnect(
+    mock_socket_class: type[socket_module.socket],
+) -> None:
+    request_collection = []
+
+    class MockProtocol(PearyReconnectingProtocol):
+        """A Mock reconnecting Protocol."""
+
+        def request(
+            self, msg: str, *args: str, buffer_size: int = 4096  # noqa: ARG002
+        ) -> bytes:
+            request_collection.append(" ".join([msg, *args]))
+            return b"1"
+
+    with PearyClient(
+        "",
+        protocol_class=MockProtocol,
+        socket_class=mock_socket_class,
+        reconnect=ReconnectPolicy(),
+    ) as client:
+        client.keep_alive()
+    assert request_collection == ["protocol_version", ""]
+
+
+def test_peary_client_protocol_class_cannot_reconnect() -> None:
+    with pytest.raises(
+        ValueError,
+        match="Invalid protocol class with reconnect: PearyMultiplexProtocol",
+    ):
+        PearyClient(protocol_class=PearyMultiplexProtocol, reconnect=ReconnectPolicy())
@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from peary.peary_client import PearyClient
+from peary.peary_recorder import WireRecorder
+from peary.peary_transport import LoopbackTransport
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from ..conftest import PearyServerModel  # noqa: TID252
+
+
+def test_peary_client_recorder(peary_model: Callable[..., PearyServerModel]) -> None:
+    recorder = WireRecorder()
+    transport = LoopbackTransport(peary_model())
+    with PearyClient(transport=transport, recorder=recorder) as proxy:
+        proxy.keep_alive()
+    assert [(record.direction, record.payload) for record in recorder.records()] == [
+        (WireRecorder.SENT, b""),
+        (WireRecorder.RECEIVED, b""),
+    ]
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import socket as socket_module
+from typing import TYPE_CHECKING
+
+import pytest
+
+from peary.peary_client import PearyClient
+
+if TYPE_CHECKING:
+    from peary.peary_transport_options import TransportOptions
+
+    from .conftest import MockSocket
+
+NODELAY = (socket_module.IPPROTO_TCP, socket_module.TCP_NODELAY)
+KEEPALIVE = (socket_module.SOL_SOCKET, socket_module.SO_KEEPALIVE)
+SNDBUF = (socket_module.SOL_SOCKET, socket_module.SO_SNDBUF)
+RCVBUF = (socket_module.SOL_SOCKET, socket_module.SO_RCVBUF)
+
+
+def test_peary_client_transport_default_socket_options(
+    mock_socket_class: type[MockSocket],
+) -> None:
+    mock_socket_class.options = {}
+    with PearyClient("", socket_class=mock_socket_class):
+        assert mock_socket_class.options == {}
+
+
+@pytest.mark.parametrize(
+    ("transport_options", "expected"),
+    [
+        (PearyClient.LOW_LATENCY, {NODELAY: 1, KEEPALIVE: 0}),
+        (
+            PearyClient.BULK_THROUGHPUT,
+            {NODELAY: 1, KEEPALIVE: 0, SNDBUF: 4 << 20, RCVBUF: 4 << 20},
+        ),
+        (PearyClient.LONG_LIVED, {NODELAY: 1, KEEPALIVE: 1}),
+    ],
+)
+def test_peary_client_transport_profiles(
+    mock_socket_class: type[MockSocket],
+    transport_options: TransportOptions,
+    expected: dict[tuple[int, int], int],
+) -> None:
+    mock_socket_class.options = {}
+    with PearyClient(
+        "", socket_class=mock_socket_class, transport_options=transport_options
+    ):
+        assert mock_socket_class.options == expected
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING
+
+import pytest
+
+from peary.peary_client import PearyClient
+from peary.peary_cluster import PearyCluster
+from peary.peary_device import PearyDevice
+from peary.peary_protocol import PearyProtocol
+from peary.peary_proxy import PearyProxy
+from peary.peary_transport import LoopbackTransport
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from ..conftest import PearyServerModel  # noqa: TID252
+
+DELAY = 0.2
+
+
+class Farm:
+    """In-memory peary servers, one per host."""
+
+    def __init__(self, peary_model: Callable[..., PearyServerModel]) -> None:
+        self.peary_model = peary_model
+        self.models: dict[str, PearyServerModel] = {}
+        self.transports: dict[str, LoopbackTransport] = {}
+
+    def client(self, host: str) -> PearyClient:
+        if host == "offline":
+            return PearyClient("-", 0)
+        self.models[host] = self.peary_model(
+            latency=lambda cmd: DELAY if cmd == "device.power_on" else 0
+        )
+        self.transports[host] = LoopbackTransport(self.models[host])
+        return PearyClient(transport=self.transports[host])
+
+
+def test_peary_cluster_connects_hosts(
+    peary_model: Callable[..., PearyServerModel],
+) -> None:
+    farm = Farm(peary_model)
+    with PearyCluster(["a", "b", "a"], client_factory=farm.client) as cluster:
+        assert cluster.hosts == ["a", "b"]
+        assert [*cluster.proxies] == ["a", "b"]
+        assert all(isinstance(proxy, PearyProxy) for proxy in cluster.proxies.values())
+        results = cluster.broadcast("keep_alive")
+    assert {host: result.value for host, result in results.items()} == {
+        "a": b"",
+        "b": b"",
+    }
+    assert all(result.error is None for result in results.values())
+    with pytest.raises(BrokenPipeError):
+        farm.transports["a"].socket.send(b"")
+
+
+def test_peary_cluster_runs_hosts_concurrently(
+    peary_model: Callable[..., PearyServerModel],
+) -> None:
+    hosts = [f"host{ii}" for ii in range(8)]
+    with PearyCluster(hosts, client_factory=Farm(peary_model).client) as cluster:
+        added = cluster.add_device("chip")
+        assert all(isinstance(result.value, PearyDevice) for result in added.values())
+        start = time.perf_counter()
+        results = cluster.call_device("chip", "power_on")
+        elapsed = time.perf_counter() - start
+    assert [*results] == hosts
+    assert all(result.elapsed >= DELAY for result in results.values())
+    assert elapsed < DELAY * len(hosts) / 2
+
+
+def test_peary_cluster_reports_errors_per_host(
+    peary_model: Callable[..., PearyServerModel],
+) -> None:
+    hosts = ["good", "broken", "offline"]
+    farm = Farm(peary_model)
+    with PearyCluster(hosts, client_factory=farm.client) as cluster:
+        assert [*cluster.proxies] == ["good", "broken"]
+        cluster.add_device("chip")
+        farm.models["good"].devices[0].voltages["PWR_OUT_1"] = 1.8
+        farm.models["broken"].devices.clear()
+        results = cluster.call_device("chip", "get_voltage", "PWR_OUT_1")
+        missing = cluster.call_device("missing", "power_on")
+    assert results["good"].value == 1.8
+    assert isinstance(results["broken"].error, PearyProtocol.ResponseStatusError)
+    assert isinstance(results["offline"].error, PearyClient.PearySockerError)
+    assert results["offline"].value is None
+    assert isinstance(missing["good"].error, PearyProxy.PearyProxyGetDeviceError)
+
+
+def test_peary_cluster_map(peary_model: Callable[..., PearyServerModel]) -> None:
+    with PearyCluster(["a", "b"], client_factory=Farm(peary_model).client) as cluster:
+        results = cluster.map(lambda proxy: proxy.list_devices())
+    assert [result.value for result in results.values()] == [[], []]
+
+
+def test_peary_cluster_default_client() -> None:
+    with PearyCluster(["-"], 0) as cluster:
+        assert isinstance(
+            cluster.broadcast("keep_alive")["-"].error, PearyClient.PearySockerError
+        )
@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING
+
+import pytest
+
+from peary.peary_client import PearyClient
+from peary.peary_mock import MockPearyModel
+from peary.peary_protocol import PearyProtocol
+from peary.peary_register_cache import RegisterCache
+from peary.peary_transport import LoopbackTransport
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from peary.peary_device import PearyDevice
+
+
+@pytest.fixture(name="model")
+def _model() -> MockPearyModel:
+    return MockPearyModel({"Carboard": {"vdac": 0, "vref": 0}})
+
+
+@pytest.fixture(name="device")
+def _device(model: MockPearyModel) -> Iterator[PearyDevice]:
+    with PearyClient(transport=LoopbackTransport(model)) as proxy:
+        yield proxy.add_device("Carboard")
+
+
+def test_peary_device_deferred_coalesced(
+    device: PearyDevice, model: MockPearyModel
+) -> None:
+    requests = model.requests
+    with device.deferred():
+        for value in range(100):
+            assert device.set_register("vdac", value) == b""
+            device.set_memory("frame", value)
+            device.set_voltage("PWR_OUT_1", value / 100)
+            device.set_current("PWR_OUT_1", value / 1000)
+        with device.deferred():
+            device.set_register("vref", 5)
+        assert model.requests == requests
+    assert model.requests == requests + 5
+    mock = model.devices[0]
+    assert (mock.registers, mock.memory) == ({"vdac": 99, "vref": 5}, {"frame": 99})
+    assert (mock.voltages, mock.currents) == ({"PWR_OUT_1": 0.99}, {"PWR_OUT_1": 0.099})
+
+
+def test_peary_device_deferred_flushed_by_requests(
+    device: PearyDevice, model: MockPearyModel
+) -> None:
+    with device.deferred():
+        device.set_register("vdac", 1)
+        assert device.get_register("vdac") == 1
+        device.set_voltage("PWR_OUT_1", 1.2)
+        device.switch_on("PWR_OUT_1")
+        assert model.devices[0].voltages == {"PWR_OUT_1": 1.2}
+        device.set_register("vdac", 2)
+        assert device.snapshot_registers(["vdac"]) == {"vdac": 2}
+        device.set_register("vdac", 3)
+        device.set_registers({"vref": 4})
+        assert model.devices[0].registers == {"vdac": 3, "vref": 4}
+        requests = model.requests
+    assert model.requests == requests
+
+
+def test_peary_device_deferred_cached(
+    device: PearyDevice, model: MockPearyModel
+) -> None:
+    device.cache_registers(RegisterCache())
+    device.set_register("vdac", 1)
+    with device.deferred():
+        device.set_register("vdac", 2)
+        device.set_memory("frame", 3)
+        device.set_voltage("PWR_OUT_1", 1.2)
+        assert device.get_register("vdac") == 2
+    requests = model.requests
+    assert device.get_register("vdac") == 2
+    assert device.get_memory("frame") == 3
+    assert model.requests == requests
+
+
+def test_peary_device_deferred_failed(
+    device: PearyDevice, model: MockPearyModel
+) -> None:
+    def _write_unknown() -> None:
+        with device.deferred():
+            device.set_register("unknown", 1)
+            device.set_register("vdac", 2)
+
+    def _raise_in_block() -> None:
+        with device.deferred():
+            device.set_register("vref", 3)
+            raise PearyProtocol.ResponseStatusError
+
+    device.cache_registers(RegisterCache())
+    with pytest.raises(PearyProtocol.ResponseStatusError):
+        _write_unknown()
+    assert model.devices[0].registers["vdac"] == 2
+    with pytest.raises(PearyProtocol.ResponseStatusError):
+        _raise_in_block()
+    assert model.devices[0].registers["vref"] == 3
+
+
+def test_peary_device_deferred_per_thread(
+    device: PearyDevice, model: MockPearyModel
+) -> None:
+    with device.deferred(), ThreadPoolExecutor(1) as executor:
+        device.set_register("vdac", 1)
+        assert executor.submit(device.set_register, "vref", 2).result() == b""
+        assert executor.submit(device.get_register, "vref").result() == 2
+        assert model.devices[0].registers == {"vdac": 0, "vref": 2}
+    assert model.devices[0].registers == {"vdac": 1, "vref": 2}
@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from peary.peary_client import PearyClient
+from peary.peary_mock import MockPearyModel
+from peary.peary_protocol import PearyProtocol
+from peary.peary_register_cache import RegisterCache
+from peary.peary_transport import LoopbackTransport
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from peary.peary_device import PearyDevice
+
+
+@pytest.fixture(name="model")
+def _model() -> MockPearyModel:
+    return MockPearyModel({"Carboard": {"vref": 0, "status": 0}})
+
+
+@pytest.fixture(name="device")
+def _device(model: MockPearyModel) -> Iterator[PearyDevice]:
+    with PearyClient(transport=LoopbackTransport(model)) as proxy:
+        device = proxy.add_device("Carboard")
+        device.cache_registers(RegisterCache(volatile=["status"]))
+        yield device
+
+
+def test_peary_device_register_cache_disabled(model: MockPearyModel) -> None:
+    with PearyClient(transport=LoopbackTransport(model)) as proxy:
+        device = proxy.add_device("Carboard")
+        assert device.register_cache is None
+        device.set_register("vref", 12)
+        device.set_memory("frame", 3)
+        requests = model.requests
+        assert device.get_register("vref") == 12
+        assert device.get_memory("frame") == 3
+        assert device.reset() == b""
+        assert model.requests == requests + 3
+
+
+def test_peary_device_register_cache_write_through(
+    device: PearyDevice, model: MockPearyModel
+) -> None:
+    device.set_register("vref", 12)
+    device.set_memory("frame", 3)
+    assert model.devices[0].registers["vref"] == 12
+    requests = model.requests
+    assert device.get_register("vref") == 12
+    assert device.get_memory("frame") == 3
+    assert model.requests == requests
+    assert device.register_cache is not None
+    assert (device.register_cache.hits, device.register_cache.misses) == (2, 0)
+
+
+def test_peary_device_register_cache_read(
+    device: PearyDevice, model: MockPearyModel
+) -> None:
+    model.devices[0].registers["vref"] = 7
+    assert device.get_register("vref") == 7
+    model.devices[0].registers["vref"] = 8
+    assert device.get_register("vref") == 7
+    model.devices[0].registers["status"] = 1
+    assert device.get_register("status") == 1
+    model.devices[0].registers["status"] = 2
+    assert device.get_register("status") == 2
+    assert device.register_cache is not None
+    assert (device.register_cache.hits, device.register_cache.misses) == (1, 3)
+
+
+def test_peary_device_register_cache_failed_write(device: PearyDevice) -> None:
+    with pytest.raises(PearyProtocol.ResponseStatusError):
+        device.set_register("unknown", 1)
+    assert device.register_cache is not None
+    assert len(device.register_cache) == 0
+
+
+@pytest.mark.parametrize("cmd", ["reset", "configure", "power_off"])
+def test_peary_device_register_cache_invalidated(
+    device: PearyDevice, model: MockPearyModel, cmd: str
+) -> None:
+    device.set_register("vref", 12)
+    getattr(device, cmd)()
+    assert device.register_cache is not None
+    assert len(device.register_cache) == 0
+    expected = 12 if cmd == "power_off" else 0
+    assert device.get_register("vref") == model.devices[0].registers["vref"] == expected
@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from peary.peary_client import PearyClient
+from peary.peary_mock import MockPearyModel
+from peary.peary_protocol import PearyProtocol
+from peary.peary_register_cache import RegisterCache
+from peary.peary_transport import LoopbackTransport
+
+if TYPE_CHECKING:
+    from peary.peary_frame import DecodedBytes
+
+REGISTERS = {f"reg{ii}": 0 for ii in range(300)}
+
+
+def test_peary_device_set_registers() -> None:
+    model = MockPearyModel({"Carboard": REGISTERS})
+    with PearyClient(transport=LoopbackTransport(model)) as proxy:
+        device = proxy.add_device("Carboard")
+        requests = model.requests
+        values = {name: ii for ii, name in enumerate(REGISTERS)}
+        assert device.set_registers(values) == {}
+        assert model.requests == requests + len(REGISTERS)
+        assert model.devices[0].registers == values
+
+
+def test_peary_device_set_registers_coalesced() -> None:
+    model = MockPearyModel({"Carboard": REGISTERS})
+    with PearyClient(transport=LoopbackTransport(model)) as proxy:
+        device = proxy.add_device("Carboard")
+        requests = model.requests
+        device.set_registers([("reg0", 1), ("reg1", 2), ("reg0", 3)])
+        assert model.requests == requests + 2
+        assert (
+            model.devices[0].registers["reg0"],
+            model.devices[0].registers["reg1"],
+        ) == (3, 2)
+
+
+def test_peary_device_set_registers_last_write_ordered() -> None:
+    model = MockPearyModel({"Carboard": REGISTERS})
+    payloads: list[bytes] = []
+
+    def _handler(frame: DecodedBytes) -> bytes:
+        payloads.append(frame.payload)
+        return model(frame)
+
+    with PearyClient(transport=LoopbackTransport(_handler)) as proxy:
+        device = proxy.add_device("Carboard")
+        del payloads[:]
+        device.set_registers([("reg0", 1), ("reg1", 2), ("reg0", 3)])
+    assert payloads == [
+        b"device.set_register 0 reg1 2",
+        b"device.set_register 0 reg0 3",
+    ]
+
+
+def test_peary_device_set_registers_cached() -> None:
+    model = MockPearyModel({"Carboard": REGISTERS})
+    with PearyClient(transport=LoopbackTransport(model)) as proxy:
+        device = proxy.add_device("Carboard")
+        cache = RegisterCache()
+        device.cache_registers(cache)
+        device.set_registers({"reg0": 1, "reg1": 2})
+        requests = model.requests
+        device.set_registers({"reg0": 1, "reg1": 3})
+        assert model.requests == requests + 1
+        assert (cache.hits, cache.misses) == (0, 0)
+        assert device.get_register("reg1") == 3
+        assert model.requests == requests + 1
+
+
+def test_peary_device_set_registers_verify() -> None:
+    model = MockPearyModel({"Carboard": REGISTERS})
+    with PearyClient(transport=LoopbackTransport(model)) as proxy:
+        device = proxy.add_device("Carboard")
+        device.cache_registers(RegisterCache())
+        assert device.set_registers({"reg0": 1, "reg1": 2}, verify=True) == {}
+        model.devices[0].registers["reg1"] = 5
+        requests = model.requests
+        assert device.set_registers({"reg0": 1, "reg1": 2}, verify=True) == {
+            "reg1": (2, 5)
+        }
+        assert model.requests == requests + 2
+        assert device.get_register("reg1") == 5
+
+
+def test_peary_device_set_registers_failed() -> None:
+    model = MockPearyModel({"Carboard": REGISTERS})
+    with PearyClient(transport=LoopbackTransport(model)) as proxy:
+        device = proxy.add_device("Carboard")
+        device.cache_registers(RegisterCache())
+        with pytest.raises(
+            PearyProtocol.ResponseStatusError,
+            match="Failed to set registers: unknown, missing",
+        ) as error:
+            device.set_registers({"reg0": 1, "unknown": 2, "reg1": 3, "missing": 4})
+        assert isinstance(error.value.__cause__, PearyProtocol.ResponseStatusError)
+        assert model.devices[0].registers["reg1"] == 3
+        requests = model.requests
+        assert device.get_register("reg0") == 1
+        assert device.get_register("reg1") == 3
+        assert model.requests == requests
@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import pytest
+
+from peary.peary_client import PearyClient
+from peary.peary_device import PearyDevice
+from peary.peary_mock import MockPearyModel
+from peary.peary_protocol import PearyProtocol
+from peary.peary_register_cache import RegisterCache
+from peary.peary_transport import LoopbackTransport
+
+REGISTERS = {f"reg{ii}": ii for ii in range(300)}
+
+
+def test_peary_device_snapshot_registers() -> None:
+    model = MockPearyModel({"Carboard": REGISTERS})
+    with PearyClient(transport=LoopbackTransport(model)) as proxy:
+        device = proxy.add_device("Carboard")
+        requests = model.requests
+        assert device.snapshot_registers() == REGISTERS
+        assert model.requests == requests + 1 + len(REGISTERS)
+        assert device.snapshot_registers(iter(["reg2", "reg1"])) == {
+            "reg2": 2,
+            "reg1": 1,
+        }
+        assert device.snapshot_registers([]) == {}
+
+
+def test_peary_device_snapshot_registers_cached() -> None:
+    model = MockPearyModel({"Carboard": REGISTERS})
+    with PearyClient(transport=LoopbackTransport(model)) as proxy:
+        device = proxy.add_device("Carboard")
+        device.cache_registers(RegisterCache())
+        device.snapshot_registers(["reg7"])
+        model.devices[0].registers["reg7"] = 0
+        assert device.get_register("reg7") == 7
+
+
+def test_peary_device_snapshot_registers_failed() -> None:
+    with PearyClient(transport=LoopbackTransport(MockPearyModel())) as proxy:
+        device = proxy.add_device("Carboard")
+        with pytest.raises(PearyProtocol.ResponseStatusError):
+            device.snapshot_registers(["unknown"])
+
+
+def test_peary_device_diff_registers() -> None:
+    before = {"vref": 1, "ibias": 2, "status": 0}
+    after = {"vref": 1, "ibias": 3, "trim": 4}
+    assert PearyDevice.diff_registers(before, after) == {
+        "ibias": (2, 3),
+        "status": (0, None),
+        "trim": (None, 4),
+    }
+    assert PearyDevice.diff_registers(before, dict(before)) == {}
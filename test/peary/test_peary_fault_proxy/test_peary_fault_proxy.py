@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import random
+import socket
+import time
+from contextlib import ExitStack
+from types import MappingProxyType
+
+import pytest
+
+from peary import peary_fault_proxy
+from peary.peary_client import PearyClient
+from peary.peary_fault_proxy import FaultInjectingProxy, FaultProfile
+from peary.peary_frame import FrameEncoder
+from peary.peary_mock_server import MockPearyServer
+from peary.peary_protocol import PearyProtocol
+
+
+def test_peary_fault_profile_delay() -> None:
+    rng = random.Random(0)  # noqa: S311
+    profile = FaultProfile(
+        rtt=0.01, jitter=0.005, slow_commands=MappingProxyType({"device.configure": 1})
+    )
+    delays = [profile.delay("device.name", rng) for _ in range(100)]
+    assert all(0.005 <= delay <= 0.015 for delay in delays)
+    assert len(set(delays)) == len(delays)
+    assert 1.005 <= profile.delay("device.configure", rng) <= 1.015
+    assert FaultProfile(rtt=0.001, jitter=0.01).delay("", rng) >= 0
+
+
+def test_peary_fault_proxy_without_faults() -> None:
+    with (
+        MockPearyServer() as server,
+        FaultInjectingProxy(server.address) as proxy,
+        PearyClient(*proxy.address) as client,
+    ):
+        assert proxy.address[0] == "127.0.0.1"
+        assert proxy.profile == FaultProfile()
+        device = client.add_device("SpacelyCaribouBasic")
+        device.set_voltage("PWR_OUT_1", 1.2)
+        assert device.get_voltage("PWR_OUT_1") == 1.2
+
+
+def test_peary_fault_proxy_rtt() -> None:
+    with (
+        MockPearyServer() as server,
+        FaultInjectingProxy(server.address, FaultProfile(rtt=0.05)) as proxy,
+        PearyClient(*proxy.address) as client,
+    ):
+        start = time.perf_counter()
+        client.keep_alive()
+        assert time.perf_counter() - start >= 0.05
+        protocol = client.add_device("Carboard").protocol
+        start = time.perf_counter()
+        assert protocol.request_many([("device.name", "0")] * 20) == [b"Carboard"] * 20
+        assert 0.05 <= time.perf_counter() - start < 0.5
+
+
+@pytest.mark.parametrize(
+    "profile", [peary_fault_proxy.SPLIT_SEGMENTS, peary_fault_proxy.COALESCED_FRAMES]
+)
+def test_peary_fault_proxy_split_and_coalesced(profile: FaultProfile) -> None:
+    with (
+        MockPearyServer() as server,
+        FaultInjectingProxy(server.address, profile) as proxy,
+        PearyClient(*proxy.address) as client,
+    ):
+        protocol = client.add_device("Carboard").protocol
+        requests = [("device.set_memory", "0", f"m{ii}", str(ii)) for ii in range(20)]
+        protocol.request_many(requests)
+        assert protocol.request_many(
+            [("device.get_memory", "0", f"m{ii}") for ii in range(20)]
+        ) == [str(ii).encode() for ii in range(20)]
+
+
+def test_peary_fault_proxy_dropped_connection() -> None:
+    with (
+        MockPearyServer() as server,
+        FaultInjectingProxy(server.address, FaultProfile(drop_rate=1)) as proxy,
+        ExitStack() as stack,
+        pytest.raises(PearyProtocol.ResponseReceiveError),
+    ):
+        stack.enter_context(PearyClient(*proxy.address))
+
+
+def test_peary_fault_proxy_slow_command_timeout() -> None:
+    profile = FaultProfile(slow_commands=MappingProxyType({"device.configure": 0.5}))
+    with (
+        MockPearyServer() as server,
+        FaultInjectingProxy(server.address, profile) as proxy,
+        PearyClient(*proxy.address, timeout=0.1) as client,
+    ):
+        device = client.add_device("Carboard")
+        device.get_voltage("PWR_OUT_1")
+        with pytest.raises(socket.timeout):
+            device.configure()
+
+
+def test_peary_fault_proxy_unreachable_server() -> None:
+    with MockPearyServer() as server:
+        address = server.address
+    with FaultInjectingProxy(address) as proxy, ExitStack() as stack:
+        for _ in range(2):
+            with pytest.raises(
+                (PearyProtocol.ResponseReceiveError, ConnectionResetError)
+            ):
+                stack.enter_context(PearyClient(*proxy.address))
+
+
+def test_peary_fault_proxy_stop_with_pending_responses() -> None:
+    with MockPearyServer() as server:
+        proxy = FaultInjectingProxy(server.address, FaultProfile(rtt=10))
+        proxy.start()
+        with socket.create_connection(proxy.address) as connection:
+            connection.sendall(FrameEncoder.encode(b"", 1, 0))
+            time.sleep(0.05)
+            start = time.perf_counter()
+            proxy.stop()
+            assert time.perf_counter() - start < 1
+            assert connection.recv(1) == b""
+
+
+def test_peary_fault_proxy_stop_without_start() -> None:
+    proxy = FaultInjectingProxy(("127.0.0.1", 1))
+    proxy.stop()
+
+
+def test_peary_fault_proxy_forgets_closed_connections() -> None:
+    with MockPearyServer() as server, FaultInjectingProxy(server.address) as proxy:
+        for _ in range(3):
+            with PearyClient(*proxy.address) as client:
+                client.keep_alive()
+        for _ in range(100):
+            time.sleep(0.01)
+            if not proxy.connections:
+                break
+        assert not proxy.connections
+        assert not server.connections
@@ -0,0 +1,115 @@
+import array
+
+import pytest
+
+from peary.peary_frame import DecodedBytes, FrameDecoder, FrameEncoder
+
+FRAMES = [
+    DecodedBytes(b"alpha", 1, 0),
+    DecodedBytes(b"", 2, 1),
+    DecodedBytes(bytes(range(256)) * 40, 3, 0),
+]
+STREAM = b"".join(FrameEncoder.encode(*frame) for frame in FRAMES)
+
+
+def test_peary_frame_decoder_decode() -> None:
+    assert FrameDecoder.decode(STREAM[:13]) == FRAMES[0]
+
+
+def test_peary_frame_decoder_decode_empty_payload() -> None:
+    assert FrameDecoder.decode(b"\x00\x00\x00\x04\x00\x02\x00\x01") == FRAMES[1]
+
+
+def test_peary_frame_decoder_decode_view_without_copy() -> None:
+    data = bytearray(STREAM[:13])
+    payload, tag, status = FrameDecoder.decode_view(data)
+    assert (payload, tag, status) == (b"alpha", 1, 0)
+    data[-5:] = b"omega"
+    assert payload == b"omega"
+    assert payload.tobytes() == b"omega"
+
+
+def test_peary_frame_decoder_decode_view_memoryview_slice() -> None:
+    with memoryview(STREAM) as view:
+        assert FrameDecoder.decode_view(view[13:21]) == (b"", 2, 1)
+
+
+def test_peary_frame_decoder_decode_view_non_byte_format() -> None:
+    data = array.array("H")
+    data.frombytes(FrameEncoder.encode(b"alphab", 1, 0))
+    assert FrameDecoder.decode_view(data) == (b"alphab", 1, 0)
+
+
+def test_peary_frame_decoder_decode_view_errors() -> None:
+    with pytest.raises(
+        FrameDecoder.DecodeError, match="Insufficent number of bytes: 3"
+    ):
+        FrameDecoder.decode_view(bytearray(3))
+    with pytest.raises(FrameDecoder.DecodeError, match="Incorrect number of bytes"):
+        FrameDecoder.decode_view(bytearray(STREAM[:14]))
+
+
+def test_peary_frame_decoder_feed_whole_stream() -> None:
+    assert FrameDecoder().feed(STREAM) == FRAMES
+
+
+def test_peary_frame_decoder_feed_arbitrary_chunks() -> None:
+    for chunk_size in (1, 2, 3, 5, 7, 13, 4096):
+        decoder = FrameDecoder()
+        frames = []
+        for offset in range(0, len(STREAM), chunk_size):
+            frames.extend(decoder.feed(STREAM[offset : offset + chunk_size]))
+        assert frames == FRAMES
+        assert decoder.pending == 0
+
+
+def test_peary_frame_decoder_feed_pending() -> None:
+    decoder = FrameDecoder()
+    assert not decoder.feed(STREAM[:2])
+    assert decoder.pending == 2
+    assert not decoder.feed(STREAM[2:6])
+    assert decoder.pending == 6
+
+
+def test_peary_frame_decoder_feed_invalid_length() -> None:
+    with pytest.raises(FrameDecoder.DecodeError, match="Invalid frame length: 3"):
+        FrameDecoder().feed(b"\x00\x00\x00\x03")
+
+
+def test_peary_frame_decoder_get_buffer_prefix() -> None:
+    decoder = FrameDecoder()
+    assert len(decoder.get_buffer(16)) == 16
+    assert len(decoder.get_buffer()) == 4096
+
+
+def test_peary_frame_decoder_get_buffer_exact_frame_remainder() -> None:
+    decoder = FrameDecoder()
+    buffer = decoder.get_buffer(10)
+    buffer[:10] = STREAM[21:31]
+    assert not decoder.buffer_updated(10)
+    assert len(decoder.get_buffer(10)) == len(STREAM) - 31
+
+
+def test_peary_frame_decoder_buffer_updated() -> None:
+    for size_hint in (1, 3, 64, 4096):
+        decoder = FrameDecoder()
+        frames = []
+        offset = 0
+        while offset < len(STREAM):  # pylint: disable=while-used
+            buffer = decoder.get_buffer(size_hint)
+            size = min(len(buffer), len(STREAM) - offset)
+            buffer[:size] = STREAM[offset : offset + size]
+            offset += size
+            frames.extend(decoder.buffer_updated(size))
+        assert frames == FRAMES
+
+
+def test_peary_frame_decoder_buffer_updated_partial_frame() -> None:
+    decoder = FrameDecoder()
+    decoder.feed(STREAM[:6])
+    buffer = decoder.get_buffer()
+    buffer[:2] = STREAM[6:8]
+    assert not decoder.buffer_updated(2)
+    buffer = decoder.get_buffer()
+    buffer[:5] = STREAM[8:13]
+    assert decoder.buffer_updated(5) == FRAMES[:1]
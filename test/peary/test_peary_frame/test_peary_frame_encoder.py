@@ -0,0 +1,36 @@
+from peary.peary_frame import FrameEncoder
+
+
+def test_peary_frame_encoder_encode() -> None:
+    assert FrameEncoder.encode(b"", 0, 0) == b"\x00\x00\x00\x04\x00\x00\x00\x00"
+    assert (
+        FrameEncoder.encode(b"alpha", 1, 2) == b"\x00\x00\x00\x09\x00\x01\x00\x02alpha"
+    )
+
+
+def test_peary_frame_encoder_write() -> None:
+    encoder = FrameEncoder()
+    encoder.write(b"alpha", 1, 0)
+    encoder.write(b"beta", 2, 0)
+    assert encoder.data_to_send() == FrameEncoder.encode(
+        b"alpha", 1, 0
+    ) + FrameEncoder.encode(b"beta", 2, 0)
+
+
+def test_peary_frame_encoder_data_to_send_drains() -> None:
+    encoder = FrameEncoder()
+    assert encoder.data_to_send() == b""
+    encoder.write(b"alpha", 1, 0)
+    assert encoder.data_to_send()
+    assert encoder.data_to_send() == b""
+
+
+def test_peary_frame_encoder_encode_many() -> None:
+    frames = [(b"alpha", 1, 0), (b"", 2, 1), (b"gamma" * 1000, 0xFFFF, 0)]
+    assert FrameEncoder.encode_many(frames) == b"".join(
+        FrameEncoder.encode(*frame) for frame in frames
+    )
+
+
+def test_peary_frame_encoder_encode_many_empty() -> None:
+    assert FrameEncoder.encode_many([]) == b""
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from peary.peary_handshake_cache import HandshakeCache
+
+if TYPE_CHECKING:
+    from ..conftest import Clock  # noqa: TID252
+
+
+def test_peary_handshake_cache_default_ttl() -> None:
+    assert HandshakeCache().ttl == 300
+
+
+@pytest.mark.parametrize("ttl", [0, -1])
+def test_peary_handshake_cache_invalid_ttl(ttl: float) -> None:
+    with pytest.raises(ValueError, match=f"Invalid handshake cache ttl: {ttl}"):
+        HandshakeCache(ttl)
+
+
+def test_peary_handshake_cache_lookup_unknown() -> None:
+    assert HandshakeCache().lookup("loopback") is None
+
+
+def test_peary_handshake_cache_lookup_within_ttl(clock: Clock) -> None:
+    cache = HandshakeCache(10, clock=clock)
+    cache.store("loopback", b"1")
+    clock.now = 9.9
+    assert cache.lookup("loopback") == b"1"
+    assert cache.lookup("unix socket /tmp/peary") is None
+
+
+def test_peary_handshake_cache_lookup_expired(clock: Clock) -> None:
+    cache = HandshakeCache(10, clock=clock)
+    cache.store("loopback", b"1")
+    clock.now = 10
+    assert cache.lookup("loopback") is None
+    assert len(cache) == 0
+
+
+def test_peary_handshake_cache_store_refreshes(clock: Clock) -> None:
+    cache = HandshakeCache(10, clock=clock)
+    cache.store("loopback", b"1")
+    clock.now = 5
+    cache.store("loopback", b"2")
+    clock.now = 12
+    assert cache.lookup("loopback") == b"2"
+
+
+def test_peary_handshake_cache_invalidate() -> None:
+    cache = HandshakeCache()
+    cache.store("loopback", b"1")
+    cache.store("unix socket /tmp/peary", b"1")
+    cache.invalidate("loopback")
+    cache.invalidate("host localhost using port 12345")
+    assert cache.lookup("loopback") is None
+    assert len(cache) == 1
+
+
+def test_peary_handshake_cache_clear() -> None:
+    cache = HandshakeCache()
+    cache.store("loopback", b"1")
+    cache.clear()
+    assert len(cache) == 0
@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import threading
+import time
+from typing import TYPE_CHECKING
+
+from peary.peary_client import PearyClient
+from peary.peary_heartbeat import PearyHeartbeat
+from peary.peary_multiplex_protocol import PearyMultiplexProtocol
+from peary.peary_protocol import PearyProtocol
+from peary.peary_proxy import PearyProxy
+from peary.peary_timeout import AdaptiveTimeout, RttEstimator
+from peary.peary_transport import LoopbackConnection, LoopbackTransport
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from peary.peary_frame import DecodedBytes
+
+    from ..conftest import PearyServerModel  # noqa: TID252
+
+
+class Server:
+    """Peary server model dropping the connection after a number of keep-alives."""
+
+    def __init__(self, model: PearyServerModel, beats: int) -> None:
+        self.model = model
+        self.beats = beats
+        self.beaten = threading.Event()
+        self.received = 0
+
+    def connect(self, timeout: AdaptiveTimeout) -> PearyClient:
+        return PearyClient(
+            transport=LoopbackTransport(self),
+            protocol_class=PearyMultiplexProtocol,
+            timeout=timeout,
+        )
+
+    def __call__(self, frame: DecodedBytes) -> bytes | None:
+        if frame.payload != b"protocol_version":
+            self.received += 1
+            self.model.drop = self.received > self.beats
+        if self.received == self.beats:
+            self.beaten.set()
+        return self.model(frame)
+
+
+def test_peary_heartbeat_feeds_estimator(
+    peary_model: Callable[..., PearyServerModel],
+) -> None:
+    server = Server(peary_model(), beats=3)
+    timeout = AdaptiveTimeout()
+    with server.connect(timeout) as proxy:
+        with PearyHeartbeat(proxy, timeout.estimator, interval=0.01) as heartbeat:
+            assert server.beaten.wait(1)
+            assert heartbeat.alive
+        assert not heartbeat.alive
+        assert heartbeat.error is None
+    assert timeout.estimator.samples >= 2
+    assert timeout.timeout() < 1
+
+
+def test_peary_heartbeat_detects_dead_link(
+    peary_model: Callable[..., PearyServerModel],
+) -> None:
+    server = Server(peary_model(), beats=2)
+    failures: list[Exception] = []
+    failed = threading.Event()
+
+    def _on_failure(error: Exception) -> None:
+        failures.append(error)
+        failed.set()
+
+    timeout = AdaptiveTimeout()
+    with server.connect(timeout) as proxy:
+        with PearyHeartbeat(
+            proxy, timeout.estimator, interval=0.01, on_failure=_on_failure
+        ) as heartbeat:
+            assert failed.wait(1)
+            assert not heartbeat.alive
+            assert isinstance(heartbeat.error, PearyProtocol.ResponseReceiveError)
+    assert failures == [heartbeat.error]
+    assert timeout.estimator.samples == 2
+
+
+def test_peary_heartbeat_failure_without_callback(
+    peary_model: Callable[..., PearyServerModel],
+) -> None:
+    server = Server(peary_model(), beats=0)
+    timeout = AdaptiveTimeout()
+    with server.connect(timeout) as proxy:
+        with PearyHeartbeat(proxy, timeout.estimator, interval=0.01) as heartbeat:
+            deadline = time.monotonic() + 1
+            # pylint: disable-next=while-used
+            while heartbeat.error is None and time.monotonic() < deadline:
+                time.sleep(0.01)
+        assert isinstance(heartbeat.error, PearyProtocol.ResponseReceiveError)
+    assert timeout.estimator.samples == 0
+
+
+def test_peary_heartbeat_stop_before_start(
+    peary_model: Callable[..., PearyServerModel],
+) -> None:
+    proxy = PearyProxy(
+        PearyProtocol(
+            LoopbackConnection(Server(peary_model(), beats=1)),
+            checks=PearyProtocol.Checks.CHECK_NONE,
+        )
+    )
+    heartbeat = PearyHeartbeat(proxy, RttEstimator())
+    heartbeat.stop()
+    assert not heartbeat.alive
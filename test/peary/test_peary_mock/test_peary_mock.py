@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+import time
+
+import pytest
+
+from caribou.caribou_board import CaribouBoard
+from peary.peary_client import PearyClient
+from peary.peary_frame import DecodedBytes, FrameDecoder
+from peary.peary_mock import MockPearyDevice, MockPearyModel
+from peary.peary_protocol import PearyProtocol
+from peary.peary_transport import LoopbackTransport
+
+REGISTERS = {"SpacelyCaribouBasic": {"vref": 3, "ibias": 0}}
+
+
+def _client(model: MockPearyModel) -> PearyClient:
+    return PearyClient(transport=LoopbackTransport(model))
+
+
+def test_peary_mock_devices() -> None:
+    model = MockPearyModel(REGISTERS)
+    with _client(model) as proxy:
+        proxy.keep_alive()
+        device = proxy.add_device("SpacelyCaribouBasic")
+        other = proxy.add_device("Other")
+        assert (device.index, other.index) == (0, 1)
+        assert device.name == "SpacelyCaribouBasic"
+        assert proxy.list_remote_devices() == b"SpacelyCaribouBasic Other"
+        proxy.clear_devices()
+        assert proxy.list_remote_devices() == b""
+    assert not model.devices
+    assert model.requests == 8
+
+
+def test_peary_mock_device_commands() -> None:
+    model = MockPearyModel(REGISTERS)
+    with _client(model) as proxy:
+        device = proxy.add_device("SpacelyCaribouBasic")
+        device.power_on()
+        device.daq_start()
+        assert device.list_registers() == ["vref", "ibias"]
+        device.set_register("vref", 7)
+        device.set_memory("ctrl", 0x10)
+        device.set_voltage("PWR_OUT_1", 1.2)
+        device.set_current("IBIAS_1", 0.5)
+        device.switch_on("PWR_OUT_1")
+        device.switch_off("PWR_OUT_2")
+        assert device.get_register("vref") == 7
+        assert (device.get_memory("ctrl"), device.get_memory("other")) == (16, 0)
+        assert device.get_voltage("PWR_OUT_1") == pytest.approx(1.2)
+        assert device.get_current("IBIAS_1") == pytest.approx(0.5)
+        assert device.get_voltage("PWR_OUT_2") == device.get_current("IBIAS_2") == 0
+
+        mock = model.devices[0]
+        assert (mock.powered, mock.running) == (True, True)
+        assert mock.switches == {"PWR_OUT_1": True, "PWR_OUT_2": False}
+        device.configure()
+        assert mock.registers == {"vref": 3, "ibias": 0}
+        device.set_register("ibias", 1)
+        device.reset()
+        assert mock.registers == {"vref": 3, "ibias": 0}
+        device.daq_stop()
+        device.power_off()
+        assert (mock.powered, mock.running) == (False, False)
+
+
+def test_peary_mock_car_i2c() -> None:
+    model = MockPearyModel()
+    with _client(model) as proxy:
+        device = proxy.add_device("Carboard")
+        protocol = device.protocol
+        protocol.request("device.car_i2c_write", "0", "1", "0x20", "4", "10", "0x0b")
+        assert model.devices[0].i2c == {(1, 32, 4): 10, (1, 32, 5): 11}
+        assert (
+            protocol.request("device.car_i2c_read", "0", "1", "0x20", "3", "4")
+            == b"0 10 11 0"
+        )
+
+
+@pytest.mark.parametrize(
+    "request_args",
+    [
+        ("unknown",),
+        ("add_device",),
+        ("device.unknown", "0"),
+        ("device._name", "0"),
+        ("device.name", "5"),
+        ("device.name", "zero"),
+        ("device.name",),
+        ("device.get_register", "0", "unknown"),
+        ("device.set_register", "0", "unknown", "1"),
+        ("device.set_memory", "0", "ctrl", "ten"),
+        ("device.get_voltage", "0"),
+    ],
+)
+def test_peary_mock_failing_requests(request_args: tuple[str, ...]) -> None:
+    with _client(MockPearyModel()) as proxy:
+        device = proxy.add_device("Carboard")
+        with pytest.raises(PearyProtocol.ResponseStatusError):
+            device.protocol.request(*request_args)
+
+
+def test_peary_mock_failing_status() -> None:
+    response, delay = MockPearyModel().respond(DecodedBytes(b"unknown", 3, 0))
+    assert FrameDecoder.decode(response) == DecodedBytes(
+        b"Unknown command: unknown", 3, MockPearyModel.STATUS_FAILED
+    )
+    assert delay == 0
+
+
+def test_peary_mock_device_model() -> None:
+    device = MockPearyDevice("Carboard", {"vref": 1})
+    assert device.execute("get_register", "vref") == b"1"
+    with pytest.raises(MockPearyDevice.CommandError, match="Invalid arguments"):
+        device.execute("get_register", "vref", "extra")
+
+
+def test_peary_mock_latency() -> None:
+    model = MockPearyModel(latency=lambda cmd: 0.05 if cmd == "device.configure" else 0)
+    assert model.respond(DecodedBytes(b"device.configure 0", 1, 0))[1] == 0.05
+    assert model.respond(DecodedBytes(b"protocol_version", 1, 0))[1] == 0
+    assert MockPearyModel(latency=0.01).respond(DecodedBytes(b"", 1, 0))[1] == 0.01
+
+    start = time.perf_counter()
+    assert FrameDecoder.decode(
+        MockPearyModel(latency=0.02)(DecodedBytes(b"protocol_version", 1, 0))
+    ) == DecodedBytes(PearyProtocol.VERSION, 1, PearyProtocol.STATUS_OK)
+    assert time.perf_counter() - start >= 0.02
+
+
+def test_peary_mock_caribou_board() -> None:
+    model = MockPearyModel()
+    with _client(model) as proxy:
+        board = proxy.add_device("SpacelyCaribouBasic", CaribouBoard)
+        assert isinstance(board, CaribouBoard)
+        board.set_logic_level(1.8)
+        board.power_supply(CaribouBoard.PWR_OUT_1).set_voltage(1.2)
+        board.power_supply(CaribouBoard.PWR_OUT_1).switch_on()
+        assert board.read_i2c(CaribouBoard.BusI2C.BUS_0, 0x76, 6, 2) == b"0 0"
+    mock = model.devices[0]
+    assert mock.voltages == {
+        "CMOS_LEVEL_IN": 1.8,
+        "CMOS_LEVEL_OUT": 1.8,
+        "PWR_OUT_1": 1.2,
+    }
+    assert mock.switches == {"PWR_OUT_1": True}
+    assert mock.i2c == {(0, 0x76, 6): 0, (0, 0x76, 7): 0}
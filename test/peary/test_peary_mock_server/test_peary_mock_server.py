@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import concurrent.futures
+import socket
+import time
+from typing import TYPE_CHECKING
+
+import pytest
+
+from peary.peary_client import PearyClient
+from peary.peary_frame import FrameDecoder, FrameEncoder
+from peary.peary_mock import MockPearyModel
+from peary.peary_mock_server import MockPearyServer
+from peary.peary_multiplex_protocol import PearyMultiplexProtocol
+from peary.peary_transport import UnixTransport
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from peary.peary_frame import DecodedBytes
+
+
+def test_peary_mock_server_client() -> None:
+    with MockPearyServer() as server:
+        assert server.address[0] == "127.0.0.1"
+        with PearyClient(*server.address) as proxy:
+            device = proxy.add_device("SpacelyCaribouBasic")
+            device.set_voltage("PWR_OUT_1", 1.8)
+            assert device.get_voltage("PWR_OUT_1") == 1.8
+        assert server.model.devices[0].voltages == {"PWR_OUT_1": 1.8}
+
+
+def test_peary_mock_server_concurrent_clients() -> None:
+    model = MockPearyModel()
+
+    def _session(ii: int) -> list[bytes]:
+        with PearyClient(
+            *server.address, protocol_class=PearyMultiplexProtocol
+        ) as proxy:
+            device = proxy.add_device(f"device{ii}")
+            return [
+                device.protocol.request("device.name", str(device.index))
+                for _ in range(2)
+            ]
+
+    with MockPearyServer(model) as server:
+        with concurrent.futures.ThreadPoolExecutor(4) as executor:
+            names = {
+                name for names in executor.map(_session, range(8)) for name in names
+            }
+    assert names == {f"device{ii}".encode() for ii in range(8)}
+    assert model.requests == 8 * 4
+
+
+def test_peary_mock_server_pipelined_latency() -> None:
+    with MockPearyServer(MockPearyModel(latency=0.05)) as server:
+        with PearyClient(*server.address) as proxy:
+            protocol = proxy.add_device("Carboard").protocol
+            start = time.perf_counter()
+            responses = protocol.request_many([("device.name", "0")] * 20)
+            elapsed = time.perf_counter() - start
+    assert responses == [b"Carboard"] * 20
+    assert 0.05 <= elapsed < 0.5
+
+
+def test_peary_mock_server_stop_with_open_connection() -> None:
+    server = MockPearyServer()
+    server.start()
+    with PearyClient(*server.address) as proxy:
+        proxy.keep_alive()
+        server.stop()
+
+
+def test_peary_mock_server_stop_without_start() -> None:
+    MockPearyServer().stop()
+
+
+def test_peary_mock_server_forgets_closed_connections() -> None:
+    with MockPearyServer() as server:
+        for _ in range(3):
+            with PearyClient(*server.address) as proxy:
+                proxy.keep_alive()
+        for _ in range(100):
+            time.sleep(0.01)
+            if not server.connections:
+                break
+        assert not server.connections
+
+
+def test_peary_mock_server_handler() -> None:
+    def _handler(frame: DecodedBytes) -> bytes | None:
+        if frame.payload == b"close":
+            return None
+        return FrameEncoder.encode(frame.payload, frame.tag, frame.status)
+
+    with (
+        MockPearyServer(handler=_handler) as server,
+        socket.create_connection(server.address) as connection,
+    ):
+        connection.sendall(
+            FrameEncoder.encode(b"alpha", 1, 0) + FrameEncoder.encode(b"close", 2, 0)
+        )
+        assert FrameDecoder.decode(connection.recv(4096)).payload == b"alpha"
+        assert connection.recv(4096) == b""
+
+
+def test_peary_mock_server_unix(tmp_path: Path) -> None:
+    path = str(tmp_path / "peary.sock")
+    with MockPearyServer(path=path) as server:
+        assert server.path == path
+        with PearyClient(transport=UnixTransport(path)) as proxy:
+            assert proxy.add_device("Carboard").name == "Carboard"
+    assert not (tmp_path / "peary.sock").exists()
+
+
+def test_peary_mock_server_unix_bind_error(tmp_path: Path) -> None:
+    with pytest.raises(FileNotFoundError):
+        MockPearyServer(path=str(tmp_path / "missing" / "peary.sock"))
@@ -0,0 +1,272 @@
+from __future__ import annotations
+
+import concurrent.futures
+import socket as socket_module
+import threading
+import time
+from typing import TYPE_CHECKING
+
+import pytest
+
+from peary.peary_frame import FrameDecoder, FrameEncoder
+from peary.peary_multiplex_protocol import PearyMultiplexProtocol
+from peary.peary_protocol import PearyProtocol
+from peary.peary_timeout import AdaptiveTimeout
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from peary.peary_frame import DecodedBytes
+
+    from ..conftest import PearyServerModel  # noqa: TID252
+
+
+def _held_handler(
+    held: list[DecodedBytes], holding: threading.Event
+) -> Callable[[DecodedBytes], bytes]:
+    def _handler_holding_first(frame: DecodedBytes) -> bytes:
+        if not held:
+            held.append(frame)
+            holding.set()
+            return b""
+        holding.clear()
+        return FrameEncoder.encode(*frame) + FrameEncoder.encode(*held.pop())
+
+    return _handler_holding_first
+
+
+def test_peary_multiplex_protocol_concurrent_threads(
+    mock_server: Callable[..., socket_module.socket],
+    peary_model: Callable[..., PearyServerModel],
+) -> None:
+    protocol = PearyMultiplexProtocol(mock_server(peary_model()))
+
+    def _worker(name: str) -> list[bytes]:
+        return [protocol.request(name, str(ii)) for ii in range(200)]
+
+    with concurrent.futures.ThreadPoolExecutor(8) as executor:
+        results = executor.map(_worker, [f"worker{ii}" for ii in range(8)])
+        for ii, responses in enumerate(results):
+            assert responses == [f"worker{ii} {jj}".encode() for jj in range(200)]
+
+
+def test_peary_multiplex_protocol_out_of_order_responses(
+    mock_server: Callable[..., socket_module.socket],
+) -> None:
+    holding = threading.Event()
+    protocol = PearyMultiplexProtocol(
+        mock_server(_held_handler([], holding)), checks=PearyProtocol.Checks.CHECK_NONE
+    )
+    with concurrent.futures.ThreadPoolExecutor(1) as executor:
+        first = executor.submit(protocol.request, "first")
+        assert holding.wait(1)
+        assert protocol.request("second") == b"second"
+        assert first.result() == b"first"
+    assert protocol.request_many([("a",), ("b",), ("c",), ("d",)]) == [
+        b"a",
+        b"b",
+        b"c",
+        b"d",
+    ]
+
+
+def test_peary_multiplex_protocol_response_status_error(
+    mock_server: Callable[..., socket_module.socket],
+    peary_model: Callable[..., PearyServerModel],
+) -> None:
+    protocol = PearyMultiplexProtocol(mock_server(peary_model(rejected={"fail"})))
+    with pytest.raises(
+        PearyProtocol.ResponseStatusError,
+        match="Failed response status 1 from request ''fail''",
+    ):
+        protocol.request("fail")
+    responses = protocol.request_many([("alpha",), ("fail",), ("gamma",)], window=2)
+    assert responses[0] == b"alpha"
+    assert isinstance(responses[1], PearyProtocol.ResponseStatusError)
+    assert responses[2] == b"gamma"
+
+
+def test_peary_multiplex_protocol_late_response_dropped(
+    mock_server: Callable[..., socket_module.socket],
+) -> None:
+    holding = threading.Event()
+    protocol = PearyMultiplexProtocol(
+        mock_server(_held_handler([], holding)), checks=PearyProtocol.Checks.CHECK_NONE
+    )
+    with pytest.raises(socket_module.timeout):
+        protocol.request("slow")
+    assert holding.is_set()
+    time.sleep(0.5)
+    assert protocol.request("fast") == b"fast"
+    assert protocol.request_many([("alpha",), ("beta",)]) == [b"alpha", b"beta"]
+
+
+def test_peary_multiplex_protocol_connection_closed(
+    mock_server: Callable[..., socket_module.socket],
+    peary_model: Callable[..., PearyServerModel],
+) -> None:
+    model = peary_model()
+    protocol = PearyMultiplexProtocol(mock_server(model))
+    model.drop = True
+    with pytest.raises(
+        PearyProtocol.ResponseReceiveError, match="Failed to receive response"
+    ) as exc_info:
+        protocol.request("alpha")
+    assert isinstance(exc_info.value.__cause__, PearyProtocol.ResponseReceiveError)
+    with pytest.raises(
+        PearyProtocol.ResponseReceiveError, match="Failed to receive response"
+    ):
+        protocol.request("alpha")
+
+
+def test_peary_multiplex_protocol_garbage_received(
+    mock_server: Callable[..., socket_module.socket],
+) -> None:
+    protocol = PearyMultiplexProtocol(
+        mock_server(lambda _: b"\x00\x00\x00\x01"),
+        checks=PearyProtocol.Checks.CHECK_NONE,
+    )
+    with pytest.raises(
+        PearyProtocol.ResponseReceiveError, match="Failed to receive response"
+    ) as exc_info:
+        protocol.request("alpha")
+    assert isinstance(exc_info.value.__cause__, FrameDecoder.DecodeError)
+    with pytest.raises(
+        PearyProtocol.ResponseReceiveError, match="Failed to receive response"
+    ):
+        protocol.request("alpha")
+
+
+def test_peary_multiplex_protocol_version_error(
+    mock_server: Callable[..., socket_module.socket],
+    peary_model: Callable[..., PearyServerModel],
+) -> None:
+    with pytest.raises(
+        PearyProtocol.VersionError, match="Unsupported protocol version: b'0'"
+    ):
+        PearyMultiplexProtocol(mock_server(peary_model(version=b"0")))
+
+
+def test_peary_multiplex_protocol_lazy_version(
+    mock_server: Callable[..., socket_module.socket],
+    peary_model: Callable[..., PearyServerModel],
+) -> None:
+    protocol = PearyMultiplexProtocol(
+        mock_server(peary_model()), checks=PearyProtocol.Checks.CHECK_VERSION_LAZY
+    )
+    assert protocol.remote_version is None
+    assert protocol.request("hello") == b"hello"
+    assert protocol.remote_version == PearyProtocol.VERSION
+
+
+def test_peary_multiplex_protocol_lazy_version_request_many(
+    mock_server: Callable[..., socket_module.socket],
+    peary_model: Callable[..., PearyServerModel],
+) -> None:
+    protocol = PearyMultiplexProtocol(
+        mock_server(peary_model()), checks=PearyProtocol.Checks.CHECK_VERSION_LAZY
+    )
+    assert protocol.request_many([("a",), ("b",)]) == [b"a", b"b"]
+    assert protocol.remote_version == PearyProtocol.VERSION
+
+
+def test_peary_multiplex_protocol_adaptive_timeout(
+    mock_server: Callable[..., socket_module.socket],
+) -> None:
+    holding = threading.Event()
+    protocol = PearyMultiplexProtocol(
+        mock_server(_held_handler([], holding)),
+        timeout=AdaptiveTimeout(overrides={"slow": 0.05}),
+        checks=PearyProtocol.Checks.CHECK_NONE,
+    )
+    start = time.perf_counter()
+    with pytest.raises(socket_module.timeout):
+        protocol.request("slow")
+    assert time.perf_counter() - start < 0.5
+
+
+def test_peary_multiplex_protocol_timeout_type(
+    mock_server: Callable[..., socket_module.socket],
+) -> None:
+    protocol = PearyMultiplexProtocol(
+        mock_server(_held_handler([], threading.Event())),
+        timeout=0.05,
+        checks=PearyProtocol.Checks.CHECK_NONE,
+    )
+    with pytest.raises(OSError, match="timed out") as excinfo:
+        protocol.request("slow")
+    assert excinfo.type is socket_module.timeout
+    assert isinstance(excinfo.value.__cause__, concurrent.futures.TimeoutError)
+
+
+def test_peary_multiplex_protocol_stats(
+    mock_server: Callable[..., socket_module.socket],
+    peary_model: Callable[..., PearyServerModel],
+) -> None:
+    holding = threading.Event()
+    protocol = PearyMultiplexProtocol(
+        mock_server(_held_handler([], holding)),
+        timeout=0.05,
+        checks=PearyProtocol.Checks.CHECK_NONE,
+    )
+    with pytest.raises(socket_module.timeout):
+        protocol.request("slow")
+    assert protocol.stats().snapshot()["slow"].errors == 1
+    assert holding.is_set()
+    protocol = PearyMultiplexProtocol(mock_server(peary_model(rejected={"fail"})))
+    protocol.request_many([("alpha",), ("fail",)])
+    with pytest.raises(PearyProtocol.ResponseStatusError):
+        protocol.request("fail")
+    snapshot = protocol.stats().snapshot()
+    assert (snapshot["protocol_version"].calls, snapshot["alpha"].calls) == (1, 1)
+    assert (snapshot["fail"].calls, snapshot["fail"].errors) == (2, 2)
+    assert snapshot["alpha"].bytes_sent == snapshot["alpha"].bytes_received == 13
+
+
+def test_peary_multiplex_protocol_large_burst(
+    mock_server: Callable[..., socket_module.socket],
+    peary_model: Callable[..., PearyServerModel],
+) -> None:
+    protocol = PearyMultiplexProtocol(
+        mock_server(peary_model()), checks=PearyProtocol.Checks.CHECK_NONE
+    )
+    requests = [("get_register", f"register{ii}") for ii in range(60000)]
+    responses = protocol.request_many(requests, window=60000)
+    assert responses == [" ".join(request).encode() for request in requests]
+
+
+def test_peary_multiplex_protocol_send_error_releases_tags(
+    mock_server: Callable[..., socket_module.socket],
+    peary_model: Callable[..., PearyServerModel],
+) -> None:
+    failures = [PearyProtocol.RequestSendError("Failed to send request.")]
+
+    class FailingProtocol(PearyMultiplexProtocol):
+        """A protocol failing to send its first burst."""
+
+        def _send(self, data: bytes | bytearray) -> int:
+            if failures:
+                raise failures.pop()
+            return super()._send(data)
+
+    protocol = FailingProtocol(
+        mock_server(peary_model()), checks=PearyProtocol.Checks.CHECK_NONE
+    )
+    with pytest.raises(PearyProtocol.RequestSendError):
+        protocol.request_many([("a",)] * 60000, window=60000)
+    assert protocol.request_many([("b",)] * 10000, window=10000) == [b"b"] * 10000
+
+
+@pytest.mark.parametrize("window", [0, -1])
+def test_peary_multiplex_protocol_invalid_window(
+    mock_server: Callable[..., socket_module.socket],
+    peary_model: Callable[..., PearyServerModel],
+    window: int,
+) -> None:
+    protocol = PearyMultiplexProtocol(
+        mock_server(peary_model()), checks=PearyProtocol.Checks.CHECK_VERSION_LAZY
+    )
+    with pytest.raises(ValueError, match=f"Invalid request window: {window}"):
+        protocol.request_many([("a",)], window=window)
+    assert protocol.request_many([("a",)]) == [b"a"]
+    assert protocol.remote_version == PearyProtocol.VERSION
@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING
+
+import pytest
+
+from peary.peary_pool import PearyClientPool, PearyPoolProxy
+from peary.peary_protocol import PearyProtocol
+from peary.peary_transport import LoopbackTransport
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from peary.peary_frame import DecodedBytes
+
+    from ..conftest import PearyServerModel  # noqa: TID252
+
+
+class PearyServer:
+    """Connections to a peary server model powering devices on in pairs."""
+
+    def __init__(self, model: PearyServerModel) -> None:
+        self.model = model
+        self.barrier = threading.Barrier(2, timeout=1)
+        self.transports: list[LoopbackTransport] = []
+
+    def handle(self, frame: DecodedBytes) -> bytes | None:
+        if frame.payload.startswith(b"device.power_on"):
+            self.barrier.wait()
+        return self.model(frame)
+
+    def transport(self) -> LoopbackTransport:
+        self.transports.append(LoopbackTransport(self.handle))
+        return self.transports[-1]
+
+
+def test_peary_pool_handshake_per_connection(
+    peary_model: Callable[..., PearyServerModel],
+) -> None:
+    server = PearyServer(peary_model())
+    with PearyClientPool(size=3, transport_factory=server.transport) as proxy:
+        assert isinstance(proxy, PearyPoolProxy)
+        assert len(proxy.channels) == 3
+        assert server.model.handshakes == 3
+        assert proxy.keep_alive() == b""
+
+
+def test_peary_pool_devices_run_in_parallel(
+    peary_model: Callable[..., PearyServerModel],
+) -> None:
+    server = PearyServer(peary_model())
+    with PearyClientPool(size=2, transport_factory=server.transport) as proxy:
+        devices = [proxy.add_device(name) for name in ("alpha", "beta")]
+        assert [device.protocol for device in devices] == [*proxy.channels]
+        with ThreadPoolExecutor(2) as executor:
+            powered = [*executor.map(lambda device: device.power_on(), devices)]
+        assert powered == [b"", b""]
+    assert [device.powered for device in server.model.devices] == [True, True]
+
+
+def test_peary_pool_devices_assigned_in_turn(
+    peary_model: Callable[..., PearyServerModel],
+) -> None:
+    server = PearyServer(peary_model())
+    with PearyClientPool(size=2, transport_factory=server.transport) as proxy:
+        protocols = [proxy.add_device(str(ii)).protocol for ii in range(5)]
+    assert protocols == [*proxy.channels, *proxy.channels, proxy.channels[0]]
+
+
+def test_peary_pool_channel_borrowed_once(
+    peary_model: Callable[..., PearyServerModel],
+) -> None:
+    server = PearyServer(peary_model())
+    with PearyClientPool(size=1, transport_factory=server.transport) as proxy:
+        with proxy.channel() as protocol:
+            assert protocol.request("alpha") == b"alpha"
+            with pytest.raises(queue.Empty), proxy.channel(timeout=0):
+                pass  # pragma: no cover
+        with proxy.channel() as other:
+            assert other is protocol
+
+
+def test_peary_pool_closes_connections(
+    peary_model: Callable[..., PearyServerModel],
+) -> None:
+    server = PearyServer(peary_model())
+    with PearyClientPool(size=2, transport_factory=server.transport):
+        pass
+    for transport in server.transports:
+        with pytest.raises(BrokenPipeError):
+            transport.socket.send(b"")
+
+
+def test_peary_pool_closes_dropped_connections(
+    peary_model: Callable[..., PearyServerModel],
+) -> None:
+    server = PearyServer(peary_model())
+    with PearyClientPool(
+        size=2, protocol_class=PearyProtocol, transport_factory=server.transport
+    ):
+        server.transports[0].socket.close()
+    with pytest.raises(BrokenPipeError):
+        server.transports[1].socket.send(b"")
+
+
+def test_peary_pool_version_error_closes_connections(
+    peary_model: Callable[..., PearyServerModel],
+) -> None:
+    server = PearyServer(peary_model(version=b"0"))
+    with (
+        pytest.raises(PearyProtocol.VersionError),
+        PearyClientPool(size=2, transport_factory=server.transport),
+    ):
+        pass  # pragma: no cover
+    assert len(server.transports) == 1
+    with pytest.raises(BrokenPipeError):
+        server.transports[0].socket.send(b"")
+
+
+def test_peary_pool_connect_error() -> None:
+    with (
+        pytest.raises(
+            PearyClientPool.PearySockerError,
+            match="Unable to connect to host - using port 0",
+        ),
+        PearyClientPool("-", 0),
+    ):
+        pass  # pragma: no cover
+
+
+def test_peary_pool_invalid_size() -> None:
+    with pytest.raises(ValueError, match="Invalid pool size: 0"):
+        PearyClientPool(size=0)
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import select
 import socket as socket_module
 from contextlib import contextmanager
 from typing import TYPE_CHECKING, cast
@@ -11,7 +10,6 @@ from peary.peary_protocol import PearyProtocol
 
 if TYPE_CHECKING:
     from collections.abc import Callable, Generator
-    from socket import socket as socket_type
 
     from typing_extensions import Buffer
 
@@ -21,7 +19,7 @@ class MockSocketInterface(socket_module.socket):
 
 
 @pytest.fixture(name="socket_class_context")
-def _socket_class_context(monkeypatch: pytest.MonkeyPatch) -> Callable:
+def _socket_class_context() -> Callable:
 
     @contextmanager
     def _socket_class_contextmanager(
@@ -30,26 +28,35 @@ def _socket_class_context(monkeypatch: pytest.MonkeyPatch) -> Callable:
         mock_recv: Callable[[int], bytes] = lambda _: PearyProtocol.encode(
             b"", 1, PearyProtocol.STATUS_OK
         ),
-        mock_select: Callable[
-            [list[socket_type]], tuple[list, list, list]
-        ] = lambda *_: ([], [], []),
     ) -> Generator[type[MockSocketInterface]]:
 
         class MockSocket(MockSocketInterface):
 
+            def __init__(self) -> None:
+                super().__init__()
+                self.pending = bytearray()
+
             # pylint: disable-next=W0613
             def send(self, data: Buffer, flags: int = 0) -> int:  # noqa: ARG002
                 return mock_send(cast("bytes", data))
 
-            # pylint: disable-next=W0613
-            def recv(self, size: int, flags: int = 0) -> bytes:  # noqa: ARG002
-                return mock_recv(size)
+            # pylint: disable=unused-argument
+            def recv_into(
+                self, buffer: Buffer, nbytes: int = 0, flags: int = 0  # noqa: ARG002
+            ) -> int:
+                view = memoryview(buffer)
+                if not self.pending:
+                    self.pending = bytearray(mock_recv(len(view)))
+                size = min(len(view), len(self.pending))
+                view[:size] = self.pending[:size]
+                del self.pending[:size]
+                return size
+
+            # pylint: enable=unused-argument
 
             def settimeout(self, value: float | None = None) -> None:
                 MockSocket.timeout = value
 
-        with monkeypatch.context() as m:
-            m.setattr(select, "select", mock_select)
-            yield MockSocket
+        yield MockSocket
 
     return _socket_class_contextmanager
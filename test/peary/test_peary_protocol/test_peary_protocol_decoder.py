@@ -55,3 +55,15 @@ def test_peary_protocol_decode_incorrect_number_of_bytes() -> None:
         PearyProtocol.decode(b"\x00\x00\x00\x03\x00\x00\x00\x00")
     with pytest.raises(PearyProtocol.DecodeError, match="Incorrect number of bytes"):
         PearyProtocol.decode(b"\x00\x00\x00\x05\x00\x00\x00\x00")
+
+
+def test_peary_protocol_decode_empty_payload() -> None:
+    assert PearyProtocol.decode(b"\x00\x00\x00\x04\x00\x00\x00\x00").payload == b""
+
+
+def test_peary_protocol_decode_view() -> None:
+    data = bytearray(b"\x00\x00\x00\x09\x00\x01\x00\x00alpha")
+    payload, tag, status = PearyProtocol.decode_view(data)
+    assert (payload, tag, status) == (b"alpha", 1, 0)
+    assert isinstance(payload, memoryview)
+    assert payload.obj is data
@@ -25,3 +25,9 @@ def test_peary_protocol_encode_length() -> None:
     assert PearyProtocol.encode(b"1", 0, 0) == b"\x00\x00\x00\x05\x00\x00\x00\x001"
     assert PearyProtocol.encode(b"12", 0, 0) == b"\x00\x00\x00\x06\x00\x00\x00\x0012"
     assert PearyProtocol.encode(b"123", 0, 0) == b"\x00\x00\x00\x07\x00\x00\x00\x00123"
+
+
+def test_peary_protocol_encode_many() -> None:
+    assert PearyProtocol.encode_many([(b"alpha", 0, 0), (b"", 1, 1)]) == (
+        b"\x00\x00\x00\x09\x00\x00\x00\x00alpha\x00\x00\x00\x04\x00\x01\x00\x01"
+    )
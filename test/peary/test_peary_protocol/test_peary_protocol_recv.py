@@ -8,7 +8,6 @@ from peary.peary_protocol import PearyProtocol
 
 if TYPE_CHECKING:
     from collections.abc import Callable
-    from socket import socket as socket_type
 
 
 def test_peary_protocol_recv_buffer_oversized(socket_class_context: Callable) -> None:
@@ -24,9 +23,7 @@ def test_peary_protocol_recv_buffer_oversized(socket_class_context: Callable) ->
 
 def test_peary_protocol_recv_buffer_equalsized(socket_class_context: Callable) -> None:
     encoded_message = PearyProtocol.encode(b"alpha", 1, PearyProtocol.STATUS_OK)
-    with socket_class_context(
-        mock_recv=lambda _: encoded_message, mock_select=lambda *_: ([], [], [])
-    ) as socket_class:
+    with socket_class_context(mock_recv=lambda _: encoded_message) as socket_class:
         assert (
             PearyProtocol(
                 socket_class(), checks=PearyProtocol.Checks.CHECK_NONE
@@ -38,22 +35,11 @@ def test_peary_protocol_recv_buffer_equalsized(socket_class_context: Callable) -
 def test_peary_protocol_recv_buffer_undersized(socket_class_context: Callable) -> None:
     encoded_message = PearyProtocol.encode(b"alpha", 1, PearyProtocol.STATUS_OK)
     mock_recv_generator = iter(bytes([ii]) for ii in encoded_message)
-    mock_select_generator = iter(range(len(encoded_message)))
 
     def mock_recv(_: int) -> bytes:
         return next(mock_recv_generator)
 
-    def mock_select(
-        rlist: list[socket_type], *_: list[socket_type]
-    ) -> tuple[list, ...]:
-        if next(mock_select_generator) < len(encoded_message) - 1:
-            return rlist, [], []
-        else:
-            return [], [], []
-
-    with socket_class_context(
-        mock_recv=mock_recv, mock_select=mock_select
-    ) as socket_class:
+    with socket_class_context(mock_recv=mock_recv) as socket_class:
         assert (
             PearyProtocol(
                 socket_class(), checks=PearyProtocol.Checks.CHECK_NONE
@@ -62,6 +48,63 @@ def test_peary_protocol_recv_buffer_undersized(socket_class_context: Callable) -
         )
 
 
+def test_peary_protocol_recv_reads_exact_frame_length(
+    socket_class_context: Callable,
+) -> None:
+    encoded_message = PearyProtocol.encode(bytes(100), 1, PearyProtocol.STATUS_OK)
+    requested_sizes: list[int] = []
+
+    def mock_recv(size: int) -> bytes:
+        offset = sum(requested_sizes)
+        requested_sizes.append(size)
+        return encoded_message[offset : offset + size]
+
+    with socket_class_context(mock_recv=mock_recv) as socket_class:
+        assert PearyProtocol(
+            socket_class(), checks=PearyProtocol.Checks.CHECK_NONE
+        ).request("alpha", buffer_size=10) == bytes(100)
+    assert requested_sizes == [10, len(encoded_message) - 10]
+
+
+def test_peary_protocol_recv_frame_split_across_reads(
+    socket_class_context: Callable,
+) -> None:
+    encoded_message = PearyProtocol.encode(b"alpha", 1, PearyProtocol.STATUS_OK)
+    mock_recv_generator = iter(
+        [encoded_message[:2], encoded_message[2:7], encoded_message[7:]]
+    )
+
+    def mock_recv(_: int) -> bytes:
+        return next(mock_recv_generator)
+
+    with socket_class_context(mock_recv=mock_recv) as socket_class:
+        assert (
+            PearyProtocol(
+                socket_class(), checks=PearyProtocol.Checks.CHECK_NONE
+            ).request("alpha")
+            == b"alpha"
+        )
+
+
+def test_peary_protocol_recv_frames_coalesced_in_one_read(
+    socket_class_context: Callable,
+) -> None:
+    mock_recv_generator = iter(
+        [
+            PearyProtocol.encode(b"alpha", 1, PearyProtocol.STATUS_OK)
+            + PearyProtocol.encode(b"beta", 2, PearyProtocol.STATUS_OK)
+        ]
+    )
+
+    def mock_recv(_: int) -> bytes:
+        return next(mock_recv_generator)
+
+    with socket_class_context(mock_recv=mock_recv) as socket_class:
+        protocol = PearyProtocol(socket_class(), checks=PearyProtocol.Checks.CHECK_NONE)
+        assert protocol.request("alpha") == b"alpha"
+        assert protocol.request("beta") == b"beta"
+
+
 def test_peary_protocol_recv_error(socket_class_context: Callable) -> None:
     with socket_class_context(mock_recv=lambda _: b"") as socket_class:
         with pytest.raises(
@@ -70,3 +113,18 @@ def test_peary_protocol_recv_error(socket_class_context: Callable) -> None:
             PearyProtocol(
                 socket_class(), checks=PearyProtocol.Checks.CHECK_NONE
             ).request("")
+
+
+def test_peary_protocol_recv_error_mid_frame(socket_class_context: Callable) -> None:
+    mock_recv_generator = iter([b"\x00\x00\x00\x09\x00", b""])
+
+    def mock_recv(_: int) -> bytes:
+        return next(mock_recv_generator)
+
+    with socket_class_context(mock_recv=mock_recv) as socket_class:
+        with pytest.raises(
+            PearyProtocol.ResponseReceiveError, match="Failed to receive response."
+        ):
+            PearyProtocol(
+                socket_class(), checks=PearyProtocol.Checks.CHECK_NONE
+            ).request("")
@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from peary.peary_frame import FrameDecoder
+from peary.peary_protocol import PearyProtocol
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+def test_peary_protocol_request_many_sends_before_receiving(
+    socket_class_context: Callable,
+) -> None:
+    transactions: list[str] = []
+
+    def mock_send(data: bytes) -> int:
+        frames = FrameDecoder().feed(data)
+        transactions.append(f"send {[frame.payload for frame in frames]!r}")
+        return len(data)
+
+    def mock_recv(_: int) -> bytes:
+        transactions.append("recv")
+        return b"".join(
+            PearyProtocol.encode(b"", tag, PearyProtocol.STATUS_OK) for tag in (1, 2)
+        )
+
+    with socket_class_context(mock_send=mock_send, mock_recv=mock_recv) as socket_class:
+        PearyProtocol(
+            socket_class(), checks=PearyProtocol.Checks.CHECK_NONE
+        ).request_many([("alpha",), ("beta", "gamma")])
+    assert transactions == ["send [b'alpha', b'beta gamma']", "recv"]
+
+
+def test_peary_protocol_request_many_responses_in_order(
+    socket_class_context: Callable,
+) -> None:
+    encoded_responses = b"".join(
+        PearyProtocol.encode(payload, tag, PearyProtocol.STATUS_OK)
+        for payload, tag in ((b"alpha", 1), (b"beta", 2), (b"gamma", 3))
+    )
+    with socket_class_context(mock_recv=lambda _: encoded_responses) as socket_class:
+        assert PearyProtocol(
+            socket_class(), checks=PearyProtocol.Checks.CHECK_NONE
+        ).request_many([("a",), ("b",), ("c",)]) == [b"alpha", b"beta", b"gamma"]
+
+
+def test_peary_protocol_request_many_responses_matched_by_tag(
+    socket_class_context: Callable,
+) -> None:
+    encoded_responses = b"".join(
+        PearyProtocol.encode(payload, tag, PearyProtocol.STATUS_OK)
+        for payload, tag in ((b"gamma", 3), (b"alpha", 1), (b"beta", 2))
+    )
+    with socket_class_context(mock_recv=lambda _: encoded_responses) as socket_class:
+        assert PearyProtocol(
+            socket_class(), checks=PearyProtocol.Checks.CHECK_NONE
+        ).request_many([("a",), ("b",), ("c",)]) == [b"alpha", b"beta", b"gamma"]
+
+
+def test_peary_protocol_request_many_responses_split_across_reads(
+    socket_class_context: Callable,
+) -> None:
+    encoded_responses = b"".join(
+        PearyProtocol.encode(payload, tag, PearyProtocol.STATUS_OK)
+        for payload, tag in ((b"alpha", 1), (b"beta", 2))
+    )
+    mock_recv_generator = iter(bytes([ii]) for ii in encoded_responses)
+
+    def mock_recv(_: int) -> bytes:
+        return next(mock_recv_generator)
+
+    with socket_class_context(mock_recv=mock_recv) as socket_class:
+        assert PearyProtocol(
+            socket_class(), checks=PearyProtocol.Checks.CHECK_NONE
+        ).request_many([("a",), ("b",)], buffer_size=1) == [b"alpha", b"beta"]
+
+
+def test_peary_protocol_request_many_response_status_error(
+    socket_class_context: Callable,
+) -> None:
+    encoded_responses = b"".join(
+        PearyProtocol.encode(payload, tag, status)
+        for payload, tag, status in (
+            (b"alpha", 1, PearyProtocol.STATUS_OK),
+            (b"", 2, not PearyProtocol.STATUS_OK),
+            (b"gamma", 3, PearyProtocol.STATUS_OK),
+        )
+    )
+    with socket_class_context(mock_recv=lambda _: encoded_responses) as socket_class:
+        responses = PearyProtocol(
+            socket_class(), checks=PearyProtocol.Checks.CHECK_NONE
+        ).request_many([("a",), ("b",), ("c",)])
+    assert responses[0] == b"alpha"
+    assert isinstance(responses[1], PearyProtocol.ResponseStatusError)
+    assert "Failed response status 1 from request" in str(responses[1])
+    assert responses[2] == b"gamma"
+
+
+def test_peary_protocol_request_many_response_sequence_error(
+    socket_class_context: Callable,
+) -> None:
+    def mock_recv(_: int) -> bytes:
+        return PearyProtocol.encode(b"", 0, PearyProtocol.STATUS_OK)
+
+    with socket_class_context(mock_recv=mock_recv) as socket_class:
+        with pytest.raises(
+            PearyProtocol.ResponseSequenceError,
+            match="Recieved response with unknown tag: 0",
+        ):
+            PearyProtocol(
+                socket_class(), checks=PearyProtocol.Checks.CHECK_NONE
+            ).request_many([("",)])
+
+
+def test_peary_protocol_request_many_keeps_tag_sequence(
+    socket_class_context: Callable,
+) -> None:
+    mock_recv_generator = iter(
+        [
+            PearyProtocol.encode(b"", 1, PearyProtocol.STATUS_OK)
+            + PearyProtocol.encode(b"", 2, PearyProtocol.STATUS_OK),
+            PearyProtocol.encode(b"", 3, PearyProtocol.STATUS_OK),
+        ]
+    )
+
+    def mock_recv(_: int) -> bytes:
+        return next(mock_recv_generator)
+
+    with socket_class_context(mock_recv=mock_recv) as socket_class:
+        protocol = PearyProtocol(socket_class(), checks=PearyProtocol.Checks.CHECK_NONE)
+        protocol.request_many([("",), ("",)])
+        protocol.request("")
+
+
+def test_peary_protocol_request_many_empty(socket_class_context: Callable) -> None:
+    with socket_class_context() as socket_class:
+        assert not PearyProtocol(
+            socket_class(), checks=PearyProtocol.Checks.CHECK_NONE
+        ).request_many([])
+
+
+@pytest.mark.parametrize("window", [0, -1])
+def test_peary_protocol_request_many_invalid_window(
+    socket_class_context: Callable, window: int
+) -> None:
+    with socket_class_context() as socket_class:
+        protocol = PearyProtocol(socket_class(), checks=PearyProtocol.Checks.CHECK_NONE)
+        with pytest.raises(ValueError, match=f"Invalid request window: {window}"):
+            protocol.request_many([("alpha",)], window=window)
@@ -7,6 +7,7 @@ import pytest
 from peary.peary_protocol import PearyProtocol
 
 if TYPE_CHECKING:
+    import socket as socket_module
     from collections.abc import Callable
 
 
@@ -21,8 +22,49 @@ def test_peary_protocol_send_okay(socket_class_context: Callable) -> None:
 def test_peary_protocol_send_error(socket_class_context: Callable) -> None:
     with socket_class_context(mock_send=lambda _: len(_) - 1) as socket_class:
         with pytest.raises(
-            PearyProtocol.RequestSendError, match="Failed to send request:*"
+            PearyProtocol.RequestSendError,
+            match="Failed to send request: connection closed after 7 of 8 bytes",
         ):
             PearyProtocol(
                 socket_class(), checks=PearyProtocol.Checks.CHECK_NONE
             ).request("")
+
+
+def test_peary_protocol_send_partial_writes(socket_class_context: Callable) -> None:
+    sent = bytearray()
+
+    def mock_send(data: bytes) -> int:
+        sent.extend(data[:3])
+        return min(len(data), 3)
+
+    with socket_class_context(mock_send=mock_send) as socket_class:
+        PearyProtocol(socket_class(), checks=PearyProtocol.Checks.CHECK_NONE).request(
+            "alpha", "beta"
+        )
+    assert PearyProtocol.decode(bytes(sent)) == (b"alpha beta", 1, 0)
+
+
+def test_peary_protocol_send_chunked(socket_class_context: Callable) -> None:
+    chunk_sizes: list[int] = []
+
+    def mock_send(data: bytes) -> int:
+        chunk_sizes.append(len(data))
+        return len(data)
+
+    payload = "0" * (2 * PearyProtocol.SEND_CHUNK_SIZE)
+    with socket_class_context(mock_send=mock_send) as socket_class:
+        PearyProtocol(socket_class(), checks=PearyProtocol.Checks.CHECK_NONE).request(
+            payload
+        )
+    assert chunk_sizes == [PearyProtocol.SEND_CHUNK_SIZE] * 2 + [8]
+
+
+def test_peary_protocol_send_large_request_mock_server(
+    mock_server: Callable[..., socket_module.socket],
+) -> None:
+    payload = bytes(range(256)) * 4096
+    protocol = PearyProtocol(
+        mock_server(lambda frame: PearyProtocol.encode(b"", frame.tag, 0)),
+        checks=PearyProtocol.Checks.CHECK_NONE,
+    )
+    assert protocol.request_many([(payload.hex(),)] * 4) == [b""] * 4
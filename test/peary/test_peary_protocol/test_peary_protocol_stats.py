@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import socket as socket_module
+from typing import TYPE_CHECKING
+
+import pytest
+
+from peary.peary_frame import FrameEncoder
+from peary.peary_protocol import PearyProtocol
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from peary.peary_frame import DecodedBytes
+
+
+def _handler(frame: DecodedBytes) -> bytes:
+    if frame.payload == b"fail":
+        return FrameEncoder.encode(b"", frame.tag, not PearyProtocol.STATUS_OK)
+    if frame.payload == b"hang":
+        return b""
+    return FrameEncoder.encode(frame.payload * 2, frame.tag, frame.status)
+
+
+def test_peary_protocol_stats_request(
+    mock_server: Callable[..., socket_module.socket],
+) -> None:
+    protocol = PearyProtocol(
+        mock_server(_handler), checks=PearyProtocol.Checks.CHECK_NONE
+    )
+    protocol.request("device.get_voltage", "0", "VDD")
+    protocol.request("device.get_voltage", "0", "VDD")
+    stats = protocol.stats().snapshot()["device.get_voltage"]
+    assert (stats.calls, stats.errors) == (2, 0)
+    assert stats.bytes_sent == 2 * (8 + len("device.get_voltage 0 VDD"))
+    assert stats.bytes_received == 2 * (8 + 2 * len("device.get_voltage 0 VDD"))
+    assert stats.send.count == stats.wait.count == 2
+    assert protocol.stats().decode.count >= 2
+    assert stats.wait.total > 0
+
+
+def test_peary_protocol_stats_request_many(
+    mock_server: Callable[..., socket_module.socket],
+) -> None:
+    protocol = PearyProtocol(
+        mock_server(_handler), checks=PearyProtocol.Checks.CHECK_NONE
+    )
+    protocol.request_many([("alpha",), ("fail",), ("alpha",)], window=2)
+    snapshot = protocol.stats().snapshot()
+    assert (snapshot["alpha"].calls, snapshot["alpha"].errors) == (2, 0)
+    assert (snapshot["fail"].calls, snapshot["fail"].errors) == (1, 1)
+    assert snapshot["alpha"].bytes_sent == 2 * 13
+
+
+def test_peary_protocol_stats_errors(
+    mock_server: Callable[..., socket_module.socket],
+) -> None:
+    protocol = PearyProtocol(
+        mock_server(_handler), timeout=0.05, checks=PearyProtocol.Checks.CHECK_NONE
+    )
+    with pytest.raises(PearyProtocol.ResponseStatusError):
+        protocol.request("fail")
+    with pytest.raises(socket_module.timeout):
+        protocol.request("hang")
+    snapshot = protocol.stats().reset()
+    assert (snapshot["fail"].calls, snapshot["fail"].errors) == (1, 1)
+    assert (snapshot["hang"].calls, snapshot["hang"].errors) == (1, 1)
+    assert snapshot["hang"].wait.count == 0
+    assert not protocol.stats().snapshot()
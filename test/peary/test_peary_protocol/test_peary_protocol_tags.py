@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import os
+from contextlib import suppress
+from typing import TYPE_CHECKING
+
+from peary.peary_frame import FrameDecoder
+from peary.peary_protocol import PearyProtocol
+from peary.peary_tags import TagAllocator
+
+if TYPE_CHECKING:
+    import socket as socket_module
+    from collections.abc import Callable
+
+STRESS_REQUESTS = int(os.environ.get("PEARY_STRESS_REQUESTS", "70000"))
+
+
+def test_peary_protocol_tags_stale_response_discarded(
+    socket_class_context: Callable,
+) -> None:
+    mock_recv_responses: list[bytes | Exception] = [
+        TimeoutError(),
+        PearyProtocol.encode(b"stale", 1, PearyProtocol.STATUS_OK)
+        + PearyProtocol.encode(b"fresh", 2, PearyProtocol.STATUS_OK),
+    ]
+    mock_recv_generator = iter(mock_recv_responses)
+
+    def mock_recv(_: int) -> bytes:
+        if isinstance(response := next(mock_recv_generator), bytes):
+            return response
+        raise response
+
+    with socket_class_context(mock_recv=mock_recv) as socket_class:
+        protocol = PearyProtocol(socket_class(), checks=PearyProtocol.Checks.CHECK_NONE)
+        with suppress(TimeoutError):
+            protocol.request("stale")
+        assert protocol.request("fresh") == b"fresh"
+
+
+def test_peary_protocol_tags_wraparound_skips_in_flight(
+    socket_class_context: Callable,
+) -> None:
+    sent_tags: list[int] = []
+
+    def mock_send(data: bytes) -> int:
+        sent_tags.append(PearyProtocol.decode(data).tag)
+        return len(data)
+
+    def mock_recv(_: int) -> bytes:
+        if len(sent_tags) == 1:
+            raise TimeoutError
+        return PearyProtocol.encode(b"", sent_tags[-1], PearyProtocol.STATUS_OK)
+
+    with socket_class_context(mock_send=mock_send, mock_recv=mock_recv) as socket_class:
+        protocol = PearyProtocol(socket_class(), checks=PearyProtocol.Checks.CHECK_NONE)
+        with suppress(TimeoutError):
+            protocol.request("")
+        for _ in range(TagAllocator.MAX_TAG):
+            protocol.request("")
+    assert 1 not in sent_tags[1:]
+    assert sent_tags[-2:] == [TagAllocator.MAX_TAG, 2]
+
+
+def test_peary_protocol_tags_request_many_window(
+    socket_class_context: Callable,
+) -> None:
+    transactions: list[str] = []
+
+    def mock_send(data: bytes) -> int:
+        transactions.extend(f"send {frame.tag}" for frame in FrameDecoder().feed(data))
+        return len(data)
+
+    def mock_recv(_: int) -> bytes:
+        tag = int(next(_ for _ in transactions if _.startswith("send"))[5:])
+        transactions.append(f"recv {tag}")
+        transactions.remove(f"send {tag}")
+        return PearyProtocol.encode(b"", tag, PearyProtocol.STATUS_OK)
+
+    with socket_class_context(mock_send=mock_send, mock_recv=mock_recv) as socket_class:
+        PearyProtocol(
+            socket_class(), checks=PearyProtocol.Checks.CHECK_NONE
+        ).request_many([("",)] * 4, window=2)
+    assert transactions == ["recv 1", "recv 2", "recv 3", "recv 4"]
+
+
+def test_peary_protocol_tags_stress_mock_server(
+    mock_server: Callable[..., socket_module.socket],
+) -> None:
+    protocol = PearyProtocol(mock_server(), checks=PearyProtocol.Checks.CHECK_NONE)
+    batch = [(str(ii),) for ii in range(1000)]
+    expected = [str(ii).encode("utf-8") for ii in range(1000)]
+    for _ in range(STRESS_REQUESTS // len(batch)):
+        assert protocol.request_many(batch) == expected
+    assert protocol.request("alpha") == b"alpha"
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import socket as socket_module
+from typing import TYPE_CHECKING
+
+import pytest
+
+from peary.peary_protocol import PearyProtocol
+from peary.peary_timeout import AdaptiveTimeout
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from typing_extensions import Buffer
+
+
+class RecordingConnection:
+    """Connection recording the timeouts set on a socket."""
+
+    def __init__(self, socket: socket_module.socket) -> None:
+        self.socket = socket
+        self.timeouts: list[float | None] = []
+
+    def settimeout(self, value: float | None) -> None:
+        self.timeouts.append(value)
+        self.socket.settimeout(value)
+
+    def send(self, data: Buffer, flags: int = 0, /) -> int:
+        return self.socket.send(data, flags)
+
+    def recv_into(self, buffer: Buffer, nbytes: int = 0, flags: int = 0, /) -> int:
+        return self.socket.recv_into(buffer, nbytes, flags)
+
+    def shutdown(self, how: int, /) -> None:
+        self.socket.shutdown(how)
+
+    def close(self) -> None:
+        self.socket.close()
+
+
+def test_peary_protocol_timeout_fixed(
+    mock_server: Callable[..., socket_module.socket],
+) -> None:
+    connection = RecordingConnection(mock_server())
+    protocol = PearyProtocol(
+        connection, timeout=2.5, checks=PearyProtocol.Checks.CHECK_NONE
+    )
+    protocol.request("alpha")
+    protocol.request_many([("alpha",), ("beta",)])
+    assert connection.timeouts == [2.5]
+    connection.shutdown(socket_module.SHUT_RDWR)
+    connection.close()
+
+
+def test_peary_protocol_timeout_adaptive(
+    mock_server: Callable[..., socket_module.socket],
+) -> None:
+    connection = RecordingConnection(mock_server())
+    timeout = AdaptiveTimeout(2, overrides={"slow": 30})
+    protocol = PearyProtocol(
+        connection, timeout=timeout, checks=PearyProtocol.Checks.CHECK_NONE
+    )
+    assert protocol.request("slow") == b"slow"
+    timeout.estimator.update(0.1)
+    assert protocol.request("fast") == b"fast"
+    assert protocol.request_many([("fast",), ("slow",)]) == [b"fast", b"slow"]
+    assert protocol.request_many([("fast",)], window=1) == [b"fast"]
+    assert connection.timeouts == pytest.approx([2, 30, 0.3, 30, 0.3])
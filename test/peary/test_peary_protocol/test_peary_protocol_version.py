@@ -5,10 +5,14 @@ from typing import TYPE_CHECKING
 import pytest
 
 from peary.peary_protocol import PearyProtocol
+from peary.peary_transport import LoopbackConnection
 
 if TYPE_CHECKING:
+    import socket as socket_module
     from collections.abc import Callable
 
+    from ..conftest import PearyServerModel  # noqa: TID252
+
 
 def test_peary_protocol_version_request_message(socket_class_context: Callable) -> None:
 
@@ -51,3 +55,137 @@ def test_peary_protocol_version_unsupported(socket_class_context: Callable) -> N
             PearyProtocol.VersionError, match="Unsupported protocol version: b'0'"
         ):
             MockProtocol(socket_class())
+
+
+def test_peary_protocol_version_lazy_deferred(
+    mock_server: Callable[..., socket_module.socket],
+    peary_model: Callable[..., PearyServerModel],
+) -> None:
+    model = peary_model()
+    protocol = PearyProtocol(
+        mock_server(model), checks=PearyProtocol.Checks.CHECK_VERSION_LAZY
+    )
+    assert protocol.remote_version is None
+    assert protocol.request("hello") == b"hello"
+    assert protocol.remote_version == b"1"
+    assert protocol.request("world") == b"world"
+    assert model.received == [b"protocol_version", b"hello", b"world"]
+
+
+def test_peary_protocol_version_lazy_request_many(
+    mock_server: Callable[..., socket_module.socket],
+    peary_model: Callable[..., PearyServerModel],
+) -> None:
+    model = peary_model()
+    protocol = PearyProtocol(
+        mock_server(model), checks=PearyProtocol.Checks.CHECK_VERSION_LAZY
+    )
+    assert protocol.request_many([("a",), ("b",)]) == [b"a", b"b"]
+    assert protocol.remote_version == b"1"
+    assert model.received == [b"protocol_version", b"a", b"b"]
+
+
+def test_peary_protocol_version_lazy_unsupported(
+    mock_server: Callable[..., socket_module.socket],
+    peary_model: Callable[..., PearyServerModel],
+) -> None:
+    protocol = PearyProtocol(
+        mock_server(peary_model(version=b"0")),
+        checks=PearyProtocol.Checks.CHECK_VERSION_LAZY,
+    )
+    with pytest.raises(
+        PearyProtocol.VersionError, match="Unsupported protocol version: b'0'"
+    ):
+        protocol.request("hello")
+    assert protocol.remote_version is None
+
+
+def test_peary_protocol_version_lazy_unsupported_stays_failed(
+    mock_server: Callable[..., socket_module.socket],
+    peary_model: Callable[..., PearyServerModel],
+) -> None:
+    model = peary_model(version=b"0")
+    protocol = PearyProtocol(
+        mock_server(model), checks=PearyProtocol.Checks.CHECK_VERSION_LAZY
+    )
+    with pytest.raises(PearyProtocol.VersionError):
+        protocol.request("hello")
+    with pytest.raises(
+        PearyProtocol.VersionError, match="Unsupported protocol version: b'0'"
+    ):
+        protocol.request("world")
+    with pytest.raises(PearyProtocol.VersionError):
+        protocol.request_many([("a",), ("b",)])
+    assert protocol.remote_version is None
+    assert model.received == [b"protocol_version", b"hello"]
+
+
+def test_peary_protocol_version_lazy_response_status_error(
+    mock_server: Callable[..., socket_module.socket],
+    peary_model: Callable[..., PearyServerModel],
+) -> None:
+    protocol = PearyProtocol(
+        mock_server(peary_model(rejected={"fail"})),
+        checks=PearyProtocol.Checks.CHECK_VERSION_LAZY,
+    )
+    with pytest.raises(
+        PearyProtocol.ResponseStatusError,
+        match="Failed response status 1 from request ''fail''",
+    ):
+        protocol.request("fail")
+    assert protocol.remote_version == b"1"
+
+
+def test_peary_protocol_version_lazy_version_request_failed(
+    mock_server: Callable[..., socket_module.socket],
+    peary_model: Callable[..., PearyServerModel],
+) -> None:
+    protocol = PearyProtocol(
+        mock_server(peary_model(rejected={"protocol_version"})),
+        checks=PearyProtocol.Checks.CHECK_VERSION_LAZY,
+    )
+    with pytest.raises(PearyProtocol.ResponseStatusError, match="'protocol_version'"):
+        protocol.request("hello")
+    with pytest.raises(PearyProtocol.ResponseStatusError, match="'protocol_version'"):
+        protocol.request("world")
+
+
+def test_peary_protocol_version_eager_overrides_lazy(
+    mock_server: Callable[..., socket_module.socket],
+    peary_model: Callable[..., PearyServerModel],
+) -> None:
+    model = peary_model()
+    protocol = PearyProtocol(
+        mock_server(model),
+        checks=PearyProtocol.Checks.CHECK_VERSION
+        | PearyProtocol.Checks.CHECK_VERSION_LAZY,
+    )
+    assert protocol.remote_version == b"1"
+    assert protocol.request("hello") == b"hello"
+    assert model.received == [b"protocol_version", b"hello"]
+
+
+def test_peary_protocol_version_on_verified(
+    peary_model: Callable[..., PearyServerModel],
+) -> None:
+    verified: list[bytes] = []
+    protocol = PearyProtocol(
+        LoopbackConnection(peary_model()),
+        checks=PearyProtocol.Checks.CHECK_VERSION_LAZY,
+    )
+    protocol.on_verified(verified.append)
+    assert not verified
+    protocol.request("hello")
+    assert verified == [b"1"]
+    protocol.on_verified(None)
+    protocol.request("world")
+    assert verified == [b"1"]
+
+
+def test_peary_protocol_version_on_verified_eager(
+    peary_model: Callable[..., PearyServerModel],
+) -> None:
+    verified: list[bytes] = []
+    protocol = PearyProtocol(LoopbackConnection(peary_model()))
+    protocol.on_verified(verified.append)
+    assert verified == [b"1"]
@@ -88,3 +88,8 @@ def test_peary_proxy_clear_devices(mock_proxy: Callable) -> None:
 
 def test_peary_proxy_list_remote_devices(mock_proxy: Callable) -> None:
     assert mock_proxy().list_remote_devices() == b"list_devices"
+
+
+def test_peary_proxy_stats(mock_proxy: Callable) -> None:
+    proxy = mock_proxy()
+    assert not proxy.stats().snapshot()
@@ -0,0 +1,302 @@
+from __future__ import annotations
+
+import socket as socket_module
+from typing import TYPE_CHECKING
+
+import pytest
+
+from peary import peary_reconnect
+from peary.peary_client import PearyClient
+from peary.peary_mock import MockPearyDevice
+from peary.peary_protocol import PearyProtocol
+from peary.peary_reconnect import PearyReconnectingProtocol, ReconnectPolicy
+from peary.peary_transport import LoopbackConnection, LoopbackTransport
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from ..conftest import PearyServerModel  # noqa: TID252
+
+NO_DELAY = ReconnectPolicy(delay=0)
+
+
+class Server:
+    """Peary server model whose connections can be dropped and restarted."""
+
+    def __init__(self, model: PearyServerModel) -> None:
+        self.model = model
+
+    @property
+    def requests(self) -> list[str]:
+        return [payload.decode() for payload in self.model.received]
+
+    def restart(self, next_index: int = 0) -> None:
+        self.model.devices[:] = [MockPearyDevice("other") for _ in range(next_index)]
+        self.model.received.clear()
+        self.model.drop = True
+
+    def connect(self, policy: ReconnectPolicy = NO_DELAY) -> PearyClient:
+        return PearyClient(transport=LoopbackTransport(self.model), reconnect=policy)
+
+
+def test_peary_reconnect_policy_delays() -> None:
+    policy = ReconnectPolicy(attempts=6, delay=0.5, max_delay=3)
+    assert [*policy.delays()] == [0.5, 1, 2, 3, 3, 3]
+
+
+def test_peary_reconnect_restores_devices(
+    peary_model: Callable[..., PearyServerModel],
+) -> None:
+    server = Server(peary_model())
+    with server.connect() as proxy:
+        device = proxy.add_device("alpha")
+        server.restart(next_index=5)
+        assert device.protocol.request("device.name", "0") == b"alpha"
+        assert device.index == 0
+    assert server.requests == ["protocol_version", "add_device alpha", "device.name 5"]
+
+
+def test_peary_reconnect_request_many(
+    peary_model: Callable[..., PearyServerModel],
+) -> None:
+    server = Server(peary_model())
+    with server.connect() as proxy:
+        device = proxy.add_device("alpha")
+        server.restart(next_index=3)
+        responses = device.protocol.request_many(
+            [("device.get_voltage", "0", "VDD"), ("device.name", "0")]
+        )
+    assert responses == [b"0.0", b"alpha"]
+    assert server.requests[-2:] == ["device.get_voltage 3 VDD", "device.name 3"]
+
+
+def test_peary_reconnect_non_idempotent_not_resent(
+    peary_model: Callable[..., PearyServerModel],
+) -> None:
+    server = Server(peary_model())
+    with server.connect() as proxy:
+        device = proxy.add_device("alpha")
+        server.restart(next_index=2)
+        with pytest.raises(
+            PearyReconnectingProtocol.RequestInterruptedError,
+            match=r"Connection dropped during 'device\.power_on'",
+        ) as error:
+            device.power_on()
+        assert isinstance(error.value.__cause__, PearyProtocol.ResponseReceiveError)
+        server.restart()
+        with pytest.raises(
+            PearyReconnectingProtocol.RequestInterruptedError,
+            match=r"Connection dropped during 'device\.reset'",
+        ):
+            device.protocol.request_many(
+                [("device.get_voltage", "0", "VDD"), ("device.reset", "0")]
+            )
+        assert device.power_on() == b""
+    assert server.requests == [
+        "protocol_version",
+        "add_device alpha",
+        "device.power_on 0",
+    ]
+
+
+def test_peary_reconnect_idempotent_marked_by_caller(
+    peary_model: Callable[..., PearyServerModel],
+) -> None:
+    server = Server(peary_model())
+    policy = NO_DELAY._replace(
+        idempotent=peary_reconnect.IDEMPOTENT_COMMANDS | {"device.power_on"}
+    )
+    with server.connect(policy) as proxy:
+        device = proxy.add_device("alpha")
+        server.restart(next_index=5)
+        assert device.power_on() == b""
+    assert server.requests == [
+        "protocol_version",
+        "add_device alpha",
+        "device.power_on 5",
+    ]
+
+
+def test_peary_reconnect_replays_settings(
+    peary_model: Callable[..., PearyServerModel],
+) -> None:
+    server = Server(peary_model({"beta": {"threshold": 0}}))
+    with server.connect(NO_DELAY._replace(replay=True)) as proxy:
+        alpha = proxy.add_device("alpha")
+        beta = proxy.add_device("beta")
+        alpha.set_voltage("VDD", 1.2)
+        alpha.switch_on("VDD")
+        beta.set_register("threshold", 3)
+        alpha.set_voltage("VDD", 1.8)
+        alpha.switch_off("VDD")
+        alpha.power_on()
+        server.restart(next_index=7)
+        assert alpha.get_voltage("VDD") == 1.8
+    assert server.requests == [
+        "protocol_version",
+        "add_device alpha",
+        "add_device beta",
+        "device.set_register 8 threshold 3",
+        "device.set_voltage 7 VDD 1.8",
+        "device.switch_off 7 VDD",
+        "device.power_on 7",
+        "device.get_voltage 7 VDD",
+    ]
+
+
+def test_peary_reconnect_clear_devices(
+    peary_model: Callable[..., PearyServerModel],
+) -> None:
+    server = Server(peary_model())
+    with server.connect(NO_DELAY._replace(replay=True)) as proxy:
+        proxy.add_device("alpha").power_on()
+        proxy.clear_devices()
+        server.restart()
+        assert proxy.keep_alive() == b""
+    assert server.requests == ["protocol_version", ""]
+
+
+def test_peary_reconnect_index_collision(
+    peary_model: Callable[..., PearyServerModel],
+) -> None:
+    server = Server(peary_model())
+    with server.connect() as proxy:
+        alpha = proxy.add_device("alpha")
+        server.restart(next_index=1)
+        alpha.get_voltage("VDD")
+        # the server hands out index 0 again, the local index of alpha
+        restored = server.model.devices.pop()
+        server.model.devices.clear()
+        beta = proxy.add_device("beta")
+        server.model.devices.append(restored)
+        assert (alpha.index, beta.index) == (0, 1)
+        alpha.configure()
+        beta.configure()
+    assert server.requests[-2:] == ["device.configure 1", "device.configure 0"]
+
+
+def test_peary_reconnect_without_version_check(
+    peary_model: Callable[..., PearyServerModel],
+) -> None:
+    server = Server(peary_model())
+    protocol = PearyReconnectingProtocol(
+        LoopbackConnection(server.model),
+        reconnect=lambda: LoopbackConnection(server.model),
+        policy=NO_DELAY,
+        checks=PearyProtocol.Checks.CHECK_NONE,
+    )
+    server.restart()
+    assert protocol.request("") == b""
+    assert server.requests == [""]
+
+
+def test_peary_reconnect_lazy_version_check(
+    peary_model: Callable[..., PearyServerModel],
+) -> None:
+    server = Server(peary_model())
+    protocol = PearyReconnectingProtocol(
+        LoopbackConnection(server.model),
+        reconnect=lambda: LoopbackConnection(server.model),
+        policy=NO_DELAY,
+        checks=PearyProtocol.Checks.CHECK_VERSION_LAZY,
+    )
+    assert protocol.request_many([("add_device", "alpha")]) == [b"0"]
+    server.restart()
+    assert protocol.request("device.name", "0") == b"alpha"
+    assert protocol.remote_version == PearyProtocol.VERSION
+    assert server.requests == ["protocol_version", "add_device alpha", "device.name 0"]
+
+
+def test_peary_reconnect_lazy_version_check_single_request(
+    peary_model: Callable[..., PearyServerModel],
+) -> None:
+    server = Server(peary_model())
+    protocol = PearyReconnectingProtocol(
+        LoopbackConnection(server.model),
+        reconnect=lambda: LoopbackConnection(server.model),
+        checks=PearyProtocol.Checks.CHECK_VERSION_LAZY,
+    )
+    assert protocol.request("add_device", "alpha") == b"0"
+    assert server.requests == ["protocol_version", "add_device alpha"]
+
+
+def test_peary_reconnect_failed(peary_model: Callable[..., PearyServerModel]) -> None:
+    server = Server(peary_model())
+
+    def _refuse() -> LoopbackConnection:
+        raise ConnectionRefusedError
+
+    protocol = PearyReconnectingProtocol(
+        LoopbackConnection(server.model),
+        reconnect=_refuse,
+        policy=ReconnectPolicy(attempts=3, delay=0),
+    )
+    server.restart()
+    with pytest.raises(
+        PearyReconnectingProtocol.ReconnectError,
+        match="Failed to reconnect after 3 attempts",
+    ) as error:
+        protocol.request("alpha")
+    assert isinstance(error.value.__cause__, ConnectionRefusedError)
+
+
+def test_peary_reconnect_timeout_not_restored() -> None:
+    protocol = PearyReconnectingProtocol(
+        LoopbackConnection(lambda _: b""),
+        reconnect=lambda: pytest.fail("Reconnected after a timeout."),
+        timeout=0,
+        checks=PearyProtocol.Checks.CHECK_NONE,
+    )
+    with pytest.raises(socket_module.timeout):
+        protocol.request("alpha")
+    with pytest.raises(socket_module.timeout):
+        protocol.request_many([("alpha",)])
+
+
+def test_peary_reconnect_version_changed(
+    peary_model: Callable[..., PearyServerModel],
+) -> None:
+    server = Server(peary_model())
+    with server.connect() as proxy:
+        server.restart()
+        server.model.version = b"0"
+        with pytest.raises(
+            PearyProtocol.VersionError, match="Unsupported protocol version: b'0'"
+        ):
+            proxy.keep_alive()
+
+
+def test_peary_reconnect_device_rejected(
+    peary_model: Callable[..., PearyServerModel],
+) -> None:
+    server = Server(peary_model())
+    with server.connect() as proxy:
+        proxy.add_device("alpha")
+        server.restart()
+        server.model.rejected.add("add_device")
+        with pytest.raises(PearyProtocol.ResponseStatusError, match="add_device"):
+            proxy.keep_alive()
+
+
+def test_peary_reconnect_setting_rejected(
+    peary_model: Callable[..., PearyServerModel],
+) -> None:
+    server = Server(peary_model())
+    with server.connect(NO_DELAY._replace(replay=True)) as proxy:
+        proxy.add_device("alpha").power_on()
+        server.restart()
+        server.model.rejected.add("device.power_on")
+        with pytest.raises(PearyProtocol.ResponseStatusError, match="power_on"):
+            proxy.keep_alive()
+
+
+def test_peary_reconnect_status_error_not_restored(
+    peary_model: Callable[..., PearyServerModel],
+) -> None:
+    server = Server(peary_model())
+    server.model.rejected.add("fail")
+    with server.connect() as proxy:
+        with pytest.raises(PearyProtocol.ResponseStatusError):
+            proxy.add_device("alpha").protocol.request("fail")
+        assert proxy.add_device("beta").protocol.request_many([("fail",)])[0]
+    assert server.requests.count("protocol_version") == 1
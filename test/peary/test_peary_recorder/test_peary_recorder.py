@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from peary.peary_frame import DecodedBytes, FrameEncoder
+from peary.peary_protocol import PearyProtocol
+from peary.peary_recorder import STRUCT_RECORD, WireRecord, WireRecorder
+
+if TYPE_CHECKING:
+    import pathlib
+    import socket as socket_module
+    from collections.abc import Callable
+
+
+def _clock(*times: int) -> Callable[[], int]:
+    return iter(times).__next__
+
+
+def test_peary_recorder_invalid_capacity() -> None:
+    with pytest.raises(ValueError, match="Invalid wire recorder capacity: 0"):
+        WireRecorder(0)
+
+
+def test_peary_recorder_records() -> None:
+    recorder = WireRecorder(clock=_clock(100, 150, 400))
+    recorder.sent(
+        FrameEncoder.encode_many([(b"alpha", 1, 0), (b"", 2, 0)])
+        + FrameEncoder.encode(b"beta 1", 3, 0)
+    )
+    recorder.received([DecodedBytes(b"ok", 2, 0), DecodedBytes(b"", 1, 5)])
+    assert recorder.records() == [
+        WireRecord(50, WireRecorder.SENT, 1, 0, b"alpha"),
+        WireRecord(50, WireRecorder.SENT, 2, 0, b""),
+        WireRecord(50, WireRecorder.SENT, 3, 0, b"beta 1"),
+        WireRecord(300, WireRecorder.RECEIVED, 2, 0, b"ok"),
+        WireRecord(300, WireRecorder.RECEIVED, 1, 5, b""),
+    ]
+    assert len(recorder) == 5
+    assert recorder.size == 5 * STRUCT_RECORD.size + len(b"alphabeta 1ok")
+    assert recorder.capacity == 1 << 20
+
+
+def test_peary_recorder_ring_buffer() -> None:
+    recorder = WireRecorder(3 * (STRUCT_RECORD.size + 1))
+    for tag in range(5):
+        recorder.sent(FrameEncoder.encode(b"x", tag, 0))
+    assert [record.tag for record in recorder.records()] == [2, 3, 4]
+    recorder.received([DecodedBytes(b"x" * recorder.capacity, 4, 0)])
+    assert not recorder.records()
+    assert recorder.size == 0
+
+
+def test_peary_recorder_clear() -> None:
+    recorder = WireRecorder()
+    recorder.sent(FrameEncoder.encode(b"alpha", 1, 0))
+    recorder.clear()
+    assert len(recorder) == recorder.size == 0
+
+
+def test_peary_recorder_dump_and_load(tmp_path: pathlib.Path) -> None:
+    recorder = WireRecorder()
+    recorder.sent(FrameEncoder.encode(b"alpha", 1, 0))
+    recorder.received([DecodedBytes(b"beta", 1, 0)])
+    recorder.dump(tmp_path / "session.prec")
+    assert WireRecorder.load(tmp_path / "session.prec") == recorder.records()
+
+
+def test_peary_recorder_load_invalid(tmp_path: pathlib.Path) -> None:
+    path = tmp_path / "session.prec"
+    path.write_bytes(b"something else")
+    with pytest.raises(WireRecorder.FormatError, match="Not a wire recording"):
+        WireRecorder.load(path)
+
+    record = STRUCT_RECORD.pack(0, WireRecorder.SENT, 1, 0, 5) + b"alpha"
+    for truncated in (record[:-1], record[: STRUCT_RECORD.size - 1]):
+        path.write_bytes(WireRecorder.MAGIC + truncated)
+        with pytest.raises(WireRecorder.FormatError, match="Truncated wire recording"):
+            WireRecorder.load(path)
+
+
+def test_peary_recorder_dump_on_error(tmp_path: pathlib.Path) -> None:
+    recorder = WireRecorder()
+    recorder.sent(FrameEncoder.encode(b"alpha", 1, 0))
+    with recorder.dump_on_error(tmp_path / "ok.prec"):
+        pass
+    assert not (tmp_path / "ok.prec").exists()
+
+    with (
+        pytest.raises(PearyProtocol.ResponseStatusError),
+        recorder.dump_on_error(tmp_path / "failed.prec"),
+    ):
+        raise PearyProtocol.ResponseStatusError
+    assert WireRecorder.load(tmp_path / "failed.prec") == recorder.records()
+
+
+def test_peary_recorder_protocol(
+    mock_server: Callable[..., socket_module.socket],
+) -> None:
+    protocol = PearyProtocol(mock_server(), checks=PearyProtocol.Checks.CHECK_NONE)
+    recorder = WireRecorder()
+    protocol.record(recorder)
+    protocol.request("alpha", "1")
+    protocol.request_many([("beta",), ("gamma",)])
+    protocol.record(None)
+    protocol.request("delta")
+    records = recorder.records()
+    assert [(record.direction, record.payload) for record in records] == [
+        (WireRecorder.SENT, b"alpha 1"),
+        (WireRecorder.RECEIVED, b"alpha 1"),
+        (WireRecorder.SENT, b"beta"),
+        (WireRecorder.SENT, b"gamma"),
+        (WireRecorder.RECEIVED, b"beta"),
+        (WireRecorder.RECEIVED, b"gamma"),
+    ]
+    assert records[2].time == records[3].time
+    assert records[0].time <= records[1].time <= records[2].time
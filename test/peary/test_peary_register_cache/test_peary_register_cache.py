@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from peary.peary_register_cache import RegisterCache
+
+if TYPE_CHECKING:
+    from ..conftest import Clock  # noqa: TID252
+
+
+def test_peary_register_cache_defaults() -> None:
+    cache = RegisterCache()
+    assert cache.ttl is None
+    assert cache.volatile == frozenset()
+    assert (cache.hits, cache.misses, len(cache)) == (0, 0, 0)
+
+
+@pytest.mark.parametrize("ttl", [0, -1])
+def test_peary_register_cache_invalid_ttl(ttl: float) -> None:
+    with pytest.raises(ValueError, match=f"Invalid register cache ttl: {ttl}"):
+        RegisterCache(ttl)
+
+
+def test_peary_register_cache_lookup() -> None:
+    cache = RegisterCache()
+    assert cache.lookup(RegisterCache.REGISTER, "vref") is None
+    cache.store(RegisterCache.REGISTER, "vref", 12)
+    assert cache.lookup(RegisterCache.REGISTER, "vref") == 12
+    assert cache.lookup(RegisterCache.MEMORY, "vref") is None
+    assert (cache.hits, cache.misses, len(cache)) == (1, 2, 1)
+
+
+def test_peary_register_cache_peek(clock: Clock) -> None:
+    cache = RegisterCache(10, clock=clock)
+    assert cache.peek(RegisterCache.REGISTER, "vref") is None
+    cache.store(RegisterCache.REGISTER, "vref", 12)
+    assert cache.peek(RegisterCache.REGISTER, "vref") == 12
+    clock.now = 10.0
+    assert cache.peek(RegisterCache.REGISTER, "vref") is None
+    assert (cache.hits, cache.misses, len(cache)) == (0, 0, 0)
+
+
+def test_peary_register_cache_ttl(clock: Clock) -> None:
+    cache = RegisterCache(10, clock=clock)
+    cache.store(RegisterCache.MEMORY, "frame", 3)
+    clock.now = 9.9
+    assert cache.lookup(RegisterCache.MEMORY, "frame") == 3
+    clock.now = 10.0
+    assert cache.lookup(RegisterCache.MEMORY, "frame") is None
+    assert len(cache) == 0
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_peary_register_cache_volatile() -> None:
+    cache = RegisterCache(volatile=["status"])
+    cache.store(RegisterCache.REGISTER, "status", 1)
+    cache.store(RegisterCache.REGISTER, "vref", 12)
+    assert cache.lookup(RegisterCache.REGISTER, "status") is None
+    cache.set_volatile("vref")
+    assert cache.volatile == {"status", "vref"}
+    assert cache.lookup(RegisterCache.REGISTER, "vref") is None
+    cache.set_volatile("status", volatile=False)
+    cache.store(RegisterCache.REGISTER, "status", 1)
+    assert cache.lookup(RegisterCache.REGISTER, "status") == 1
+    assert cache.volatile == {"vref"}
+
+
+def test_peary_register_cache_invalidate() -> None:
+    cache = RegisterCache()
+    for kind in (RegisterCache.REGISTER, RegisterCache.MEMORY):
+        cache.store(kind, "vref", 12)
+        cache.store(kind, "ibias", 4)
+    cache.invalidate("vref")
+    assert len(cache) == 2
+    assert cache.lookup(RegisterCache.MEMORY, "ibias") == 4
+    cache.clear()
+    assert len(cache) == 0
+    assert (cache.hits, cache.misses) == (1, 0)
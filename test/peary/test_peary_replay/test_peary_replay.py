@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING
+
+import pytest
+
+from peary.peary_frame import FrameEncoder
+from peary.peary_protocol import PearyProtocol
+from peary.peary_recorder import WireRecord, WireRecorder
+from peary.peary_replay import PearyReplay, main
+
+if TYPE_CHECKING:
+    import pathlib
+    import socket as socket_module
+    from collections.abc import Callable, Iterable, Sequence
+
+    from peary.peary_frame import DecodedBytes
+
+SENT = WireRecorder.SENT
+RECEIVED = WireRecorder.RECEIVED
+
+
+def _handler(frame: DecodedBytes) -> bytes:
+    if frame.payload == b"fail":
+        return FrameEncoder.encode(b"", frame.tag, not PearyProtocol.STATUS_OK)
+    return FrameEncoder.encode(frame.payload.upper(), frame.tag, frame.status)
+
+
+def _record_session(mock_server: Callable[..., socket_module.socket]) -> WireRecorder:
+    protocol = PearyProtocol(
+        mock_server(_handler), checks=PearyProtocol.Checks.CHECK_NONE
+    )
+    recorder = WireRecorder()
+    protocol.record(recorder)
+    protocol.request("device.get_voltage", "0", "VDD")
+    protocol.request_many([("alpha",), ("fail",), ("beta", "1")])
+    return recorder
+
+
+class ReversingProtocol(PearyProtocol):
+    """Protocol returning the responses of a batch in reverse order."""
+
+    def request_many(
+        self,
+        requests: Iterable[Sequence[str]],
+        *,
+        buffer_size: int = 4096,
+        window: int = 256,
+    ) -> list[bytes | PearyProtocol.ResponseStatusError]:
+        return super().request_many(requests, buffer_size=buffer_size, window=window)[
+            ::-1
+        ]
+
+
+def test_peary_replay_max_speed(
+    mock_server: Callable[..., socket_module.socket],
+) -> None:
+    result = PearyReplay(_record_session(mock_server).records(), speed=None).run()
+    assert (result.requests, result.mismatches) == (4, 0)
+    snapshot = result.stats.snapshot()
+    assert [*snapshot] == ["device.get_voltage", "alpha", "fail", "beta"]
+    assert (snapshot["fail"].calls, snapshot["fail"].errors) == (1, 1)
+
+
+def test_peary_replay_mismatches(
+    mock_server: Callable[..., socket_module.socket],
+) -> None:
+    result = PearyReplay(
+        _record_session(mock_server).records(),
+        speed=None,
+        protocol_class=ReversingProtocol,
+    ).run()
+    assert (result.requests, result.mismatches) == (4, 2)
+
+
+def test_peary_replay_original_speed() -> None:
+    records = [
+        WireRecord(0, SENT, 1, 0, b"alpha"),
+        WireRecord(40_000_000, RECEIVED, 1, 0, b"ALPHA"),
+        WireRecord(60_000_000, SENT, 1, 0, b"beta"),
+        WireRecord(60_000_000, SENT, 2, 0, b"hang"),
+        WireRecord(80_000_000, RECEIVED, 1, 0, b"BETA"),
+        WireRecord(90_000_000, RECEIVED, 7, 0, b"unknown"),
+    ]
+    start = time.perf_counter()
+    result = PearyReplay(records).run()
+    assert time.perf_counter() - start >= 0.08
+    assert (result.requests, result.mismatches) == (2, 0)
+    assert result.stats.snapshot()["alpha"].wait.total >= 0.04
+
+    start = time.perf_counter()
+    PearyReplay(records, speed=4).run()
+    assert time.perf_counter() - start < 0.08
+
+
+def test_peary_replay_invalid_speed() -> None:
+    with pytest.raises(ValueError, match="Invalid replay speed: 0"):
+        PearyReplay([], speed=0)
+
+
+def test_peary_replay_main(
+    mock_server: Callable[..., socket_module.socket],
+    tmp_path: pathlib.Path,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    path = tmp_path / "session.prec"
+    _record_session(mock_server).dump(path)
+    assert main([str(path), "--speed", "2"]) == 0
+    assert main([str(path), "--max-speed"]) == 0
+    out = capsys.readouterr().out
+    assert out.startswith("4 requests in ")
+    assert "0 mismatches\ndevice.get_voltage: calls=1 errors=0" in out
@@ -0,0 +1,104 @@
+import pytest
+
+from peary.peary_stats import CommandStats, LatencyHistogram, ProtocolStats
+
+
+def test_peary_stats_histogram_empty() -> None:
+    histogram = LatencyHistogram()
+    assert histogram.count == 0
+    assert histogram.total == 0
+    assert histogram.mean == 0
+    assert histogram.max == 0
+    assert histogram.quantile(0.99) == 0
+    assert histogram.buckets == (0,) * LatencyHistogram.BUCKETS
+
+
+def test_peary_stats_histogram_record() -> None:
+    histogram = LatencyHistogram()
+    for ns in (500, 1_500, 3_000, 3_500, 100_000):
+        histogram.record(ns)
+    assert histogram.count == 5
+    assert histogram.total == pytest.approx(108_500e-9)
+    assert histogram.mean == pytest.approx(21_700e-9)
+    assert histogram.max == pytest.approx(100e-6)
+    assert histogram.buckets[:8] == (1, 1, 2, 0, 0, 0, 0, 1)
+
+
+def test_peary_stats_histogram_overflow_bucket() -> None:
+    histogram = LatencyHistogram()
+    histogram.record(10**13)
+    assert histogram.buckets[-1] == 1
+
+
+def test_peary_stats_histogram_quantile() -> None:
+    histogram = LatencyHistogram()
+    for _ in range(99):
+        histogram.record(3_000)
+    histogram.record(70_000)
+    assert histogram.quantile(0.5) == pytest.approx(4e-6)
+    assert histogram.quantile(0.9) == pytest.approx(4e-6)
+    assert histogram.quantile(1) == pytest.approx(70_000e-9)
+
+    clamped = LatencyHistogram()
+    clamped.record(3_000)
+    assert clamped.quantile(0.5) == pytest.approx(3_000e-9)
+
+
+def test_peary_stats_histogram_str() -> None:
+    histogram = LatencyHistogram()
+    histogram.record(2_000)
+    assert str(histogram) == "n=1 mean=2.0us p50<=2us p99<=2us max=2.0us"
+
+
+def test_peary_stats_command_str() -> None:
+    stats = CommandStats()
+    assert str(stats) == (
+        "calls=0 errors=0 out=0B in=0B\n"
+        "  send: n=0 mean=0.0us p50<=0us p99<=0us max=0.0us\n"
+        "  wait: n=0 mean=0.0us p50<=0us p99<=0us max=0.0us"
+    )
+
+
+def test_peary_stats_protocol_record() -> None:
+    stats = ProtocolStats()
+    stats.decoded(300)
+    stats.record("device.get_voltage", 30, 15, 1_000, 50_000)
+    stats.record("device.get_voltage", 30, 15, 2_000, 60_000)
+    stats.failed("device.get_voltage", answered=True)
+    stats.failed("add_device", answered=False)
+    snapshot = stats.snapshot()
+    assert [*snapshot] == ["device.get_voltage", "add_device"]
+    voltage = snapshot["device.get_voltage"]
+    assert (voltage.calls, voltage.errors) == (2, 1)
+    assert (voltage.bytes_sent, voltage.bytes_received) == (60, 30)
+    assert voltage.send.total == pytest.approx(3e-6)
+    assert voltage.wait.total == pytest.approx(110e-6)
+    assert (snapshot["add_device"].calls, snapshot["add_device"].errors) == (1, 1)
+    assert stats.decode.count == 1
+    assert stats.decode.total == pytest.approx(0.3e-6)
+
+
+def test_peary_stats_protocol_snapshot_is_copy() -> None:
+    stats = ProtocolStats()
+    stats.record("alpha", 1, 1, 1, 1)
+    snapshot = stats.snapshot()
+    stats.record("alpha", 1, 1, 1, 1)
+    assert snapshot["alpha"].calls == 1
+    assert snapshot["alpha"].wait.count == 1
+    assert stats.snapshot()["alpha"].calls == 2
+
+
+def test_peary_stats_protocol_reset() -> None:
+    stats = ProtocolStats()
+    stats.record("alpha", 1, 1, 1, 1)
+    stats.decoded(100)
+    assert stats.reset()["alpha"].calls == 1
+    assert not stats.snapshot()
+    assert stats.decode.count == 0
+
+
+def test_peary_stats_protocol_str() -> None:
+    stats = ProtocolStats()
+    stats.record("alpha", 10, 12, 1_000, 2_000)
+    assert str(stats).startswith("alpha: calls=1 errors=0 out=10B in=12B\n  send: n=1")
+    assert str(stats).endswith("\ndecode: n=0 mean=0.0us p50<=0us p99<=0us max=0.0us")
@@ -0,0 +1,64 @@
+import pytest
+
+from peary.peary_protocol import PearyProtocol
+from peary.peary_tags import TagAllocator
+
+
+def test_peary_tags_max_tag_fits_header() -> None:
+    PearyProtocol.STRUCT_HEADER.pack(TagAllocator.MAX_TAG, 0)
+
+
+def test_peary_tags_acquire_sequence() -> None:
+    tags = TagAllocator()
+    assert [tags.acquire() for _ in range(3)] == [1, 2, 3]
+    assert len(tags) == 3
+    assert 2 in tags
+    assert 4 not in tags
+
+
+def test_peary_tags_release() -> None:
+    tags = TagAllocator()
+    tag = tags.acquire()
+    tags.release(tag)
+    tags.release(tag)
+    assert tag not in tags
+    assert not tags
+
+
+def test_peary_tags_wraparound_skips_zero() -> None:
+    tags = TagAllocator()
+    for _ in range(TagAllocator.MAX_TAG):
+        tags.release(tags.acquire())
+    assert tags.acquire() == 1
+
+
+def test_peary_tags_wraparound_skips_in_flight() -> None:
+    tags = TagAllocator()
+    in_flight = [tags.acquire() for _ in range(3)]
+    for _ in range(TagAllocator.MAX_TAG - len(in_flight)):
+        tags.release(tags.acquire())
+    tags.release(in_flight[1])
+    assert tags.acquire() == in_flight[1]
+    assert tags.acquire() == in_flight[-1] + 1
+
+
+def test_peary_tags_exhausted() -> None:
+    tags = TagAllocator()
+    for _ in range(TagAllocator.MAX_TAG):
+        tags.acquire()
+    with pytest.raises(
+        TagAllocator.TagsExhaustedError, match="All 65535 tags are in flight"
+    ):
+        tags.acquire()
+    tags.release(100)
+    assert tags.acquire() == 100
+
+
+def test_peary_tags_stress_millions_of_allocations() -> None:
+    tags = TagAllocator()
+    in_flight = [tags.acquire() for _ in range(64)]
+    for ii in range(1_000_000):
+        tags.release(in_flight[ii % 64])
+        in_flight[ii % 64] = tags.acquire()
+        assert 0 < in_flight[ii % 64] <= TagAllocator.MAX_TAG
+    assert len(tags) == len(set(in_flight)) == 64
@@ -0,0 +1,60 @@
+import pytest
+
+from peary.peary_timeout import AdaptiveTimeout, RttEstimator
+
+
+def test_peary_timeout_estimator_without_samples() -> None:
+    estimator = RttEstimator()
+    assert estimator.srtt is None
+    assert estimator.rttvar == 0
+    assert estimator.samples == 0
+
+
+def test_peary_timeout_estimator_first_sample() -> None:
+    estimator = RttEstimator()
+    estimator.update(0.2)
+    assert estimator.srtt == 0.2
+    assert estimator.rttvar == 0.1
+    assert estimator.samples == 1
+
+
+def test_peary_timeout_estimator_smoothing() -> None:
+    estimator = RttEstimator()
+    estimator.update(0.8)
+    estimator.update(0.4)
+    assert estimator.srtt == pytest.approx(0.8 + (0.4 - 0.8) / 8)
+    assert estimator.rttvar == pytest.approx(0.4 + (0.4 - 0.4) / 4)
+    estimator.update(0.75)
+    assert estimator.srtt == pytest.approx(0.75)
+    assert estimator.rttvar == pytest.approx(0.4 + (0.0 - 0.4) / 4)
+    assert estimator.samples == 3
+
+
+def test_peary_timeout_adaptive_initial() -> None:
+    timeout = AdaptiveTimeout(2)
+    assert timeout.timeout() == 2
+    assert timeout.timeout(["device.get_voltage"]) == 2
+
+
+def test_peary_timeout_adaptive_estimate() -> None:
+    timeout = AdaptiveTimeout()
+    timeout.estimator.update(0.02)
+    assert timeout.timeout() == pytest.approx(0.02 + 4 * 0.01)
+
+
+def test_peary_timeout_adaptive_bounds() -> None:
+    timeout = AdaptiveTimeout(minimum=0.5, maximum=2)
+    timeout.estimator.update(0.001)
+    assert timeout.timeout() == 0.5
+    timeout = AdaptiveTimeout(minimum=0.5, maximum=2)
+    timeout.estimator.update(5)
+    assert timeout.timeout() == 2
+
+
+def test_peary_timeout_adaptive_overrides() -> None:
+    timeout = AdaptiveTimeout(overrides={"device.configure": 30, "fast": 0.01})
+    timeout.estimator.update(0.1)
+    assert timeout.timeout(["device.configure"]) == 30
+    assert timeout.timeout(["fast"]) == 0.01
+    assert timeout.timeout(["fast", "keep_alive"]) == pytest.approx(0.3)
+    assert timeout.timeout(["keep_alive", "device.configure"]) == 30
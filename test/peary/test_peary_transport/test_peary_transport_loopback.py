@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import socket as socket_module
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING
+
+import pytest
+
+from peary.peary_client import PearyClient
+from peary.peary_multiplex_protocol import PearyMultiplexProtocol
+from peary.peary_protocol import PearyProtocol
+from peary.peary_transport import LoopbackConnection, LoopbackTransport
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from ..conftest import PearyServerModel  # noqa: TID252
+
+
+def test_peary_transport_loopback_client(
+    peary_model: Callable[..., PearyServerModel],
+) -> None:
+    model = peary_model()
+    transport = LoopbackTransport(model)
+    assert str(transport) == "loopback"
+    assert transport.key == LoopbackTransport(model).key
+    assert transport.key != LoopbackTransport(print).key
+    with PearyClient(transport=transport) as proxy:
+        assert proxy.add_device("alpha").index == 0
+        assert proxy.keep_alive() == b""
+
+
+def test_peary_transport_loopback_request_many(
+    peary_model: Callable[..., PearyServerModel],
+) -> None:
+    protocol = PearyProtocol(LoopbackConnection(peary_model()))
+    requests = [(str(ii),) for ii in range(1000)]
+    assert protocol.request_many(requests) == [str(ii).encode() for ii in range(1000)]
+
+
+def test_peary_transport_loopback_multiplex_threads(
+    peary_model: Callable[..., PearyServerModel],
+) -> None:
+    protocol = PearyMultiplexProtocol(LoopbackConnection(peary_model()))
+    with ThreadPoolExecutor(4) as executor:
+        results = executor.map(
+            lambda name: [protocol.request(name, str(ii)) for ii in range(100)],
+            ["a", "b", "c", "d"],
+        )
+        for name, responses in zip("abcd", results):
+            assert responses == [f"{name} {ii}".encode() for ii in range(100)]
+
+
+def test_peary_transport_loopback_timeout() -> None:
+    connection = LoopbackConnection(lambda _: b"")
+    protocol = PearyProtocol(
+        connection, timeout=0, checks=PearyProtocol.Checks.CHECK_NONE
+    )
+    with pytest.raises(socket_module.timeout):
+        protocol.request("hang")
+
+
+def test_peary_transport_loopback_closed_by_handler(
+    peary_model: Callable[..., PearyServerModel],
+) -> None:
+    model = peary_model()
+    protocol = PearyProtocol(LoopbackConnection(model))
+    model.drop = True
+    with pytest.raises(
+        PearyProtocol.ResponseReceiveError, match="Failed to receive response"
+    ):
+        protocol.request("close")
+    with pytest.raises(BrokenPipeError, match="Loopback connection closed"):
+        protocol.request("alpha")
+
+
+def test_peary_transport_loopback_shutdown_wakes_receiver(
+    peary_model: Callable[..., PearyServerModel],
+) -> None:
+    connection = LoopbackConnection(peary_model())
+    connection.settimeout(None)
+    received: list[int] = []
+    thread = threading.Thread(
+        target=lambda: received.append(connection.recv_into(bytearray(4)))
+    )
+    thread.start()
+    connection.close()
+    thread.join()
+    assert received == [0]
+
+
+def test_peary_transport_loopback_recv_nbytes(
+    peary_model: Callable[..., PearyServerModel],
+) -> None:
+    connection = LoopbackConnection(peary_model())
+    connection.send(PearyProtocol.encode(b"alpha", 1, 0))
+    buffer = bytearray(16)
+    assert connection.recv_into(buffer, 4) == 4
+    assert connection.recv_into(buffer) == 9
+    assert buffer[:9] == PearyProtocol.encode(b"alpha", 1, 0)[4:]
+
+
+def test_peary_transport_loopback_reopen(
+    peary_model: Callable[..., PearyServerModel],
+) -> None:
+    transport = LoopbackTransport(peary_model())
+    closed = transport.socket
+    closed.close()
+    transport.reopen()
+    assert transport.socket is not closed
+    assert PearyProtocol(transport.socket).request("alpha") == b"alpha"
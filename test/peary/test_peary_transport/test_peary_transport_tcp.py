@@ -0,0 +1,44 @@
+import socket as socket_module
+
+from peary.peary_transport import TcpTransport
+from peary.peary_transport_options import LOW_LATENCY
+
+
+def test_peary_transport_tcp_socket() -> None:
+    transport = TcpTransport("localhost")
+    assert transport.socket.family == socket_module.AF_INET
+    assert transport.socket.type == socket_module.SOCK_STREAM
+    assert str(transport) == "host localhost using port 12345"
+    assert transport.key == ("tcp", "localhost", 12345)
+
+
+def test_peary_transport_tcp_connect() -> None:
+    with socket_module.create_server(("127.0.0.1", 0)) as server:
+        transport = TcpTransport("127.0.0.1", server.getsockname()[1])
+        with transport.socket:
+            transport.connect()
+            assert not transport.socket.getsockopt(
+                socket_module.IPPROTO_TCP, socket_module.TCP_NODELAY
+            )
+
+
+def test_peary_transport_tcp_connect_low_latency() -> None:
+    with socket_module.create_server(("127.0.0.1", 0)) as server:
+        transport = TcpTransport(
+            "127.0.0.1", server.getsockname()[1], transport_options=LOW_LATENCY
+        )
+        with transport.socket:
+            transport.connect()
+            assert transport.socket.getsockopt(
+                socket_module.IPPROTO_TCP, socket_module.TCP_NODELAY
+            )
+
+
+def test_peary_transport_tcp_reopen() -> None:
+    transport = TcpTransport("localhost")
+    closed = transport.socket
+    closed.close()
+    transport.reopen()
+    with transport.socket:
+        assert transport.socket is not closed
+        assert transport.socket.family == socket_module.AF_INET
@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import socket as socket_module
+from typing import TYPE_CHECKING
+
+import pytest
+
+from peary.peary_client import PearyClient
+from peary.peary_mock_server import MockPearyServer
+from peary.peary_transport import UnixTransport
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def test_peary_transport_unix_socket() -> None:
+    transport = UnixTransport("/run/peary.sock")
+    assert transport.socket.family == socket_module.AF_UNIX
+    assert transport.socket.type == socket_module.SOCK_STREAM
+    assert str(transport) == "unix socket /run/peary.sock"
+    assert transport.key == ("unix", "/run/peary.sock")
+
+
+def test_peary_transport_unix_client(tmp_path: Path) -> None:
+    path = str(tmp_path / "peary.sock")
+    with (
+        MockPearyServer(path=path),
+        PearyClient(transport=UnixTransport(path)) as proxy,
+    ):
+        assert proxy.add_device("alpha").index == 0
+        assert proxy.keep_alive() == b""
+
+
+def test_peary_transport_unix_connect_error(tmp_path: Path) -> None:
+    path = str(tmp_path / "missing.sock")
+    with (
+        pytest.raises(
+            PearyClient.PearySockerError,
+            match=f"Unable to connect to unix socket {path}",
+        ),
+        PearyClient(transport=UnixTransport(path)),
+    ):
+        pass  # pragma: no cover
+
+
+def test_peary_transport_unix_reopen() -> None:
+    transport = UnixTransport("/run/peary.sock")
+    closed = transport.socket
+    closed.close()
+    transport.reopen()
+    with transport.socket:
+        assert transport.socket is not closed
+        assert transport.socket.family == socket_module.AF_UNIX
@@ -0,0 +1,34 @@
+import socket as socket_module
+
+from peary.peary_transport_options import (
+    BULK_THROUGHPUT,
+    LONG_LIVED,
+    LOW_LATENCY,
+    TransportOptions,
+)
+
+
+def test_peary_transport_options_default() -> None:
+    assert TransportOptions() == (False, False, None, None)
+
+
+def test_peary_transport_options_apply_low_latency() -> None:
+    with socket_module.socket(socket_module.AF_INET, socket_module.SOCK_STREAM) as sock:
+        LOW_LATENCY.apply(sock)
+        assert sock.getsockopt(socket_module.IPPROTO_TCP, socket_module.TCP_NODELAY)
+        assert not sock.getsockopt(socket_module.SOL_SOCKET, socket_module.SO_KEEPALIVE)
+
+
+def test_peary_transport_options_apply_long_lived() -> None:
+    with socket_module.socket(socket_module.AF_INET, socket_module.SOCK_STREAM) as sock:
+        LONG_LIVED.apply(sock)
+        assert sock.getsockopt(socket_module.SOL_SOCKET, socket_module.SO_KEEPALIVE)
+
+
+def test_peary_transport_options_apply_bulk_throughput() -> None:
+    with socket_module.socket(socket_module.AF_INET, socket_module.SOCK_STREAM) as sock:
+        default = sock.getsockopt(socket_module.SOL_SOCKET, socket_module.SO_SNDBUF)
+        BULK_THROUGHPUT.apply(sock)
+        assert (
+            sock.getsockopt(socket_module.SOL_SOCKET, socket_module.SO_SNDBUF) > default
+        )